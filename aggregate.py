@@ -0,0 +1,203 @@
+"""
+Roster-wide aggregate statistics in one streaming pass.
+
+RosterStats keeps, per class, the count and for every stat its sum, min,
+max and a value -> count histogram. Stats are integers with few distinct
+values, so the histograms stay small and give exact percentiles. Two
+RosterStats merge by adding their parts, which lets shards be aggregated
+in parallel and reduced afterwards (see aggregate_files).
+
+add_table is the vectorized path over a CharacterTable's columns; it uses
+numpy when installed and plain column loops otherwise.
+"""
+
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from character import INT_FIELDS
+
+ALL = "*"   # summary key covering every class
+
+
+class _ClassStats:
+    __slots__ = ("count", "sums", "mins", "maxs", "histograms")
+
+    def __init__(self):
+        self.count = 0
+        self.sums = dict.fromkeys(INT_FIELDS, 0)
+        self.mins = dict.fromkeys(INT_FIELDS)
+        self.maxs = dict.fromkeys(INT_FIELDS)
+        self.histograms = {field: Counter() for field in INT_FIELDS}
+
+    def add_counts(self, field, values_and_counts):
+        """Adds a {value: count} histogram for one stat."""
+        histogram = self.histograms[field]
+        low = self.mins[field]
+        high = self.maxs[field]
+        total = 0
+        for value, count in values_and_counts.items():
+            histogram[value] += count
+            total += value * count
+            if low is None or value < low:
+                low = value
+            if high is None or value > high:
+                high = value
+        self.sums[field] += total
+        self.mins[field] = low
+        self.maxs[field] = high
+
+    def merge(self, other):
+        self.count += other.count
+        for field in INT_FIELDS:
+            self.add_counts(field, other.histograms[field])
+
+
+def percentile_from_histogram(histogram, fraction):
+    """Nearest-rank percentile of the values a {value: count} histogram holds."""
+    total = sum(histogram.values())
+    if total == 0:
+        return None
+    rank = max(1, math.ceil(fraction * total))
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen >= rank:
+            return value
+    return max(histogram)
+
+
+#RosterStats class
+class RosterStats:
+    """Mergeable per-class aggregates over a roster."""
+
+    def __init__(self):
+        self.classes = {}
+
+    def _class(self, class_name):
+        stats = self.classes.get(class_name)
+        if stats is None:
+            stats = self.classes[class_name] = _ClassStats()
+        return stats
+
+    def add(self, character):
+        stats = self._class(character["class"])
+        stats.count += 1
+        for field in INT_FIELDS:
+            value = character[field]
+            stats.histograms[field][value] += 1
+            stats.sums[field] += value
+            if stats.mins[field] is None or value < stats.mins[field]:
+                stats.mins[field] = value
+            if stats.maxs[field] is None or value > stats.maxs[field]:
+                stats.maxs[field] = value
+
+    def add_many(self, characters):
+        """Adds every character from an iterable. Returns self."""
+        for character in characters:
+            self.add(character)
+        return self
+
+    def add_table(self, table):
+        """Adds every row of a CharacterTable, working column by column."""
+        from project1_starter import _load_numpy
+        np = _load_numpy()
+        if np is not None:
+            codes = np.frombuffer(table.class_codes, dtype=np.uint8)
+            columns = {f: np.frombuffer(table.columns[f], dtype=np.int32) for f in INT_FIELDS}
+            for code, class_name in enumerate(table.classes):
+                mask = codes == code
+                count = int(mask.sum())
+                if not count:
+                    continue
+                stats = self._class(class_name)
+                stats.count += count
+                for field, column in columns.items():
+                    values, counts = np.unique(column[mask], return_counts=True)
+                    stats.add_counts(field, dict(zip(values.tolist(), counts.tolist())))
+            return self
+
+        codes = table.class_codes
+        sizes = Counter(codes)
+        for code, class_name in enumerate(table.classes):
+            if sizes[code]:
+                self._class(class_name).count += sizes[code]
+        for field in INT_FIELDS:
+            counters = [Counter() for _ in table.classes]
+            for code, value in zip(codes, table.columns[field]):
+                counters[code][value] += 1
+            for code, class_name in enumerate(table.classes):
+                if counters[code]:
+                    self._class(class_name).add_counts(field, counters[code])
+        return self
+
+    def merge(self, other):
+        """Adds another RosterStats into this one. Returns self."""
+        for class_name, stats in other.classes.items():
+            self._class(class_name).merge(stats)
+        return self
+
+    def __add__(self, other):
+        return RosterStats().merge(self).merge(other)
+
+    def overall(self):
+        """Returns the aggregates across every class as one _ClassStats."""
+        total = _ClassStats()
+        for stats in self.classes.values():
+            total.merge(stats)
+        return total
+
+    def summary(self, percentiles=(0.5, 0.9, 0.99)):
+        """
+        Returns {class: {"count": n, "<stat>": {"sum", "mean", "min", "max",
+        "p50", ...}, "level_histogram": {level: count}}} with an extra
+        ALL ("*") entry for the whole roster.
+        """
+        result = {}
+        groups = dict(sorted(self.classes.items()))
+        groups[ALL] = self.overall()
+        for class_name, stats in groups.items():
+            entry = {"count": stats.count}
+            for field in INT_FIELDS:
+                field_summary = {
+                    "sum": stats.sums[field],
+                    "mean": stats.sums[field] / stats.count if stats.count else None,
+                    "min": stats.mins[field],
+                    "max": stats.maxs[field],
+                }
+                for fraction in percentiles:
+                    key = f"p{fraction * 100:g}"
+                    field_summary[key] = percentile_from_histogram(stats.histograms[field], fraction)
+                entry[field] = field_summary
+            entry["level_histogram"] = dict(sorted(stats.histograms["level"].items()))
+            result[class_name] = entry
+        return result
+
+
+#aggregate function
+def aggregate(characters):
+    """Returns a RosterStats over an iterable of characters."""
+    return RosterStats().add_many(characters)
+
+
+def _aggregate_file(path):
+    from roster import iter_characters
+    return aggregate(iter_characters(path))
+
+
+#aggregate_files function
+def aggregate_files(paths, workers=None):
+    """
+    Aggregates roster or save files in parallel, one file per task, and
+    merges the partial results. workers=1 runs in this process.
+    """
+    total = RosterStats()
+    if workers is not None and workers <= 1:
+        for path in paths:
+            total.merge(_aggregate_file(path))
+        return total
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for partial in pool.map(_aggregate_file, paths):
+            total.merge(partial)
+    return total
@@ -0,0 +1,112 @@
+"""
+Compressed roster archives.
+
+An archive is a roster file (see roster.py) run through a stdlib codec,
+picked from the file suffix:
+
+    .gz    gzip   fast, good ratio on the repetitive labels
+    .bz2   bz2    smaller, much slower to write
+    .xz    lzma   smallest, slowest
+
+Writing streams characters into the compressor in batches; reading
+decompresses CHUNK_SIZE bytes at a time and yields each record as soon
+as it ends, using the same record boundaries as roster.iter_records, so
+memory use does not depend on the archive size. compress_file/decompress_file convert existing rosters or
+save files without parsing them.
+
+benchmarks/bench_archive.py reports the size and speed of each codec
+against plain text.
+"""
+
+import importlib
+import io
+import shutil
+
+from project1_starter import format_character
+from roster import WRITE_BATCH, iter_stream_records
+
+CODECS = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+# bytes of decompressed data read per step
+CHUNK_SIZE = 1 << 20
+
+
+def _codec(path, codec=None):
+    """Returns the compression module for codec or for path's suffix."""
+    if codec is None:
+        for suffix, name in CODECS.items():
+            if path.endswith(suffix):
+                codec = name
+                break
+        else:
+            raise ValueError(f"{path}: unknown archive suffix "
+                             f"(expected one of {', '.join(CODECS)})")
+    if codec not in CODECS.values():
+        raise ValueError(f"unknown codec {codec!r}")
+    # import only the codec in use; bz2 and lzma are not needed otherwise
+    return importlib.import_module(codec)
+
+
+def _level_kwargs(module, level):
+    if level is None:
+        return {}
+    return {"preset" if module.__name__ == "lzma" else "compresslevel": level}
+
+
+def is_archive(path):
+    return any(path.endswith(suffix) for suffix in CODECS)
+
+
+#write_archive function
+def write_archive(path, characters, codec=None, level=None, batch_size=WRITE_BATCH):
+    """
+    Writes characters to a compressed archive, replacing it if it exists.
+    codec and level default to the suffix's codec and its default level.
+    Returns the number of characters written.
+    """
+    module = _codec(path, codec)
+    kwargs = _level_kwargs(module, level)
+    count = 0
+    with module.open(path, "wb", **kwargs) as file:
+        chunk = []
+        for character in characters:
+            chunk.append(format_character(character))
+            if len(chunk) >= batch_size:
+                file.write(("\n".join(chunk) + "\n").encode("utf-8"))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            file.write(("\n".join(chunk) + "\n").encode("utf-8"))
+            count += len(chunk)
+    return count
+
+
+#iter_archive function
+def iter_archive(path, codec=None, factory=None, chunk_size=CHUNK_SIZE):
+    """
+    Yields the characters in an archive one at a time, decompressing
+    chunk_size bytes at a time.
+    Raises FileNotFoundError if path does not exist.
+    """
+    module = _codec(path, codec)
+    with module.open(path, "rb") as compressed:
+        # same record boundaries as roster.iter_records, over decompressed lines
+        lines = io.BufferedReader(compressed, chunk_size)
+        for _, character in iter_stream_records(lines):
+            yield character if factory is None else factory(character)
+
+
+#compress_file function
+def compress_file(source, dest, codec=None, level=None):
+    """Compresses a roster or save file into an archive without parsing it."""
+    module = _codec(dest, codec)
+    kwargs = _level_kwargs(module, level)
+    with open(source, "rb") as src, module.open(dest, "wb", **kwargs) as out:
+        shutil.copyfileobj(src, out, CHUNK_SIZE)
+
+
+#decompress_file function
+def decompress_file(source, dest, codec=None):
+    """Expands an archive back into a plain roster file."""
+    module = _codec(source, codec)
+    with module.open(source, "rb") as src, open(dest, "wb") as out:
+        shutil.copyfileobj(src, out, CHUNK_SIZE)
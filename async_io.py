@@ -0,0 +1,106 @@
+"""
+Async wrappers around save_character and load_character.
+
+The blocking file work runs on a shared thread pool whose size is the cap
+on files open at once (MAX_OPEN_FILES), so an event loop never waits on
+open/write. The functions delegate to save_character/load_character, so
+the file format and return values are exactly the same:
+async_save_character gives True/False and async_load_character gives a
+character dictionary or None.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from character import FIELDS
+from project1_starter import load_character, save_character
+
+MAX_OPEN_FILES = 32
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+#get_executor function
+def get_executor():
+    """Returns the shared I/O thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_OPEN_FILES,
+                                               thread_name_prefix="character-io")
+    return _executor
+
+
+#set_max_open_files function
+def set_max_open_files(limit):
+    """Changes the open file cap. Work already queued finishes first."""
+    global _executor, MAX_OPEN_FILES
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    with _executor_lock:
+        old = _executor
+        MAX_OPEN_FILES = limit
+        _executor = None
+    if old is not None:
+        old.shutdown(wait=True)
+
+
+def _snapshot(character):
+    # the caller may keep changing the character while the write is queued
+    return {key: character[key] for key in FIELDS}
+
+
+#async_save_character function
+async def async_save_character(character, filename):
+    """Async save_character. Returns True if saved, False otherwise."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), save_character,
+                                      _snapshot(character), filename)
+
+
+#async_load_character function
+async def async_load_character(filename):
+    """Async load_character. Returns the character, or None if missing."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), load_character, filename)
+
+
+async def _run_bounded(func, jobs, concurrency):
+    """
+    Runs func(*job) for every job with at most concurrency in flight.
+    Only concurrency coroutines exist at once, however many jobs there are.
+    Returns the results in job order.
+    """
+    results = []
+    jobs = enumerate(jobs)
+
+    async def worker():
+        for index, job in jobs:
+            result = await func(*job)
+            if index >= len(results):
+                results.extend([None] * (index + 1 - len(results)))
+            results[index] = result
+
+    await asyncio.gather(*(worker() for _ in range(concurrency or MAX_OPEN_FILES)))
+    return results
+
+
+#async_save_many function
+async def async_save_many(characters_and_filenames, concurrency=None):
+    """
+    Saves (character, filename) pairs concurrently.
+    Returns a list of True/False, one per pair, in the same order.
+    """
+    return await _run_bounded(async_save_character, characters_and_filenames, concurrency)
+
+
+#async_load_many function
+async def async_load_many(filenames, concurrency=None):
+    """
+    Loads files concurrently.
+    Returns a list of characters (None for missing files) in the same order.
+    """
+    return await _run_bounded(async_load_character, ((f,) for f in filenames), concurrency)
@@ -0,0 +1,66 @@
+"""
+Benchmark: compressed roster archives against a plain text roster.
+
+Reports file size, compression ratio and write/read throughput for plain
+text and every stdlib codec in archive.CODECS. Reading goes through the
+streaming reader, so the numbers include parsing.
+
+Run from the repo root:
+    python benchmarks/bench_archive.py
+    python benchmarks/bench_archive.py --size 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from archive import CODECS, iter_archive, write_archive
+from generator import iter_generated
+from roster import append_characters, iter_characters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    n = args.size
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "roster.txt")
+        start = time.perf_counter()
+        append_characters(plain, iter_generated(n, args.seed))
+        write_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        count = sum(1 for _ in iter_characters(plain))
+        read_seconds = time.perf_counter() - start
+        assert count == n
+        plain_size = os.path.getsize(plain)
+        rows = [("plain", plain_size, write_seconds, read_seconds)]
+
+        for suffix in CODECS:
+            path = os.path.join(tmp, "roster.txt" + suffix)
+            start = time.perf_counter()
+            write_archive(path, iter_generated(n, args.seed))
+            write_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            count = sum(1 for _ in iter_archive(path))
+            read_seconds = time.perf_counter() - start
+            assert count == n
+            rows.append((suffix, os.path.getsize(path), write_seconds, read_seconds))
+
+    mb = plain_size / 1e6
+    print(f"{n:,} characters, {plain_size:,} bytes of roster text")
+    print(f"{'format':<7} {'bytes':>12} {'ratio':>7} {'write MB/s':>11} {'read MB/s':>10} "
+          f"{'read chars/s':>13}")
+    for name, size, write_seconds, read_seconds in rows:
+        print(f"{name:<7} {size:>12,} {plain_size / size:>6.1f}x {mb / write_seconds:>11.1f} "
+              f"{mb / read_seconds:>10.1f} {n / read_seconds:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: scalar create_character/calculate_stats vs the batch API.
+
+Run from the repo root:
+    python benchmarks/bench_batch.py
+    python benchmarks/bench_batch.py --sizes 100000 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project1_starter import (
+    calculate_stats,
+    calculate_stats_batch,
+    create_character,
+    create_characters,
+)
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+
+def timed(func, *args):
+    """Returns (seconds, result) for one call of func."""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def scalar_stats(classes, levels):
+    return [calculate_stats(c, lv) for c, lv in zip(classes, levels)]
+
+
+def scalar_create(names, classes):
+    return [create_character(n, c) for n, c in zip(names, classes)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        classes = [CLASSES[i % 4] for i in range(n)]
+        levels = [1 + i % 100 for i in range(n)]
+        names = [f"Hero{i}" for i in range(n)]
+
+        t_scalar, expected = timed(scalar_stats, classes, levels)
+        t_batch, columns = timed(calculate_stats_batch, classes, levels, False)
+        assert list(zip(*columns)) == expected, "batch stats differ from scalar"
+        print(f"calculate_stats      n={n:>8}  scalar {n / t_scalar:>12,.0f}/s  "
+              f"batch {n / t_batch:>12,.0f}/s  x{t_scalar / t_batch:.2f}")
+
+        try:
+            t_np, columns = timed(calculate_stats_batch, classes, levels, True)
+        except ImportError:
+            print("calculate_stats      numpy not installed, skipping numpy run")
+        else:
+            assert list(zip(*columns)) == expected, "numpy stats differ from scalar"
+            print(f"calculate_stats      n={n:>8}  numpy  {n / t_np:>12,.0f}/s  "
+                  f"x{t_scalar / t_np:.2f}")
+
+        t_scalar, expected = timed(scalar_create, names, classes)
+        t_batch, created = timed(create_characters, names, classes)
+        assert created == expected, "batch characters differ from scalar"
+        print(f"create_character     n={n:>8}  scalar {n / t_scalar:>12,.0f}/s  "
+              f"batch {n / t_batch:>12,.0f}/s  x{t_scalar / t_batch:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: load time of per-file load_character vs text and binary rosters.
+
+Run from the repo root:
+    python benchmarks/bench_binary.py
+    python benchmarks/bench_binary.py --size 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project1_starter import create_characters, load_character, save_character
+from roster import append_characters, iter_characters
+from roster_binary import BinaryRoster, write_binary_roster
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+
+def report(label, n, seconds):
+    print(f"{label:<32} n={n:>8}  {seconds * 1000:>9.1f} ms  {n / seconds:>12,.0f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10000)
+    args = parser.parse_args()
+    n = args.size
+
+    chars = create_characters([f"Hero{i}" for i in range(n)],
+                              [CLASSES[i % 4] for i in range(n)])
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [os.path.join(tmp, f"hero{i}.txt") for i in range(n)]
+        for char, filename in zip(chars, files):
+            save_character(char, filename)
+        text_path = os.path.join(tmp, "roster.txt")
+        append_characters(text_path, chars)
+        binary_path = os.path.join(tmp, "roster.bin")
+        write_binary_roster(binary_path, chars)
+
+        start = time.perf_counter()
+        loaded = [load_character(f) for f in files]
+        report("load_character (one file each)", n, time.perf_counter() - start)
+        assert loaded == chars
+
+        start = time.perf_counter()
+        loaded = list(iter_characters(text_path))
+        report("iter_characters (text roster)", n, time.perf_counter() - start)
+        assert loaded == chars
+
+        start = time.perf_counter()
+        with BinaryRoster(binary_path) as roster:
+            loaded = list(roster)
+        report("BinaryRoster (full scan)", n, time.perf_counter() - start)
+        assert loaded == chars
+
+        picks = [random.randrange(n) for _ in range(n)]
+        with BinaryRoster(binary_path) as roster:
+            start = time.perf_counter()
+            for index in picks:
+                roster[index]
+            report("BinaryRoster (random access)", n, time.perf_counter() - start)
+
+        print(f"sizes: text roster {os.path.getsize(text_path):,} bytes, "
+              f"binary roster {os.path.getsize(binary_path):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
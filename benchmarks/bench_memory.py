@@ -0,0 +1,57 @@
+"""
+Benchmark: memory used by a roster of dicts vs Character vs CharacterTable.
+
+Run from the repo root:
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --size 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from character import Character, CharacterTable
+from project1_starter import create_characters
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+
+def measure(build):
+    """Returns the bytes still allocated by the object build() returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=100000)
+    args = parser.parse_args()
+    n = args.size
+
+    # names are shared by every representation so only the containers are measured
+    names = [f"Hero{i}" for i in range(n)]
+    classes = [CLASSES[i % 4] for i in range(n)]
+    dicts = create_characters(names, classes)
+
+    results = [
+        ("dict", measure(lambda: [dict(c) for c in dicts])),
+        ("Character", measure(lambda: [Character.from_dict(c) for c in dicts])),
+        ("CharacterTable", measure(lambda: CharacterTable(dicts))),
+    ]
+    base = results[0][1]
+    for label, used in results:
+        print(f"{label:<15} n={n:>8}  {used / n:>7.1f} bytes/hero  "
+              f"{used / 2**20:>8.1f} MiB  ({used / base:.0%} of dict)")
+
+
+if __name__ == "__main__":
+    main()
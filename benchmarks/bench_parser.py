@@ -0,0 +1,83 @@
+"""
+Benchmark: the original load_character parser vs save_format.parse_character.
+
+Run from the repo root:
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --size 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project1_starter import create_character, format_character, load_character, save_character
+from save_format import parse_character, read_character
+
+
+def legacy_parse(text):
+    """The parsing code load_character used before save_format existed."""
+    lines = text.splitlines(True)
+    data = {}
+    for line in lines:
+        parts = line.strip().split(": ")
+        if len(parts) == 2:
+            key = parts[0]
+            value = parts[1]
+            data[key] = value
+    return {
+        "name": data["Character Name"],
+        "class": data["Class"],
+        "level": int(data["Level"]),
+        "strength": int(data["Strength"]),
+        "magic": int(data["Magic"]),
+        "health": int(data["Health"]),
+        "gold": int(data["Gold"])
+    }
+
+
+def legacy_load(filename):
+    file = open(filename, "r")
+    lines = file.readlines()
+    file.close()
+    return legacy_parse("".join(lines))
+
+
+def run(label, func, arg, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        func(arg)
+    seconds = time.perf_counter() - start
+    print(f"{label:<34} {n / seconds:>12,.0f}/s  {seconds / n * 1e6:>7.2f} us/op")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=100000)
+    args = parser.parse_args()
+    n = args.size
+
+    char = create_character("Benchmark Hero", "Cleric")
+    text = format_character(char)
+    assert legacy_parse(text) == parse_character(text) == parse_character(text, strict=False)
+
+    print("in-memory text:")
+    run("  legacy parser", legacy_parse, text, n)
+    run("  parse_character strict", parse_character, text, n)
+    run("  parse_character lenient", lambda t: parse_character(t, strict=False), text, n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "hero.txt")
+        save_character(char, filename)
+        files = max(n // 10, 1)
+        print("from a file:")
+        run("  legacy load (readlines)", legacy_load, filename, files)
+        run("  load_character", load_character, filename, files)
+        run("  read_character strict", read_character, filename, files)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: ShardedStore save throughput as writer processes scale 1 -> 16.
+
+Every writer is a separate process with its own ShardedStore on the same
+directory, saving its own heroes one call at a time (so every save takes
+a shard lock). The store is verified after each run.
+
+Run from the repo root:
+    python benchmarks/bench_shards.py
+    python benchmarks/bench_shards.py --saves 5000 --shards 32 --writers 1 4 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project1_starter import create_characters
+from shard_store import ShardedStore
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+
+def _writer(args):
+    directory, writer, saves = args
+    store = ShardedStore(directory)
+    chars = create_characters([f"W{writer}-Hero{i}" for i in range(saves)],
+                              [CLASSES[i % 4] for i in range(saves)])
+    for char in chars:
+        store.save(char)
+    return saves
+
+
+def run(writers, saves, shards):
+    """Returns (seconds, total saves) for writers processes saving saves each."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ShardedStore(tmp, shards)
+        with ProcessPoolExecutor(max_workers=writers) as pool:
+            # start the workers before timing
+            list(pool.map(abs, range(writers)))
+            start = time.perf_counter()
+            total = sum(pool.map(_writer, [(tmp, w, saves) for w in range(writers)]))
+            seconds = time.perf_counter() - start
+        assert len(ShardedStore(tmp)) == total
+    return seconds, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--saves", type=int, default=2000, help="saves per writer")
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    print(f"{'writers':>7}  {'saves':>8}  {'seconds':>8}  {'saves/s':>12}  {'speedup':>7}")
+    single = None
+    for writers in args.writers:
+        seconds, total = run(writers, args.saves, args.shards)
+        rate = total / seconds
+        single = single or rate
+        print(f"{writers:>7}  {total:>8}  {seconds:>8.2f}  {rate:>12,.0f}  {rate / single:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
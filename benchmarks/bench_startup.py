@@ -0,0 +1,90 @@
+"""
+Startup benchmark: how long `import project1_starter` takes.
+
+Runs `python -X importtime -c "import project1_starter"` several times and
+reports the median cumulative import time. It also checks that none of the
+optional backends (random, json, re, numpy, asyncio, ...) are imported at
+startup. Exits with status 1 when the median is over --budget-ms or a lazy
+module was imported eagerly, so it can guard the budget in CI.
+
+Run from the repo root:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 30 --budget-ms 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules that must only load when a feature that needs them is used
+LAZY_MODULES = ("random", "json", "re", "numpy", "asyncio", "argparse",
+                "concurrent.futures", "mmap", "tomllib", "warnings")
+
+
+def import_time_us(module="project1_starter"):
+    """Returns the cumulative import time of module in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def eager_modules(module="project1_starter"):
+    """Returns the LAZY_MODULES that importing module pulls in."""
+    code = (f"import sys; before = set(sys.modules); import {module}; "
+            f"print(' '.join(m for m in {LAZY_MODULES!r} "
+            f"if m in sys.modules and m not in before))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def cli_wall_ms():
+    """Wall time of one short scripted CLI run, in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "project1_starter.py", "stats"], cwd=ROOT,
+                   input="", capture_output=True, text=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=25.0,
+                        help="maximum median import time of project1_starter")
+    args = parser.parse_args(argv)
+
+    import_time_us()  # warm the bytecode cache
+    times = [import_time_us() / 1000 for _ in range(args.runs)]
+    median = statistics.median(times)
+    cli = statistics.median(cli_wall_ms() for _ in range(max(args.runs // 3, 1)))
+    eager = eager_modules()
+
+    print(f"import project1_starter: median {median:.2f} ms, "
+          f"min {min(times):.2f} ms, max {max(times):.2f} ms over {args.runs} runs")
+    print(f"scripted CLI run (stats, empty input): median {cli:.1f} ms wall")
+    failed = False
+    if eager:
+        print(f"FAIL: imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: median import time {median:.2f} ms is over the "
+              f"{args.budget_ms:.2f} ms budget")
+        failed = True
+    if not failed:
+        print(f"ok: within the {args.budget_ms:.2f} ms budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
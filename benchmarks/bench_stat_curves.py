@@ -0,0 +1,56 @@
+"""
+Benchmark: calculate_stats vs the precomputed curves in stat_curves.
+
+The workload repeats a small set of (class, level) pairs, like stat
+displays and level-ups in a running game, with a share of unknown
+classes and levels above the curve.
+
+Run from the repo root:
+    python benchmarks/bench_stat_curves.py
+    python benchmarks/bench_stat_curves.py --calls 5000000 --max-level 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project1_starter import calculate_stats
+from stat_curves import StatCurves
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric", "Bard"]   # Bard is not a class
+
+
+def report(label, n, seconds):
+    print(f"{label:<28} n={n:>9}  {seconds * 1000:>9.1f} ms  {n / seconds:>13,.0f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000000)
+    parser.add_argument("--max-level", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pairs = [(rng.choice(CLASSES), rng.randint(1, 120)) for _ in range(args.calls)]
+
+    start = time.perf_counter()
+    expected = [calculate_stats(c, lv) for c, lv in pairs]
+    report("calculate_stats", args.calls, time.perf_counter() - start)
+
+    curves = StatCurves(max_level=args.max_level)
+    get = curves.get
+    start = time.perf_counter()
+    cached = [get(c, lv) for c, lv in pairs]
+    report("StatCurves.get", args.calls, time.perf_counter() - start)
+    assert cached == expected
+
+    counters = curves.stats()
+    print(f"hit rate {counters['hit_rate']:.1%}, {counters['curves']} curves built")
+
+
+if __name__ == "__main__":
+    main()
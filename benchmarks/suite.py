@@ -0,0 +1,295 @@
+"""
+Benchmark suite for the character pipeline.
+
+Times calculate_stats, create_character, level_up, save_character,
+load_character and display_character at several roster sizes and reports
+throughput, per-call latency percentiles and peak traced memory. Results
+can be saved as JSON and compared against a stored baseline; any
+benchmark slower (or hungrier) than the baseline by more than the
+tolerance makes the run exit with status 1. Without a baseline the run
+exits with status 2 unless --update-baseline is given.
+
+Only sizes of at least MIN_COMPARE_SIZE are compared: smaller runs last a
+few milliseconds and their timings are mostly noise. Throughput is the
+median pass of --repeat, and peak memory is measured after one warm-up
+call (so lazy imports and caches filled by whichever benchmark ran first
+do not count) and may grow by MEMORY_SLACK on top of the tolerance.
+Separate runs of the suite still differ by 20% or more on a busy machine,
+so --update-baseline runs it three times (see --runs) and records the
+median of each entry.
+
+Run from the repo root:
+    python benchmarks/suite.py                       # 1, 100, 10k
+    python benchmarks/suite.py --sizes 1 1000 1000000
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json
+    python benchmarks/suite.py --update-baseline     # rewrite the baseline
+    python benchmarks/suite.py --runs 3              # median of three runs
+
+Baselines are only meaningful on the machine that recorded them, so
+refresh benchmarks/baseline.json with --update-baseline when moving the
+suite to new hardware.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from project1_starter import (
+    calculate_stats,
+    create_character,
+    display_character,
+    level_up,
+    load_character,
+    save_character,
+)
+
+DEFAULT_SIZES = [1, 100, 10000]
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+# file benchmarks create one file per character, so they stop at this size
+MAX_FILES = 100000
+# smaller runs are reported but never compared against the baseline
+MIN_COMPARE_SIZE = 10000
+# peak memory may exceed the baseline by this much on top of the tolerance,
+# to absorb allocator and ordering effects
+MEMORY_SLACK = 64 * 1024
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+
+def _roster(n):
+    return [create_character(f"Hero{i}", CLASSES[i % 4]) for i in range(n)]
+
+
+# each benchmark is setup(n, workdir) -> (call, args list); call(*args[i]) is one op
+
+def setup_calculate_stats(n, workdir):
+    return calculate_stats, [(CLASSES[i % 4], 1 + i % 100) for i in range(n)]
+
+
+def setup_create_character(n, workdir):
+    return create_character, [(f"Hero{i}", CLASSES[i % 4]) for i in range(n)]
+
+
+def setup_level_up(n, workdir):
+    return level_up, [(c,) for c in _roster(n)]
+
+
+def setup_save_character(n, workdir):
+    chars = _roster(n)
+    return save_character, [(c, os.path.join(workdir, f"save{i}.txt")) for i, c in enumerate(chars)]
+
+
+def setup_load_character(n, workdir):
+    files = []
+    for i, c in enumerate(_roster(n)):
+        filename = os.path.join(workdir, f"load{i}.txt")
+        save_character(c, filename)
+        files.append((filename,))
+    return load_character, files
+
+
+def setup_display_character(n, workdir):
+    return display_character, [(c,) for c in _roster(n)]
+
+
+# name: (setup, writes files, prints to stdout)
+BENCHMARKS = {
+    "calculate_stats": (setup_calculate_stats, False, False),
+    "create_character": (setup_create_character, False, False),
+    "level_up": (setup_level_up, False, True),
+    "save_character": (setup_save_character, True, False),
+    "load_character": (setup_load_character, True, False),
+    "display_character": (setup_display_character, False, True),
+}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _timed_pass(call, args):
+    """Times every call on its own. Returns (total seconds, sorted latencies in ns)."""
+    clock = time.perf_counter_ns
+    latencies = []
+    record = latencies.append
+    start = clock()
+    for arg in args:
+        t0 = clock()
+        call(*arg)
+        record(clock() - t0)
+    total = (clock() - start) / 1e9
+    latencies.sort()
+    return total, latencies
+
+
+def run_one(name, n, workdir, repeat=5):
+    """
+    Runs benchmark name over n characters, repeat times, and reports the
+    median pass, which one disturbed pass cannot move much.
+    Returns a result dict.
+    """
+    setup, _, prints = BENCHMARKS[name]
+    with contextlib.ExitStack() as stack:
+        if prints:
+            # redirect once around the whole run so it is not part of any timing
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        passes = []
+        for _ in range(repeat):
+            call, args = setup(n, workdir)
+            passes.append(_timed_pass(call, args))
+        passes.sort(key=lambda timed: timed[0])
+        total, latencies = passes[(len(passes) - 1) // 2]
+
+        # memory pass, separate because tracing slows every allocation down;
+        # the untraced warm-up call keeps one-time setup out of the peak
+        call, args = setup(n, workdir)
+        if args:
+            call(*args[0])
+        tracemalloc.start()
+        for arg in args:
+            call(*arg)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "benchmark": name,
+        "size": n,
+        "seconds": total,
+        "ops_per_sec": n / total if total else 0.0,
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p90_us": percentile(latencies, 0.90) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "max_us": latencies[-1] / 1000 if latencies else 0.0,
+        "peak_bytes": peak,
+    }
+
+
+def run_suite(sizes, names=None, max_files=MAX_FILES, repeat=5):
+    """Runs every selected benchmark at every size. Returns the results list."""
+    results = []
+    for name in names or BENCHMARKS:
+        uses_files = BENCHMARKS[name][1]
+        for n in sizes:
+            if uses_files and n > max_files:
+                continue
+            with tempfile.TemporaryDirectory() as workdir:
+                results.append(run_one(name, n, workdir, repeat))
+    return results
+
+
+def median_of_runs(runs):
+    """
+    Combines the results of several run_suite calls: for every entry, the
+    run with the median throughput, with the highest peak memory seen.
+    """
+    combined = []
+    for entries in zip(*runs):
+        ordered = sorted(entries, key=lambda result: result["ops_per_sec"])
+        result = dict(ordered[(len(ordered) - 1) // 2])
+        result["peak_bytes"] = max(entry["peak_bytes"] for entry in entries)
+        combined.append(result)
+    return combined
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns a list of regression messages: benchmarks whose throughput fell,
+    or whose peak memory grew, by more than tolerance (0.25 = 25%).
+    Results with no matching baseline entry, or smaller than
+    MIN_COMPARE_SIZE (too few calls to time reliably), are ignored.
+    """
+    known = {(b["benchmark"], b["size"]): b for b in baseline}
+    problems = []
+    for result in results:
+        base = known.get((result["benchmark"], result["size"]))
+        if base is None or result["size"] < MIN_COMPARE_SIZE:
+            continue
+        label = f"{result['benchmark']} n={result['size']}"
+        if result["ops_per_sec"] < base["ops_per_sec"] * (1 - tolerance):
+            problems.append(f"{label}: {result['ops_per_sec']:,.0f} ops/s vs baseline "
+                            f"{base['ops_per_sec']:,.0f}")
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + tolerance) + MEMORY_SLACK:
+            problems.append(f"{label}: peak {result['peak_bytes']:,} bytes vs baseline "
+                            f"{base['peak_bytes']:,}")
+    return problems
+
+
+def print_table(results):
+    print(f"{'benchmark':<18} {'size':>8} {'ops/s':>12} {'p50 us':>8} "
+          f"{'p90 us':>8} {'p99 us':>8} {'peak KiB':>10}")
+    for r in results:
+        print(f"{r['benchmark']:<18} {r['size']:>8} {r['ops_per_sec']:>12,.0f} "
+              f"{r['p50_us']:>8.2f} {r['p90_us']:>8.2f} {r['p99_us']:>8.2f} "
+              f"{r['peak_bytes'] / 1024:>10.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS),
+                        help="run only these benchmarks")
+    parser.add_argument("--max-files", type=int, default=MAX_FILES,
+                        help="largest size for benchmarks that write files")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="passes per benchmark; the median is reported")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.30,
+                        help="allowed slowdown / memory growth (0.30 = 30%%)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write these results as the new baseline")
+    parser.add_argument("--runs", type=int,
+                        help="run the suite this many times and report the median "
+                             "(default 3 with --update-baseline, otherwise 1)")
+    args = parser.parse_args(argv)
+
+    runs = args.runs or (3 if args.update_baseline else 1)
+    results = median_of_runs([run_suite(args.sizes, args.only, args.max_files, args.repeat)
+                              for _ in range(runs)])
+    print_table(results)
+    report = {"python": platform.python_version(), "machine": platform.machine(),
+              "results": results}
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        # a missing baseline must not pass silently as "no regressions"
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one",
+              file=sys.stderr)
+        return 2
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    problems = compare(results, baseline, args.tolerance)
+    if problems:
+        print("\nREGRESSIONS against baseline:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    print("\nno regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Parallel bulk loading of per-character save files.
+
+Files are split into chunks and each chunk is parsed by one task in a
+process pool, so the cost of sending work to a process is paid once per
+chunk instead of once per file. Results stream back in input order while
+later chunks are still being parsed. A bad or missing file is recorded on
+the BulkLoad object instead of stopping the run. A BulkLoad can be
+iterated only once, since its filenames may be a one-shot generator and
+its counters describe that one run.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from character import CharacterTable
+from project1_starter import load_character
+
+CHUNK_SIZE = 256
+
+
+def _load_chunk(filenames):
+    """
+    Worker task: loads every file in the chunk.
+    Returns a list of (filename, status, value) where status is "ok"
+    (value is the character), "missing" or "error" (value is the message).
+    """
+    results = []
+    for filename in filenames:
+        if not os.path.exists(filename):
+            results.append((filename, "missing", None))
+            continue
+        try:
+            results.append((filename, "ok", load_character(filename)))
+        except FileNotFoundError:
+            results.append((filename, "missing", None))
+        except KeyError as error:
+            results.append((filename, "error", f"missing field {error}"))
+        except (OSError, ValueError) as error:
+            results.append((filename, "error", f"{type(error).__name__}: {error}"))
+    return results
+
+
+def _chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+#map_chunks function
+def map_chunks(task, items, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Yields task(chunk) for consecutive chunks of items, in order.
+    workers=None uses one process per CPU, workers=1 runs in this process.
+    task must be a module-level function so it can be sent to a worker.
+    """
+    chunks = _chunks(items, chunk_size)
+    if workers is not None and workers <= 1:
+        for chunk in chunks:
+            yield task(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # keep a few chunks per worker queued so no process sits idle,
+        # without submitting the whole directory up front
+        window = 4 * (workers or os.cpu_count() or 1)
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(task, chunk))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+#BulkLoad class
+class BulkLoad:
+    """
+    Iterating yields (filename, character) for every file that loaded.
+    Once iteration finishes, errors maps filename -> message and missing
+    lists the files that did not exist.
+    """
+
+    def __init__(self, filenames, workers=None, chunk_size=CHUNK_SIZE):
+        self.filenames = filenames
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.loaded = 0
+        self.errors = {}
+        self.missing = []
+        self._started = False
+
+    def _chunk_results(self):
+        return map_chunks(_load_chunk, self.filenames, self.workers, self.chunk_size)
+
+    def __iter__(self):
+        if self._started:
+            raise RuntimeError("a BulkLoad can only be iterated once")
+        self._started = True
+        return self._iter_loaded()
+
+    def _iter_loaded(self):
+        for results in self._chunk_results():
+            for filename, status, value in results:
+                if status == "ok":
+                    self.loaded += 1
+                    yield filename, value
+                elif status == "missing":
+                    self.missing.append(filename)
+                else:
+                    self.errors[filename] = value
+
+    def to_table(self):
+        """Loads everything into a CharacterTable and returns it."""
+        table = CharacterTable()
+        for _, character in self:
+            table.append(character)
+        return table
+
+
+#load_files function
+def load_files(filenames, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Returns a BulkLoad over the given save files.
+    workers=None uses one process per CPU, workers=1 loads in this process.
+    """
+    return BulkLoad(filenames, workers, chunk_size)
+
+
+#scan_files function
+def scan_files(path, suffix=".txt"):
+    """Yields the path of every file in directory path ending with suffix."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield entry.path
+
+
+#load_directory function
+def load_directory(path, workers=None, chunk_size=CHUNK_SIZE, suffix=".txt"):
+    """
+    Returns a BulkLoad over every file in path ending with suffix.
+    The directory is listed lazily, so loading starts right away.
+    """
+    return BulkLoad(scan_files(path, suffix), workers, chunk_size)
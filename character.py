@@ -0,0 +1,205 @@
+"""
+Compact character representations.
+
+Character is a slotted object and CharacterTable stores a whole roster in
+parallel array columns. Both support the same item access as the character
+dictionaries from project1_starter (character["level"] += 1, etc.), so
+save_character, display_character and level_up work with any of them.
+"""
+
+from array import array
+
+# keys of a character dictionary, in save file order
+FIELDS = ("name", "class", "level", "strength", "magic", "health", "gold")
+INT_FIELDS = ("level", "strength", "magic", "health", "gold")
+
+# dictionary key -> attribute name ("class" is a python keyword)
+_ATTRS = {
+    "name": "name",
+    "class": "class_name",
+    "level": "level",
+    "strength": "strength",
+    "magic": "magic",
+    "health": "health",
+    "gold": "gold",
+}
+
+
+class _MappingMixin:
+    """Dictionary-style access shared by Character and CharacterRow."""
+
+    __slots__ = ()
+
+    def __contains__(self, key):
+        return key in _ATTRS
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def keys(self):
+        return list(FIELDS)
+
+    def values(self):
+        return [self[key] for key in FIELDS]
+
+    def items(self):
+        return [(key, self[key]) for key in FIELDS]
+
+    def get(self, key, default=None):
+        if key in _ATTRS:
+            return self[key]
+        return default
+
+    def to_dict(self):
+        """Returns a plain character dictionary."""
+        return {key: self[key] for key in FIELDS}
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, _MappingMixin)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+#Character class
+class Character(_MappingMixin):
+    """A single character stored in slots instead of a dictionary."""
+
+    __slots__ = ("name", "class_name", "level", "strength", "magic", "health", "gold")
+
+    def __init__(self, name, class_name, level=1, strength=0, magic=0, health=0, gold=100):
+        self.name = name
+        self.class_name = class_name
+        self.level = level
+        self.strength = strength
+        self.magic = magic
+        self.health = health
+        self.gold = gold
+
+    @classmethod
+    def from_dict(cls, character):
+        """Builds a Character from a character dictionary (or row)."""
+        return cls(
+            character["name"],
+            character["class"],
+            character["level"],
+            character["strength"],
+            character["magic"],
+            character["health"],
+            character["gold"],
+        )
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, _ATTRS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, _ATTRS[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    __hash__ = None
+
+
+#CharacterRow class
+class CharacterRow(_MappingMixin):
+    """A live view of one row in a CharacterTable; writes go to the table."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, key):
+        return self.table.get_field(self.index, key)
+
+    def __setitem__(self, key, value):
+        self.table.set_field(self.index, key, value)
+
+    __hash__ = None
+
+
+#CharacterTable class
+class CharacterTable:
+    """
+    Columnar roster: one array('i') per integer stat, a list of names and
+    interned class codes. Indexing returns a CharacterRow view.
+    """
+
+    def __init__(self, characters=()):
+        self.names = []
+        self.class_codes = array("B")
+        self.classes = []          # code -> class name
+        self._class_index = {}     # class name -> code
+        self.columns = {field: array("i") for field in INT_FIELDS}
+        for character in characters:
+            self.append(character)
+
+    def _class_code(self, class_name):
+        """Returns the interned code for class_name, adding it if new."""
+        code = self._class_index.get(class_name)
+        if code is None:
+            code = len(self.classes)
+            if code > 255:
+                raise ValueError("CharacterTable supports at most 256 classes")
+            self.classes.append(class_name)
+            self._class_index[class_name] = code
+        return code
+
+    def append(self, character):
+        """Adds a character (dictionary, Character or row) to the end."""
+        self.names.append(character["name"])
+        self.class_codes.append(self._class_code(character["class"]))
+        for field in INT_FIELDS:
+            self.columns[field].append(character[field])
+
+    def extend(self, characters):
+        for character in characters:
+            self.append(character)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CharacterTable index out of range")
+        return CharacterRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield CharacterRow(self, index)
+
+    def get_field(self, index, key):
+        if key == "name":
+            return self.names[index]
+        if key == "class":
+            return self.classes[self.class_codes[index]]
+        try:
+            return self.columns[key][index]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def set_field(self, index, key, value):
+        if key == "name":
+            self.names[index] = value
+        elif key == "class":
+            self.class_codes[index] = self._class_code(value)
+        elif key in self.columns:
+            self.columns[key][index] = value
+        else:
+            raise KeyError(key)
+
+    def to_dicts(self):
+        """Returns the roster as a list of character dictionaries."""
+        return [row.to_dict() for row in self]
@@ -0,0 +1,164 @@
+"""
+Character class definitions.
+
+Every class has base stats at level 1 and a growth per level for each
+stat. The built-in classes live in DEFAULT_CLASSES; more can be added with
+register() or from a JSON/TOML config file:
+
+    {"classes": {"Paladin": {"strength": 14, "magic": 12, "health": 120,
+                             "growth": 6}}}
+
+    [classes.Paladin]
+    strength = 14
+    magic = 12
+    health = 120
+    growth = {strength = 6, magic = 4, health = 8}
+
+The merged definitions are flattened into one table of
+(strength, magic, health, strength growth, magic growth, health growth)
+rows so a stat calculation is a single dictionary lookup. The config file
+is re-read lazily, on the first lookup after its mtime changes.
+"""
+
+import os
+import time
+
+# name: (strength, magic, health), every class gains +5 per level
+DEFAULT_CLASSES = {
+    "Warrior":  (15, 8, 70),
+    "Mage":    (7, 20, 90),
+    "Rogue":      (12, 10, 110),
+    "Cleric":   (10, 21, 100),
+    #"Unclassified": (20, 20, 150)
+}
+DEFAULT_STATS = (10, 10, 100)
+STAT_GROWTH = 5
+
+# row used for classes that are not defined
+DEFAULT_ROW = DEFAULT_STATS + (STAT_GROWTH,) * 3
+
+STATS = ("strength", "magic", "health")
+
+
+#make_row function
+def make_row(base, growth=STAT_GROWTH):
+    """
+    Builds a table row from base (strength, magic, health) and growth,
+    which is one number for every stat or a (strength, magic, health) tuple.
+    """
+    if isinstance(growth, int):
+        growth = (growth,) * 3
+    row = tuple(base) + tuple(growth)
+    if len(row) != 6 or not all(isinstance(v, int) for v in row):
+        raise ValueError(f"bad class definition: base={base!r} growth={growth!r}")
+    return row
+
+
+def _read_config(path):
+    """Returns {class name: row} from a JSON or TOML config file."""
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise ImportError("reading TOML class configs needs Python 3.11+") from None
+        with open(path, "rb") as file:
+            config = tomllib.load(file)
+    else:
+        import json
+        with open(path, "r", encoding="utf-8") as file:
+            config = json.load(file)
+
+    rows = {}
+    classes = config.get("classes")
+    if not isinstance(classes, dict):
+        raise ValueError(f"{path}: expected a 'classes' table")
+    for name, spec in classes.items():
+        try:
+            base = tuple(spec[stat] for stat in STATS)
+            growth = spec.get("growth", STAT_GROWTH)
+            if isinstance(growth, dict):
+                growth = tuple(growth.get(stat, STAT_GROWTH) for stat in STATS)
+            rows[name] = make_row(base, growth)
+        except (KeyError, TypeError, AttributeError, ValueError):
+            raise ValueError(f"{path}: bad definition for class {name!r}") from None
+    return rows
+
+
+#ClassRegistry class
+class ClassRegistry:
+    """Merged table of built-in, registered and config-file classes."""
+
+    def __init__(self, config_path=None, check_interval=1.0):
+        self.check_interval = check_interval
+        self._registered = {}
+        self._config_rows = {}
+        self._config_path = None
+        self._config_stamp = None
+        self._next_check = 0.0
+        self._rebuild()
+        if config_path is not None:
+            self.use_config(config_path)
+
+    def _rebuild(self):
+        table = {name: make_row(base) for name, base in DEFAULT_CLASSES.items()}
+        table.update(self._registered)
+        table.update(self._config_rows)
+        self._table = table
+        self._names = tuple(table)
+        self.version = getattr(self, "version", 0) + 1
+
+    def register(self, name, base, growth=STAT_GROWTH):
+        """Adds or replaces a class defined in code."""
+        self._registered[name] = make_row(base, growth)
+        self._rebuild()
+
+    def use_config(self, path):
+        """Loads classes from path and keeps following changes to it."""
+        if path is None:
+            self._config_path = None
+            self._config_stamp = None
+            self._config_rows = {}
+            self._rebuild()
+            return
+        stat = os.stat(path)
+        self._config_rows = _read_config(path)
+        self._config_path = path
+        self._config_stamp = (stat.st_mtime_ns, stat.st_size)
+        self._next_check = time.monotonic() + self.check_interval
+        self._rebuild()
+
+    def _refresh(self):
+        """Re-reads the config file if it changed since it was loaded."""
+        self._next_check = time.monotonic() + self.check_interval
+        try:
+            stat = os.stat(self._config_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == self._config_stamp:
+                return
+            rows = _read_config(self._config_path)
+        except (OSError, ValueError, ImportError) as error:
+            # keep serving the last good table rather than failing a lookup
+            import warnings
+            warnings.warn(f"could not reload class config: {error}")
+            return
+        self._config_rows = rows
+        self._config_stamp = stamp
+        self._rebuild()
+
+    def table(self):
+        """Returns {class name: (s, m, h, s growth, m growth, h growth)}."""
+        if self._config_path is not None and time.monotonic() >= self._next_check:
+            self._refresh()
+        return self._table
+
+    def class_names(self):
+        """Returns the names of every defined class."""
+        self.table()
+        return self._names
+
+    def is_valid(self, class_name):
+        return class_name in self.table()
+
+
+# the registry used by project1_starter
+REGISTRY = ClassRegistry()
@@ -0,0 +1,166 @@
+"""
+Bulk export and import of rosters as CSV or JSON Lines.
+
+Both formats hold one character per row with the columns of FIELDS:
+
+    name,class,level,strength,magic,health,gold
+    Aria,Mage,1,7,20,90,100
+
+export_roster writes rows in batches (csv writerows, one write per batch
+for JSON Lines) and has a fast path for CharacterTable that zips the
+columns directly. import_roster reads a batch of rows at a time and
+converts each integer column with one map(int, ...) call instead of
+converting field by field. Exported characters import back as exactly
+the dictionaries create_character makes.
+"""
+
+import csv
+import json
+from itertools import islice
+from operator import itemgetter
+
+from character import FIELDS, INT_FIELDS, CharacterTable
+
+FORMATS = ("csv", "jsonl")
+BATCH_SIZE = 10000
+
+_INT_COLUMNS = tuple(FIELDS.index(field) for field in INT_FIELDS)
+_row = itemgetter(*FIELDS)
+
+
+def _format(path, format):
+    if format is None:
+        for suffix in FORMATS:
+            if str(path).endswith("." + suffix):
+                format = suffix
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    return format
+
+
+def _rows(characters, batch_size):
+    """Yields lists of (name, class, level, ...) tuples."""
+    if isinstance(characters, CharacterTable):
+        classes = characters.classes
+        columns = [characters.names, [classes[code] for code in characters.class_codes]]
+        columns += [characters.columns[field] for field in INT_FIELDS]
+        rows = zip(*columns)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            yield batch
+    batch = []
+    for character in characters:
+        batch.append(_row(character))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+#export_roster function
+def export_roster(path, characters, format=None, batch_size=BATCH_SIZE):
+    """
+    Writes characters (any iterable of characters, or a CharacterTable) to
+    path as CSV or JSON Lines; format defaults to the path's suffix.
+    Returns the number of characters written.
+    """
+    format = _format(path, format)
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        if format == "csv":
+            writer = csv.writer(file, lineterminator="\n")
+            writer.writerow(FIELDS)
+            for batch in _rows(characters, batch_size):
+                writer.writerows(batch)
+                count += len(batch)
+        else:
+            for batch in _rows(characters, batch_size):
+                file.write("".join(
+                    json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + "\n"
+                    for row in batch))
+                count += len(batch)
+    return count
+
+
+def _convert_columns(batch, path, first_row):
+    """Returns the batch as columns with the integer columns converted."""
+    for number, row in enumerate(batch, first_row):
+        if len(row) != len(FIELDS):
+            raise ValueError(f"{path}, row {number}: expected {len(FIELDS)} columns, "
+                             f"got {len(row)}")
+    columns = list(zip(*batch))
+    for index in _INT_COLUMNS:
+        try:
+            columns[index] = list(map(int, columns[index]))
+        except ValueError:
+            # find the row to report; only reached on bad input
+            for number, value in enumerate(columns[index], first_row):
+                try:
+                    int(value)
+                except ValueError:
+                    raise ValueError(f"{path}, row {number}: {FIELDS[index]} must be a "
+                                     f"whole number, got {value!r}") from None
+    return columns
+
+
+def _iter_csv(file, path, batch_size):
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return
+    if tuple(header) != FIELDS:
+        raise ValueError(f"{path}: expected header {','.join(FIELDS)}")
+    number = 2   # the header is row 1
+    while True:
+        batch = list(islice(reader, batch_size))
+        if not batch:
+            return
+        columns = _convert_columns(batch, path, number)
+        number += len(batch)
+        yield [dict(zip(FIELDS, row)) for row in zip(*columns)]
+
+
+def _iter_jsonl(file, path, batch_size):
+    batch = []
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        value = json.loads(line)
+        if not isinstance(value, dict) or any(key not in value for key in FIELDS):
+            raise ValueError(f"{path}, line {number}: expected an object with "
+                             f"{', '.join(FIELDS)}")
+        if not all(type(value[key]) is int for key in INT_FIELDS):
+            raise ValueError(f"{path}, line {number}: stats must be whole numbers")
+        batch.append({key: value[key] for key in FIELDS})
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+#iter_import function
+def iter_import(path, format=None, batch_size=BATCH_SIZE):
+    """Yields lists of up to batch_size character dictionaries from path."""
+    format = _format(path, format)
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if format == "csv":
+            yield from _iter_csv(file, path, batch_size)
+        else:
+            yield from _iter_jsonl(file, path, batch_size)
+
+
+#import_roster function
+def import_roster(path, format=None, table=False, batch_size=BATCH_SIZE):
+    """
+    Reads a CSV or JSON Lines roster. Returns a list of character
+    dictionaries, or a CharacterTable if table is True.
+    Raises ValueError naming the first bad row.
+    """
+    result = CharacterTable() if table else []
+    for batch in iter_import(path, format, batch_size):
+        result.extend(batch)
+    return result
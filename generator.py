@@ -0,0 +1,157 @@
+"""
+Seeded random character generator for load testing.
+
+Characters are generated in fixed-size blocks and every block has its own
+random stream, seeded from (seed, block number). The output for a given
+seed is therefore identical whether it is produced by one process or
+split across many, and a worker can start at any block without
+generating the ones before it.
+
+Generation is lazy: iter_generated yields characters one at a time and the
+generate_to_* helpers stream them straight into the roster writers, so a
+roster of any size is written without building a list of it.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from class_registry import REGISTRY
+from project1_starter import calculate_stats
+
+BLOCK_SIZE = 10000
+LEVEL_DISTRIBUTIONS = ("uniform", "geometric", "normal")
+
+_FIRST = ("Ka", "Ryu", "Zel", "Mor", "Ael", "Dra", "Thu", "Vel", "Sar", "Ish",
+          "Bel", "Cor", "Ny", "Ol", "Quin", "Ta")
+_SECOND = ("ren", "dan", "wyn", "gar", "thas", "mir", "los", "dra", "vik",
+           "na", "rok", "sel", "tin", "var")
+
+
+def block_rng(seed, block):
+    """Returns the random stream for one block of characters."""
+    # string seeds are hashed with sha512, so this is stable across runs
+    return random.Random(f"{seed}:{block}")
+
+
+def _levels(rng, count, distribution, max_level):
+    if distribution == "uniform":
+        return [rng.randint(1, max_level) for _ in range(count)]
+    if distribution == "geometric":
+        # most heroes are low level, a long tail reaches max_level
+        scale = max(max_level / 10, 1)
+        return [min(max_level, 1 + int(rng.expovariate(1 / scale))) for _ in range(count)]
+    if distribution == "normal":
+        middle = (max_level + 1) / 2
+        spread = max_level / 6
+        return [min(max_level, max(1, round(rng.gauss(middle, spread)))) for _ in range(count)]
+    raise ValueError(f"levels must be one of {', '.join(LEVEL_DISTRIBUTIONS)}")
+
+
+#generate_block function
+def generate_block(block, seed=0, count=None, classes=None, levels="uniform", max_level=100,
+                   block_size=None):
+    """
+    Returns the characters of one block as a list (at most block_size,
+    default BLOCK_SIZE). count is the total roster size; the last block
+    may be shorter.
+    """
+    block_size = block_size or BLOCK_SIZE
+    start = block * block_size
+    size = block_size if count is None else max(0, min(block_size, count - start))
+    rng = block_rng(seed, block)
+    class_list = list(classes or REGISTRY.class_names())
+    picked = rng.choices(class_list, k=size)
+    level_list = _levels(rng, size, levels, max_level)
+    firsts = rng.choices(_FIRST, k=size)
+    seconds = rng.choices(_SECOND, k=size)
+
+    characters = []
+    for i in range(size):
+        class_name = picked[i]
+        level = level_list[i]
+        strength, magic, health = calculate_stats(class_name, level)
+        characters.append({
+            # the index suffix keeps names unique across the whole roster
+            "name": f"{firsts[i]}{seconds[i]} {start + i}",
+            "class": class_name,
+            "level": level,
+            "strength": strength,
+            "magic": magic,
+            "health": health,
+            "gold": 100 + rng.randrange(50 * level)
+        })
+    return characters
+
+
+def _block_count(count, block_size=None):
+    block_size = block_size or BLOCK_SIZE
+    return (count + block_size - 1) // block_size
+
+
+#iter_generated function
+def iter_generated(count, seed=0, classes=None, levels="uniform", max_level=100,
+                   worker=0, workers=1, block_size=None):
+    """
+    Yields count generated characters, one block in memory at a time.
+    With workers > 1, yields only the blocks belonging to this worker
+    (blocks worker, worker + workers, ...). The output depends on
+    block_size (default BLOCK_SIZE), so split runs must all use the same.
+    """
+    if levels not in LEVEL_DISTRIBUTIONS:
+        raise ValueError(f"levels must be one of {', '.join(LEVEL_DISTRIBUTIONS)}")
+    block_size = block_size or BLOCK_SIZE
+    for block in range(worker, _block_count(count, block_size), workers):
+        yield from generate_block(block, seed, count, classes, levels, max_level, block_size)
+
+
+#generate_to_roster function
+def generate_to_roster(path, count, seed=0, **options):
+    """Streams count generated characters into a text roster file."""
+    from roster import append_characters
+    return append_characters(path, iter_generated(count, seed, **options))
+
+
+#generate_to_binary function
+def generate_to_binary(path, count, seed=0, **options):
+    """Streams count generated characters into a binary roster file."""
+    from roster_binary import write_binary_roster
+    return write_binary_roster(path, iter_generated(count, seed, **options))
+
+
+def _worker_job(args):
+    path, count, seed, worker, workers, options, binary = args
+    characters = iter_generated(count, seed, worker=worker, workers=workers, **options)
+    if binary:
+        from roster_binary import write_binary_roster
+        return write_binary_roster(path, characters)
+    from roster import append_characters
+    return append_characters(path, characters)
+
+
+#generate_parallel function
+def generate_parallel(directory, count, seed=0, workers=None, binary=False, **options):
+    """
+    Generates count characters across a process pool. Worker w writes its
+    blocks to shard file "shard-w.txt" (or ".bin") in directory.
+    Returns the list of shard paths. Together the shards hold exactly the
+    characters iter_generated(count, seed) yields, for any worker count.
+    """
+    # resolved here and sent to every worker, so a changed BLOCK_SIZE
+    # applies whatever start method the pool uses
+    options.setdefault("block_size", BLOCK_SIZE)
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, _block_count(count, options["block_size"])))
+    os.makedirs(directory, exist_ok=True)
+    suffix = ".bin" if binary else ".txt"
+    paths = [os.path.join(directory, f"shard-{w}{suffix}") for w in range(workers)]
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+    jobs = [(paths[w], count, seed, w, workers, options, binary) for w in range(workers)]
+    if workers == 1:
+        _worker_job(jobs[0])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_worker_job, jobs))
+    return paths
@@ -0,0 +1,231 @@
+"""
+Opt-in instrumentation for the hot paths in project1_starter.
+
+enable() swaps save_character, load_character, level_up and
+calculate_stats for timed wrappers, both in project1_starter and in any
+module that imported them by name (roster_cli, async_io, bulk_load, ...).
+disable() puts the originals back. While disabled nothing is wrapped, so
+the cost is zero.
+
+Recorded per function: call count, error count, total time, a latency
+histogram and bytes read or written (save/load only). Read them with
+snapshot() or prometheus_text(). profile() runs cProfile over any block.
+"""
+
+import bisect
+import contextlib
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+
+import project1_starter
+
+INSTRUMENTED = ("save_character", "load_character", "level_up", "calculate_stats")
+
+# histogram bucket upper bounds, in seconds
+BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+_lock = threading.Lock()
+_metrics = {}
+_originals = {}
+
+
+class _Metric:
+    __slots__ = ("calls", "errors", "seconds", "buckets", "bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)   # last slot is +Inf
+        self.bytes = 0
+
+
+def _file_size(filename):
+    try:
+        return os.stat(filename).st_size
+    except (OSError, TypeError, ValueError):
+        return 0
+
+
+def _filename_arg(name, args, kwargs):
+    """Returns the filename passed to save_character or load_character."""
+    if "filename" in kwargs:
+        return kwargs["filename"]
+    position = 1 if name == "save_character" else 0
+    return args[position] if len(args) > position else None
+
+
+def _record(name, elapsed, failed, size=0):
+    with _lock:
+        metric = _metrics[name]
+        metric.calls += 1
+        metric.errors += failed
+        metric.seconds += elapsed
+        metric.buckets[bisect.bisect_left(BUCKETS, elapsed)] += 1
+        metric.bytes += size
+
+
+def _wrap(name, func):
+    clock = time.perf_counter
+    counts_bytes = name in ("save_character", "load_character")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            _record(name, clock() - start, 1)
+            raise
+        elapsed = clock() - start
+        size = 0
+        if counts_bytes and result is not None and result is not False:
+            size = _file_size(_filename_arg(name, args, kwargs))
+        _record(name, elapsed, 0, size)
+        return result
+
+    wrapper.__wrapped_original__ = func
+    return wrapper
+
+
+def _swap(replacements):
+    """Replaces each function object with its replacement in every loaded module."""
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+        if namespace is None:
+            continue
+        for attr, value in list(namespace.items()):
+            if callable(value):
+                try:
+                    replacement = replacements.get(value)
+                except TypeError:
+                    continue
+                if replacement is not None:
+                    namespace[attr] = replacement
+
+
+#enable function
+def enable():
+    """Starts recording. Calling it again while enabled does nothing."""
+    if _originals:
+        return
+    replacements = {}
+    for name in INSTRUMENTED:
+        original = getattr(project1_starter, name)
+        _originals[name] = original
+        _metrics.setdefault(name, _Metric())
+        replacements[original] = _wrap(name, original)
+    _swap(replacements)
+
+
+#disable function
+def disable():
+    """Stops recording and restores the original functions."""
+    if not _originals:
+        return
+    wrapped = {getattr(project1_starter, name): original
+               for name, original in _originals.items()}
+    _swap(wrapped)
+    _originals.clear()
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+#reset function
+def reset():
+    """Clears every counter."""
+    with _lock:
+        for name in list(_metrics):
+            _metrics[name] = _Metric()
+
+
+#snapshot function
+def snapshot():
+    """
+    Returns {function: {"calls", "errors", "seconds", "bytes", "histogram"}}
+    where histogram maps each bucket bound ("+Inf" last) to a cumulative count.
+    """
+    with _lock:
+        result = {}
+        for name, metric in _metrics.items():
+            running = 0
+            histogram = {}
+            for bound, count in zip(BUCKETS + ("+Inf",), metric.buckets):
+                running += count
+                histogram[str(bound)] = running
+            result[name] = {
+                "calls": metric.calls,
+                "errors": metric.errors,
+                "seconds": metric.seconds,
+                "bytes": metric.bytes,
+                "histogram": histogram,
+            }
+        return result
+
+
+#prometheus_text function
+def prometheus_text(prefix="character"):
+    """Returns the metrics in the Prometheus text exposition format."""
+    data = snapshot()
+    lines = [
+        f"# HELP {prefix}_calls_total Calls per function.",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    lines += [f'{prefix}_calls_total{{function="{n}"}} {m["calls"]}' for n, m in data.items()]
+    lines += [f"# HELP {prefix}_errors_total Calls that raised.",
+              f"# TYPE {prefix}_errors_total counter"]
+    lines += [f'{prefix}_errors_total{{function="{n}"}} {m["errors"]}' for n, m in data.items()]
+    lines += [f"# HELP {prefix}_bytes_total Bytes written by saves and read by loads.",
+              f"# TYPE {prefix}_bytes_total counter"]
+    lines += [f'{prefix}_bytes_total{{function="{n}"}} {m["bytes"]}'
+              for n, m in data.items() if n in ("save_character", "load_character")]
+    lines += [f"# HELP {prefix}_seconds Call latency.",
+              f"# TYPE {prefix}_seconds histogram"]
+    for name, metric in data.items():
+        for bound, count in metric["histogram"].items():
+            lines.append(f'{prefix}_seconds_bucket{{function="{name}",le="{bound}"}} {count}')
+        lines.append(f'{prefix}_seconds_sum{{function="{name}"}} {metric["seconds"]}')
+        lines.append(f'{prefix}_seconds_count{{function="{name}"}} {metric["calls"]}')
+    return "\n".join(lines) + "\n"
+
+
+#instrumented context manager
+@contextlib.contextmanager
+def instrumented():
+    """Enables instrumentation for the duration of a with block."""
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+#profile context manager
+@contextlib.contextmanager
+def profile(sort="cumulative", limit=25, stream=None, output=None):
+    """
+    Runs cProfile over the with block. Afterwards the top `limit` entries
+    sorted by `sort` are printed to stream (default stderr), and the raw
+    stats are dumped to `output` if a path is given.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if output is not None:
+            profiler.dump_stats(output)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats(sort).print_stats(limit)
+        (stream or sys.stderr).write(text.getvalue())
@@ -0,0 +1,189 @@
+"""
+Journaled saves for characters that are updated often.
+
+A level-up only changes level, strength, magic and health, and a purchase
+only changes gold, yet save_character rewrites the whole file. A Journal
+keeps the usual save file as a snapshot and appends just the changed
+stats to "<filename>.journal", one line per save:
+
+    level=6 strength=40 magic=33 health=95
+    gold=340
+
+Journal lines hold the new values, not differences, so replaying a line
+twice gives the same result. That makes compaction crash safe: the
+replayed character is written over the snapshot atomically first and the
+journal is removed afterwards; if the process dies in between, the next
+load replays the old journal onto the new snapshot and nothing changes.
+When the name or class changes, the new snapshot is not what the journal
+leads to, so a line with all of its stats is appended first; replaying
+the old journal then ends on exactly the snapshot's values.
+
+Compaction happens every compact_every journal lines, when the name or
+class changes (those are not journaled), or on compact(). Only lines
+that end in a newline are replayed, so a torn last line from a crash
+mid-append is ignored on load (and cut off before the next append).
+"""
+
+import os
+
+from character import FIELDS, INT_FIELDS
+import project1_starter
+from project1_starter import format_character, load_character
+from save_manager import atomic_write_text
+
+JOURNAL_SUFFIX = ".journal"
+COMPACT_EVERY = 64
+
+
+def journal_path(filename):
+    return filename + JOURNAL_SUFFIX
+
+
+def _replay(character, text):
+    """Applies journal text to character. Returns the number of lines applied."""
+    applied = 0
+    lines = text.split("\n")
+    # the piece after the last newline is a torn append, even if it parses
+    # ("gold=1" is what is left of "gold=1000\n")
+    lines.pop()
+    for line in lines:
+        if not line:
+            continue
+        changes = {}
+        try:
+            for item in line.split(" "):
+                key, value = item.split("=")
+                if key not in INT_FIELDS:
+                    raise ValueError(key)
+                changes[key] = int(value)
+        except ValueError:
+            # not written by Journal; skip it rather than fail the load
+            continue
+        character.update(changes)
+        applied += 1
+    return applied
+
+
+#load_journaled function
+def load_journaled(filename):
+    """
+    Loads the snapshot in filename and replays its journal on top.
+    Returns None (like load_character) if the snapshot does not exist.
+    """
+    character = load_character(filename)
+    if character is None:
+        return None
+    try:
+        with open(journal_path(filename), "r") as file:
+            text = file.read()
+    except FileNotFoundError:
+        return character
+    _replay(character, text)
+    return character
+
+
+#Journal class
+class Journal:
+    """Saves one character file as a snapshot plus an append-only journal."""
+
+    def __init__(self, filename, compact_every=COMPACT_EVERY, sync=False):
+        if filename == "":
+            raise ValueError("Journal needs a filename")
+        self.filename = filename
+        self.compact_every = compact_every
+        self.sync = sync
+        self._state = None     # the character as snapshot + journal hold it
+        self._entries = None   # lines in the journal file
+        self.appends = 0
+        self.compactions = 0
+
+    def _load_state(self):
+        if not os.path.exists(self.filename):
+            return
+        self._state = load_journaled(self.filename)
+        try:
+            with open(journal_path(self.filename), "rb+") as file:
+                data = file.read()
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    # drop a torn append so the next line does not join onto it
+                    file.truncate(complete)
+        except FileNotFoundError:
+            data, complete = b"", 0
+        self._entries = sum(1 for line in data[:complete].split(b"\n") if line.strip())
+
+    def load(self):
+        """Returns the current character (snapshot with journal replayed)."""
+        self._load_state()
+        return None if self._state is None else dict(self._state)
+
+    def save(self, character):
+        """
+        Records character. Only the stats that differ from the last save are
+        appended to the journal; the snapshot is rewritten when needed.
+        Returns True, or False if the file could not be written.
+        """
+        if self._state is None:
+            self._load_state()
+        current = {key: character[key] for key in FIELDS}
+        state = self._state
+        try:
+            if state is None or any(current[key] != state[key] for key in ("name", "class")):
+                if self._entries:
+                    # make the journal end on the new stats before it goes stale
+                    self._append(" ".join(f"{key}={current[key]}" for key in INT_FIELDS) + "\n")
+                self._write_snapshot(current)
+            else:
+                changed = [key for key in INT_FIELDS if current[key] != state[key]]
+                if changed:
+                    line = " ".join(f"{key}={current[key]}" for key in changed) + "\n"
+                    self._append(line)
+                    self._state = current
+                    if self._entries >= self.compact_every:
+                        self._write_snapshot(current)
+        except OSError as error:
+            print(f"Could not save character: {error}")
+            return False
+        for hook in project1_starter.SAVE_HOOKS:
+            hook(current, self.filename)
+        return True
+
+    def _append(self, line):
+        with open(journal_path(self.filename), "a") as file:
+            file.write(line)
+            if self.sync:
+                file.flush()
+                os.fsync(file.fileno())
+        self._entries += 1
+        self.appends += 1
+
+    def _write_snapshot(self, character):
+        # snapshot first, then drop the journal; replaying a stale journal is harmless
+        atomic_write_text(self.filename, format_character(character))
+        try:
+            os.remove(journal_path(self.filename))
+        except FileNotFoundError:
+            pass
+        self._state = character
+        self._entries = 0
+        self.compactions += 1
+
+    def compact(self):
+        """Folds the journal into the snapshot now."""
+        if self._state is None:
+            self._load_state()
+        if self._state is not None and self._entries:
+            self._write_snapshot(self._state)
+
+    def level_up(self, character, levels=1, cap=None):
+        """level_up() followed by a journaled save. Returns levels gained."""
+        gained = project1_starter.level_up(character, levels, cap)
+        if gained:
+            self.save(character)
+        return gained
+
+    def add_gold(self, character, amount):
+        """Changes gold by amount and journals it. Returns the new gold."""
+        character["gold"] += amount
+        self.save(character)
+        return character["gold"]
@@ -0,0 +1,129 @@
+"""
+LRU cache in front of load_character.
+
+Entries are keyed on the path and checked against the file's
+(mtime, size, inode) with a single os.stat per lookup, so an unchanged
+file is never reopened or reparsed, and any rewrite (including the rename
+done by save_manager) invalidates the entry. The cache is bounded by entry
+count and optionally by an estimate of the memory its characters use.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+from project1_starter import load_character
+
+
+def _entry_size(character):
+    """Rough number of bytes a cached character dictionary keeps alive."""
+    return sys.getsizeof(character) + sum(sys.getsizeof(v) for v in character.values())
+
+
+#LoadCache class
+class LoadCache:
+    """
+    Bounded LRU of loaded characters.
+    copies=True returns a new dictionary on every hit, so callers can change
+    it freely; copies=False returns a read-only view of the cached one.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=None, copies=True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.copies = copies
+        self._entries = OrderedDict()   # path -> (stamp, character, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _output(self, character):
+        if self.copies:
+            return dict(character)
+        return MappingProxyType(character)
+
+    def _drop(self, path):
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def load(self, filename):
+        """Same as load_character(filename), served from the cache when fresh."""
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            with self._lock:
+                self._drop(filename)
+            return load_character(filename)
+        stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with self._lock:
+            entry = self._entries.get(filename)
+            if entry is not None:
+                if entry[0] == stamp:
+                    self._entries.move_to_end(filename)
+                    self.hits += 1
+                    return self._output(entry[1])
+                self._drop(filename)
+                self.invalidations += 1
+            self.misses += 1
+
+        character = load_character(filename)
+        if character is None:
+            return None
+        size = _entry_size(character)
+        with self._lock:
+            self._drop(filename)
+            self._entries[filename] = (stamp, character, size)
+            self._bytes += size
+            self._evict()
+        return self._output(character)
+
+    def _evict(self):
+        while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def invalidate(self, filename=None):
+        """Forgets filename, or everything when no filename is given."""
+        with self._lock:
+            if filename is None:
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                self._drop(filename)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Returns hit/miss/eviction counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+# shared cache used by cached_load_character
+DEFAULT_CACHE = LoadCache()
+
+
+#cached_load_character function
+def cached_load_character(filename):
+    """load_character through the shared DEFAULT_CACHE."""
+    return DEFAULT_CACHE.load(filename)
@@ -7,34 +7,85 @@ Date: 10-30
 AI Usage: ChatGPT (GPT-5) helped with organization, finding syntax errors as well as creating dictionary for loading characters and developing code for main program in case a file with information was not given. Chat gpt was also used to help create bonus details that i've hidden to be unveiled after github test cases pass like the unclassified class of legendary warrior and the randomizer which randomly assigns a class type to a hero.
 """
 
-import random
 import os  
+import sys
+
+from class_registry import DEFAULT_ROW, REGISTRY
+from save_format import parse_character
+
+# functions called as hook(character, filename) after every successful save
+SAVE_HOOKS = []
+
+# numpy is optional, it is only imported the first time a batch asks for it
+_numpy = None
+
+
+def _load_numpy():
+    """Returns the numpy module, or None if it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
 
 #calculate_stats function
 def calculate_stats(class_name, level):
     """
     Calculates base stats based on role and level.
-    Each level adds +5 to all stats.
-    """
-    base_stats = {
-        "Warrior":  (15, 8, 70),
-        "Mage":    (7, 20, 90),
-        "Rogue":      (12, 10, 110),
-        "Cleric":   (10, 21, 100),
-        #"Unclassified": (20, 20, 150)
-    }
+    Each level adds the class's growth (+5 by default) to every stat.
+    Classes come from class_registry.REGISTRY; unknown classes use (10, 10, 100).
+    """
+    strength, magic, health, s_growth, m_growth, h_growth = \
+        REGISTRY.table().get(class_name, DEFAULT_ROW)
 
-    if class_name in base_stats:
-        strength, magic, health = base_stats[class_name]
-    else:
-        strength, magic, health = (10, 10, 100)
+    # Add each stat's growth for every level up
+    bonus = level - 1
+    return strength + bonus * s_growth, magic + bonus * m_growth, health + bonus * h_growth
 
-    # Add +5 to each stat for every level up
-    strength += (level - 1) * 5
-    magic += (level - 1) * 5
-    health += (level - 1) * 5
 
-    return strength, magic, health
+#calculate_stats_batch function
+def calculate_stats_batch(classes, levels, use_numpy=None):
+    """
+    Calculates stats for many characters in one pass.
+    classes and levels are parallel sequences.
+    Returns three lists (strengths, magics, healths) where entry i matches
+    calculate_stats(classes[i], levels[i]).
+    use_numpy=None uses numpy when it is installed, True requires it.
+    """
+    if len(classes) != len(levels):
+        raise ValueError("classes and levels must be the same length")
+
+    np = _load_numpy() if use_numpy is not False else None
+    if use_numpy and np is None:
+        raise ImportError("numpy is required for use_numpy=True")
+
+    table = REGISTRY.table()
+    if np is not None:
+        # row 0 is the fallback for unknown classes
+        names = list(table)
+        codes = {name: i + 1 for i, name in enumerate(names)}
+        rows = np.array([DEFAULT_ROW] + [table[n] for n in names], dtype=np.int64)
+        idx = np.fromiter((codes.get(c, 0) for c in classes), dtype=np.intp, count=len(classes))
+        picked = rows[idx]
+        bonus = np.asarray(levels, dtype=np.int64) - 1
+        stats = picked[:, :3] + bonus[:, None] * picked[:, 3:]
+        return stats[:, 0].tolist(), stats[:, 1].tolist(), stats[:, 2].tolist()
+
+    strengths = []
+    magics = []
+    healths = []
+    get = table.get
+    for class_name, level in zip(classes, levels):
+        strength, magic, health, s_growth, m_growth, h_growth = get(class_name, DEFAULT_ROW)
+        bonus = level - 1
+        strengths.append(strength + bonus * s_growth)
+        magics.append(magic + bonus * m_growth)
+        healths.append(health + bonus * h_growth)
+    return strengths, magics, healths
 
 
 #create_character function
@@ -43,8 +94,7 @@ def create_character(name, class_name):
     Creates a character with a random role and type.
     Returns: character dictionary
     """
-    valid_classes = ["Warrior", "Mage", "Rogue", "Cleric"]
-    if class_name not in valid_classes:
+    if not REGISTRY.is_valid(class_name):
         return None
     # assigns random role to character
    ## index = random.randint(0, len(roles)-1)
@@ -79,94 +129,213 @@ def create_character(name, class_name):
     return character
 
 
+#create_characters function
+def create_characters(names, class_names):
+    """
+    Creates many level 1 characters at once.
+    Returns a list the same length as names, with None wherever
+    create_character would have returned None (invalid class).
+    """
+    if len(names) != len(class_names):
+        raise ValueError("names and class_names must be the same length")
+
+    # every new character is level 1, so each class only needs one lookup
+    level_one = {c: calculate_stats(c, 1) for c in REGISTRY.class_names()}
+    characters = []
+    for name, class_name in zip(names, class_names):
+        stats = level_one.get(class_name)
+        if stats is None:
+            characters.append(None)
+            continue
+        characters.append({
+            "name": name,
+            "class": class_name,
+            "level": 1,
+            "strength": stats[0],
+            "magic": stats[1],
+            "health": stats[2],
+            "gold": 100
+        })
+    return characters
+
+
+#format_sheet function
+def format_sheet(character):
+    """Returns the character sheet text that display_character prints."""
+    return (
+        "\n=== CHARACTER SHEET ===\n"
+        f"Name: {character['name']}\n"
+        f"Class: {character['class']}\n"
+        #f"Type: {character['type']}\n"
+        f"Level: {character['level']}\n"
+        f"Strength: {character['strength']}\n"
+        f"Magic: {character['magic']}\n"
+        f"Health: {character['health']}\n"
+        f"Gold: {character['gold']}\n"
+        "\n\n"
+    )
+
+
 #display_character function
 def display_character(character):
-    """Prints formatted character sheet."""
-    print("\n=== CHARACTER SHEET ===")
-    print(f"Name: {character['name']}")
-    print(f"Class: {character['class']}")
-    #print(f"Type: {character['type']}")
-    print(f"Level: {character['level']}")
-    print(f"Strength: {character['strength']}")
-    print(f"Magic: {character['magic']}")
-    print(f"Health: {character['health']}")
-    print(f"Gold: {character['gold']}")
-    print("\n")
+    """
+    Prints formatted character sheet.
+    character can be a dictionary, a Character or a CharacterTable row.
+    """
+    print(format_sheet(character), end="")
+
+#format_character function
+def format_character(character):
+    """Returns the save file text for one character."""
+    return (
+        f"Character Name: {character['name']}\n"
+        f"Class: {character['class']}\n"
+        #f"Type: {character['type']}\n"
+        f"Level: {character['level']}\n"
+        f"Strength: {character['strength']}\n"
+        f"Magic: {character['magic']}\n"
+        f"Health: {character['health']}\n"
+        f"Gold: {character['gold']}\n"
+    )
+
+
+#character_from_data function
+def character_from_data(data):
+    """
+    Builds a character dictionary from save file labels and values,
+    e.g. {"Character Name": "Hero", "Level": "3", ...}.
+    """
+    return {
+        "name": data["Character Name"],
+        "class": data["Class"],
+        #"type": data["Type"],
+        "level": int(data["Level"]),
+        "strength": int(data["Strength"]),
+        "magic": int(data["Magic"]),
+        "health": int(data["Health"]),
+        "gold": int(data["Gold"])
+    }
+
 
 #save_character funct
 def save_character(character, filename):
     """
     Saves the character to a text file.
-    Returns True if successful, False if filename is empty.
+    character can be a dictionary, a Character or a CharacterTable row.
+    Returns True if successful, False if filename is empty or the file
+    could not be written (e.g. the directory does not exist).
     """
     if filename == "":
         print("No filename entered. Character not saved.")
         return False
     else:
-        file = open(filename, "w")
-        file.write(f"Character Name: {character['name']}\n")
-        file.write(f"Class: {character['class']}\n")
-        #file.write(f"Type: {character['type']}\n")
-        file.write(f"Level: {character['level']}\n")
-        file.write(f"Strength: {character['strength']}\n")
-        file.write(f"Magic: {character['magic']}\n")
-        file.write(f"Health: {character['health']}\n")
-        file.write(f"Gold: {character['gold']}\n")
-        file.close()
+        try:
+            with open(filename, "w") as file:
+                file.write(format_character(character))
+        except OSError as error:
+            print(f"Could not save character: {error}")
+            return False
+        for hook in SAVE_HOOKS:
+            hook(character, filename)
         return True
 
 # load_character function
-def load_character(filename):
+def load_character(filename, factory=None):
     """
     Loads character from text file.
     Returns character dictionary if file exists, None otherwise.
+    Pass factory (e.g. Character.from_dict) to get another type back.
+    A malformed file raises save_format.MissingFieldError (a KeyError) or
+    save_format.SaveFormatError (a ValueError).
     """
     if not os.path.exists(filename):
         print("File not found. Please check the name and try again.")
         return None
     else:
         file = open(filename, "r")
-        lines = file.readlines()
+        text = file.read()
         file.close()
 
-        data = {}
-        for line in lines:
-            parts = line.strip().split(": ")
-            if len(parts) == 2:
-                key = parts[0]
-                value = parts[1]
-                data[key] = value
-
-        character = {
-            "name": data["Character Name"],
-            "class": data["Class"],
-            #"type": data["Type"],
-            "level": int(data["Level"]),
-            "strength": int(data["Strength"]),
-            "magic": int(data["Magic"]),
-            "health": int(data["Health"]),
-            "gold": int(data["Gold"])
-        }
+        # lenient mode keeps the original rules: stray lines are ignored
+        character = parse_character(text, strict=False, source=filename)
+        if factory is not None:
+            return factory(character)
         return character
 
 
 # level_up function
-def level_up(character):
-    """Increases level and recalculates stats."""
-    character["level"] += 1
-    strength, magic, health = calculate_stats(character["class"], character["level"])
-    character["strength"] = strength
-    character["magic"] = magic
-    character["health"] = health
-    print(f"\n{character['name']} has leveled up to Level {character['level']}!\n")
+def level_up(character, levels=1, cap=None):
+    """
+    Increases level and recalculates stats.
+    character can be a dictionary, a Character or a CharacterTable row.
+    levels is how many levels to gain at once; stats are worked out for the
+    final level directly. If cap is given the level never goes past it.
+    Returns the number of levels actually gained.
+    """
+    gained = _apply_levels(character, levels, cap)
+    if gained:
+        print(f"\n{character['name']} has leveled up to Level {character['level']}!\n")
+    return gained
+
+
+def _apply_levels(character, levels, cap):
+    """Moves character up by levels (clamped to cap). Returns levels gained."""
+    if levels < 0:
+        raise ValueError("levels must not be negative")
+    new_level = character["level"] + levels
+    if cap is not None and new_level > cap:
+        new_level = max(cap, character["level"])
+    gained = new_level - character["level"]
+    if gained:
+        character["level"] = new_level
+        strength, magic, health = calculate_stats(character["class"], new_level)
+        character["strength"] = strength
+        character["magic"] = magic
+        character["health"] = health
+    return gained
+
+
+#level_up_many function
+def level_up_many(characters, levels=1, cap=None, announce=False):
+    """
+    Levels up many characters at once.
+    levels is either one number for everyone or a sequence with one entry
+    per character. Nothing is printed unless announce is True, in which case
+    one line per leveled character is printed in a single write.
+    Returns the number of characters that gained at least one level.
+    """
+    if isinstance(levels, int):
+        amounts = [levels] * len(characters)
+    else:
+        amounts = levels
+        if len(amounts) != len(characters):
+            raise ValueError("levels must have one entry per character")
+
+    changed = 0
+    lines = []
+    for character, amount in zip(characters, amounts):
+        if _apply_levels(character, amount, cap):
+            changed += 1
+            if announce:
+                lines.append(f"{character['name']} has leveled up to Level {character['level']}!")
+    if lines:
+        print("\n".join(lines))
+    return changed
 
 
 
 # MAIN PROGRAM
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # any arguments run a scripted command instead of the menu; roster_cli
+    # imports project1_starter, so point that at this already-loaded module
+    sys.modules.setdefault("project1_starter", sys.modules["__main__"])
+    import roster_cli
+    sys.exit(roster_cli.main(sys.argv[1:]))
+
 if __name__ == "__main__":
     print("=== SOLO LEVELING CHARACTER CREATOR ===\n")
     name = input("Enter your character's name: ")
-    class_name = input("Enter your class (Warrior, Mage, Rogue, Cleric): ")
+    class_name = input(f"Enter your class ({', '.join(REGISTRY.class_names())}): ")
 
 
     # Create character
@@ -0,0 +1,84 @@
+"""
+Batched character sheet rendering.
+
+render_characters formats a whole batch of characters into one string and
+writes it to the stream with a single write call, instead of one print
+per character. Three styles:
+
+    plain   exactly what display_character prints, sheet after sheet
+    table   one aligned row per character under a header
+    jsonl   one JSON object per line
+"""
+
+import io
+import json
+import sys
+
+from character import FIELDS
+from project1_starter import format_sheet
+
+STYLES = ("plain", "table", "jsonl")
+BATCH_SIZE = 1000
+
+TABLE_HEADERS = ("Name", "Class", "Level", "Strength", "Magic", "Health", "Gold")
+
+
+def _table_rows(batch, header):
+    rows = [[str(character[key]) for key in FIELDS] for character in batch]
+    if header:
+        rows.insert(0, list(TABLE_HEADERS))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(FIELDS))]
+    lines = []
+    for row in rows:
+        # text columns line up on the left, numbers on the right
+        cells = [row[0].ljust(widths[0]), row[1].ljust(widths[1])]
+        cells += [cell.rjust(width) for cell, width in zip(row[2:], widths[2:])]
+        lines.append("  ".join(cells).rstrip() + "\n")
+    return lines
+
+
+def _render_batch(batch, style, first):
+    if style == "plain":
+        return "".join(format_sheet(character) for character in batch)
+    if style == "jsonl":
+        return "".join(
+            json.dumps({key: character[key] for key in FIELDS}, ensure_ascii=False) + "\n"
+            for character in batch)
+    return "".join(_table_rows(batch, header=first))
+
+
+#render_characters function
+def render_characters(characters, stream=None, style="plain", batch_size=BATCH_SIZE):
+    """
+    Writes characters to stream (default sys.stdout), one write per batch.
+    In table style the columns are sized per batch and the header is only
+    written before the first batch.
+    Returns the number of characters written.
+    """
+    if style not in STYLES:
+        raise ValueError(f"style must be one of {', '.join(STYLES)}")
+    if stream is None:
+        stream = sys.stdout
+
+    count = 0
+    batch = []
+    first = True
+    for character in characters:
+        batch.append(character)
+        if len(batch) >= batch_size:
+            stream.write(_render_batch(batch, style, first))
+            count += len(batch)
+            batch = []
+            first = False
+    if batch:
+        stream.write(_render_batch(batch, style, first))
+        count += len(batch)
+    return count
+
+
+#render_to_string function
+def render_to_string(characters, style="plain", batch_size=BATCH_SIZE):
+    """Returns the rendered text instead of writing it to a stream."""
+    buffer = io.StringIO()
+    render_characters(characters, buffer, style, batch_size)
+    return buffer.getvalue()
@@ -0,0 +1,142 @@
+"""
+Multi-character roster files.
+
+A roster file is the save_character format repeated once per character,
+with a blank line between records:
+
+    Character Name: Hero1
+    Class: Warrior
+    ...
+    Gold: 100
+
+    Character Name: Hero2
+    ...
+
+A file written by save_character is a roster with one record, so both
+readers work on either kind of file.
+"""
+
+from project1_starter import character_from_data, format_character
+
+# how many records append_characters joins into one write call
+WRITE_BATCH = 1024
+IO_BUFFER = 1 << 20
+
+
+#iter_records function
+def iter_records(path, offset=0):
+    """
+    Yields (offset, character) for each record in a roster file, where
+    offset is the byte position the record starts at. Reading begins at
+    the given byte offset. Only the record being parsed is held in memory.
+    Lines are parsed the same way load_character parses them.
+    Raises FileNotFoundError if path does not exist.
+    """
+    with open(path, "rb", buffering=IO_BUFFER) as file:
+        file.seek(offset)
+        yield from iter_stream_records(file, offset)
+
+
+#iter_stream_records function
+def iter_stream_records(lines, offset=0):
+    """
+    Yields (offset, character) for each record in an iterable of roster
+    lines as bytes (an open binary file, a decompressing stream, ...).
+    offset is the byte position of the first line. A blank or
+    whitespace-only line ends a record, and so does a "Character Name"
+    line when the current record already has one.
+    """
+    for start, data in iter_stream_data(lines, offset):
+        yield start, character_from_data(data)
+
+
+#iter_stream_data function
+def iter_stream_data(lines, offset=0, errors="strict"):
+    """
+    Same as iter_stream_records but yields (offset, {label: value}) without
+    building the character, so a caller can skip a bad record and go on.
+    errors is passed to bytes.decode ("replace" never raises).
+    """
+    data = {}
+    start = position = offset
+    for raw in lines:
+        line = raw.decode("utf-8", errors).strip()
+        parts = line.split(": ")
+        if len(parts) != 2:
+            # a blank line ends the current record
+            if data and not line:
+                yield start, data
+                data = {}
+            position += len(raw)
+            continue
+        key, value = parts
+        if key == "Character Name" and key in data:
+            # next record started without a blank line in between
+            yield start, data
+            data = {}
+        if not data:
+            start = position
+        data[key] = value
+        position += len(raw)
+    if data:
+        yield start, data
+
+
+#iter_characters function
+def iter_characters(path, factory=None):
+    """
+    Yields the characters in a roster file one at a time.
+    Raises FileNotFoundError if path does not exist.
+    """
+    for _, character in iter_records(path):
+        if factory is not None:
+            character = factory(character)
+        yield character
+
+
+#read_character_at function
+def read_character_at(path, offset=0):
+    """
+    Returns the character whose record starts at byte offset in path,
+    or None if there is no record there.
+    """
+    records = iter_records(path, offset)
+    try:
+        record = next(records, None)
+    finally:
+        records.close()
+    if record is None:
+        return None
+    return record[1]
+
+
+#append_characters function
+def append_characters(path, characters, batch_size=WRITE_BATCH):
+    """
+    Appends characters to a roster file, creating it if needed.
+    Records are joined into batches so each batch is one write call.
+    Returns the number of characters written.
+    """
+    count = 0
+    with open(path, "a", buffering=IO_BUFFER) as file:
+        # keep records separated if the file ends without a blank line
+        size = file.tell()
+        if size > 0:
+            with open(path, "rb") as existing:
+                existing.seek(max(size - 2, 0))
+                tail = existing.read()
+            if not tail.endswith(b"\n"):
+                file.write("\n\n")
+            elif not tail.endswith(b"\n\n"):
+                file.write("\n")
+        chunk = []
+        for character in characters:
+            chunk.append(format_character(character))
+            if len(chunk) >= batch_size:
+                file.write("\n".join(chunk) + "\n")
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            file.write("\n".join(chunk) + "\n")
+            count += len(chunk)
+    return count
@@ -0,0 +1,207 @@
+"""
+Binary roster format with fixed-width records.
+
+Layout (all little-endian):
+
+    header   magic "CHRB", version, class count, record count,
+             offset of the class table, offset of the name heap
+    records  one 32-byte record per character:
+             name offset, name length (into the heap), class code,
+             level, strength, magic, health, gold as int32
+    classes  class names, each as a uint16 length then utf-8 bytes
+    heap     every character name as utf-8, back to back
+
+Records are fixed width, so BinaryRoster reads record N straight out of
+an mmap without parsing anything before it. A file that is not a binary
+roster, or whose header or class table is cut short or corrupt, raises
+BinaryRosterError (a ValueError) naming the file when it is opened; a
+record whose class code or name points outside the file raises it when
+the record is read.
+"""
+
+import mmap
+import struct
+
+from roster import append_characters, iter_characters
+
+MAGIC = b"CHRB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQQ")
+RECORD = struct.Struct("<IIH2x5i")
+CLASS_LEN = struct.Struct("<H")
+
+
+#BinaryRosterError class
+class BinaryRosterError(ValueError):
+    """A file is not a binary roster, or its header or class table is corrupt."""
+
+
+#write_binary_roster function
+def write_binary_roster(path, characters):
+    """
+    Writes characters to a binary roster file.
+    Returns the number of characters written.
+    """
+    records = bytearray()
+    heap = bytearray()
+    classes = []
+    class_codes = {}
+    count = 0
+    for character in characters:
+        class_name = character["class"]
+        code = class_codes.get(class_name)
+        if code is None:
+            code = class_codes[class_name] = len(classes)
+            classes.append(class_name)
+        name = character["name"].encode("utf-8")
+        records += RECORD.pack(
+            len(heap), len(name), code,
+            character["level"], character["strength"], character["magic"],
+            character["health"], character["gold"],
+        )
+        heap += name
+        count += 1
+
+    class_table = bytearray()
+    for class_name in classes:
+        encoded = class_name.encode("utf-8")
+        class_table += CLASS_LEN.pack(len(encoded)) + encoded
+
+    classes_offset = HEADER.size + len(records)
+    heap_offset = classes_offset + len(class_table)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(classes), count,
+                               classes_offset, heap_offset))
+        file.write(records)
+        file.write(class_table)
+        file.write(heap)
+    return count
+
+
+#BinaryRoster class
+class BinaryRoster:
+    """
+    Read-only, memory-mapped view of a binary roster file.
+    roster[n] returns character n as a dictionary in O(1).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BinaryRosterError(f"{path} is not a binary roster file") from None
+        try:
+            magic, version, class_count, self._count, classes_offset, self._heap = \
+                HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise BinaryRosterError(f"{path} is not a binary roster file")
+        # the sections must follow each other exactly as the writer lays them out
+        if (classes_offset != HEADER.size + self._count * RECORD.size
+                or not classes_offset <= self._heap <= len(self._map)):
+            self.close()
+            raise BinaryRosterError(f"{path} has a corrupt header: record count or "
+                                    f"section offsets do not match the file")
+
+        # the class table is tiny, so decode it once up front
+        try:
+            self.classes = self._read_classes(classes_offset, class_count)
+        except (struct.error, UnicodeDecodeError, ValueError) as error:
+            self.close()
+            raise BinaryRosterError(f"{path} has a corrupt class table: {error}") from None
+
+    def _read_classes(self, offset, count):
+        if offset + count * CLASS_LEN.size > self._heap:
+            raise ValueError("class table runs past the name heap")
+        classes = []
+        for _ in range(count):
+            (length,) = CLASS_LEN.unpack_from(self._map, offset)
+            offset += CLASS_LEN.size
+            if offset + length > self._heap:
+                raise ValueError("class name runs past the class table")
+            classes.append(self._map[offset:offset + length].decode("utf-8"))
+            offset += length
+        return classes
+
+    def __len__(self):
+        return self._count
+
+    def record(self, index):
+        """
+        Returns the raw record tuple for character index:
+        (name offset, name length, class code, level, strength, magic, health, gold)
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("BinaryRoster index out of range")
+        return RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+
+    def _corrupt(self, index, problem):
+        return BinaryRosterError(f"{self.path}: record {index} is corrupt: {problem}")
+
+    def _name(self, index, offset, length):
+        start = self._heap + offset
+        if start + length > len(self._map):
+            raise self._corrupt(index, "name is outside the name heap")
+        try:
+            return self._map[start:start + length].decode("utf-8")
+        except UnicodeDecodeError as error:
+            raise self._corrupt(index, error) from None
+
+    def name(self, index):
+        """Returns only the name of character index."""
+        offset, length = self.record(index)[:2]
+        return self._name(index, offset, length)
+
+    def __getitem__(self, index):
+        offset, length, code, level, strength, magic, health, gold = self.record(index)
+        if code >= len(self.classes):
+            raise self._corrupt(index, f"class code {code} is not in the class table")
+        return {
+            "name": self._name(index, offset, length),
+            "class": self.classes[code],
+            "level": level,
+            "strength": strength,
+            "magic": magic,
+            "health": health,
+            "gold": gold
+        }
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+#text_to_binary function
+def text_to_binary(text_path, binary_path):
+    """
+    Converts a text roster (or a single save_character file) to binary.
+    Returns the number of characters converted.
+    """
+    return write_binary_roster(binary_path, iter_characters(text_path))
+
+
+#binary_to_text function
+def binary_to_text(binary_path, text_path):
+    """
+    Appends every character in a binary roster to a text roster file.
+    Returns the number of characters converted.
+    """
+    with BinaryRoster(binary_path) as roster:
+        return append_characters(text_path, iter(roster))
@@ -0,0 +1,342 @@
+"""
+Non-interactive command line for bulk roster work.
+
+Characters travel between commands as JSON lines, one character object per
+line, so commands can be chained in shell pipelines:
+
+    python project1_starter.py create -i new_heroes.jsonl \\
+        | python project1_starter.py level-up --levels 10 \\
+        | python project1_starter.py save --roster roster.txt
+
+Commands:
+    create     {"name", "class"} lines -> level 1 characters
+    level-up   characters -> characters with --levels more levels
+    save       characters -> a text roster file or one file per character
+    load       save files, roster files or a directory -> characters
+    show       characters -> character sheets (plain, table or jsonl)
+    convert    convert between .txt rosters, .bin rosters, .jsonl and .csv
+               files and compressed .gz/.bz2/.xz roster archives
+    stats      characters -> per-class counts, sums, means and percentiles
+    validate   a directory of save files -> JSON report, optional repairs
+
+Running project1_starter.py with no arguments still starts the
+interactive menu.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from character import FIELDS, INT_FIELDS
+from project1_starter import create_character, level_up_many, save_character
+from render import STYLES, render_characters
+
+
+class InputError(Exception):
+    """A line of input could not be used."""
+
+
+def _open_input(path):
+    if path == "-":
+        return sys.stdin
+    return open(path, "r", encoding="utf-8")
+
+
+def _read_json_lines(path, errors):
+    """Yields the objects in a JSON lines file; bad lines go to errors."""
+    file = _open_input(path)
+    try:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+                if not isinstance(value, dict):
+                    raise InputError("expected a JSON object")
+            except (ValueError, InputError) as error:
+                errors.append(f"{path}:{number}: {error}")
+                continue
+            yield number, value
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def read_characters(path, errors):
+    """Yields characters from a JSON lines file, checking every field."""
+    for number, value in _read_json_lines(path, errors):
+        missing = [key for key in FIELDS if key not in value]
+        if missing:
+            errors.append(f"{path}:{number}: missing {', '.join(missing)}")
+            continue
+        if not isinstance(value["name"], str) or not isinstance(value["class"], str):
+            errors.append(f"{path}:{number}: name and class must be strings")
+            continue
+        # type() rather than isinstance(): JSON true/false are bools, not stats
+        if not all(type(value[key]) is int for key in INT_FIELDS):
+            errors.append(f"{path}:{number}: stats must be whole numbers")
+            continue
+        yield {key: value[key] for key in FIELDS}
+
+
+def _write_characters(characters, out):
+    return render_characters(characters, out, style="jsonl")
+
+
+def _safe_filename(name, used=None):
+    """
+    Returns a file name for a character. used maps file names already
+    given out to their character names; a name that would take another
+    character's file gets a numbered one instead.
+    """
+    keep = "".join(c if c.isalnum() or c in "-_" else "_" for c in name) or "character"
+    filename = keep + ".txt"
+    if used is None:
+        return filename
+    number = 1
+    while used.setdefault(filename, name) != name:
+        number += 1
+        filename = f"{keep}-{number}.txt"
+    return filename
+
+
+# ---- commands ----
+
+def cmd_create(args, out, errors):
+    if args.name is not None:
+        requests = [(0, {"name": args.name, "class": args.class_name})]
+    else:
+        requests = _read_json_lines(args.input, errors)
+
+    def created():
+        for number, request in requests:
+            name = request.get("name")
+            class_name = request.get("class")
+            if not isinstance(name, str) or not isinstance(class_name, str):
+                errors.append(f"{args.input}:{number}: name and class must be strings")
+                continue
+            char = create_character(name, class_name)
+            if char is None:
+                errors.append(f"{args.input}:{number}: invalid class {request.get('class')!r}")
+                continue
+            yield char
+
+    _write_characters(created(), out)
+
+
+def cmd_level_up(args, out, errors):
+    def leveled():
+        batch = []
+        for char in read_characters(args.input, errors):
+            batch.append(char)
+            if len(batch) >= 1000:
+                level_up_many(batch, args.levels, args.cap)
+                yield from batch
+                batch = []
+        level_up_many(batch, args.levels, args.cap)
+        yield from batch
+
+    _write_characters(leveled(), out)
+
+
+def cmd_save(args, out, errors):
+    characters = read_characters(args.input, errors)
+    if args.roster:
+        from roster import append_characters
+        count = append_characters(args.roster, characters)
+    else:
+        os.makedirs(args.dir, exist_ok=True)
+        count = 0
+        used = {}
+        for char in characters:
+            filename = os.path.join(args.dir, _safe_filename(char["name"], used))
+            if save_character(char, filename):
+                count += 1
+            else:
+                errors.append(f"could not save {char['name']!r} to {filename}")
+    print(f"saved {count} characters", file=sys.stderr)
+
+
+def cmd_load(args, out, errors):
+    def loaded():
+        from roster import iter_characters
+        for path in args.paths:
+            if os.path.isdir(path):
+                from bulk_load import load_directory
+                load = load_directory(path, workers=args.workers)
+                for _, char in load:
+                    yield char
+                errors.extend(f"{name}: {message}" for name, message in load.errors.items())
+                continue
+            try:
+                yield from iter_characters(path)
+            except (OSError, ValueError, KeyError) as error:
+                errors.append(f"{path}: {error}")
+
+    _write_characters(loaded(), out)
+
+
+def cmd_show(args, out, errors):
+    render_characters(read_characters(args.input, errors), out, style=args.style)
+
+
+def _is_archive(path):
+    # same suffixes as archive.CODECS, checked without importing archive
+    return path.endswith((".gz", ".bz2", ".xz"))
+
+
+def _iter_any(path, errors):
+    if _is_archive(path):
+        from archive import iter_archive
+        yield from iter_archive(path)
+    elif path.endswith(".csv"):
+        from export import iter_import
+        for batch in iter_import(path, "csv"):
+            yield from batch
+    elif path.endswith(".bin"):
+        from roster_binary import BinaryRoster
+        with BinaryRoster(path) as roster:
+            yield from roster
+    elif path.endswith(".jsonl") or path == "-":
+        yield from read_characters(path, errors)
+    else:
+        from roster import iter_characters
+        yield from iter_characters(path)
+
+
+def _write_any(dest, characters, out):
+    if _is_archive(dest):
+        from archive import write_archive
+        return write_archive(dest, characters)
+    if dest.endswith(".csv"):
+        from export import export_roster
+        return export_roster(dest, characters, "csv")
+    if dest.endswith(".bin"):
+        from roster_binary import write_binary_roster
+        return write_binary_roster(dest, characters)
+    if dest == "-":
+        return _write_characters(characters, out)
+    if dest.endswith(".jsonl"):
+        with open(dest, "w", encoding="utf-8") as file:
+            return _write_characters(characters, file)
+    from roster import append_characters
+    return append_characters(dest, characters)
+
+
+def cmd_convert(args, out, errors):
+    def characters():
+        try:
+            yield from _iter_any(args.source, errors)
+        except (OSError, ValueError, KeyError) as error:
+            errors.append(f"{args.source}: {error}")
+
+    try:
+        count = _write_any(args.dest, characters(), out)
+    except (OSError, ValueError, KeyError) as error:
+        errors.append(f"{args.dest}: {error}")
+        return
+    print(f"converted {count} characters", file=sys.stderr)
+
+
+def cmd_stats(args, out, errors):
+    from aggregate import aggregate
+    summary = aggregate(read_characters(args.input, errors)).summary()
+    out.write("".join(json.dumps({"class": class_name, **entry}) + "\n"
+                      for class_name, entry in summary.items()))
+
+
+def cmd_validate(args, out, errors):
+    from validate import validate_directory
+    report = validate_directory(args.path, args.repair_dir, workers=args.workers)
+    if args.report:
+        report.write_json(args.report)
+    else:
+        out.write(json.dumps(report.to_dict()) + "\n")
+    bad = report.total - report.counts["valid"]
+    if bad:
+        errors.append(f"{bad} of {report.total} files have problems "
+                      f"({report.repaired} repaired)")
+
+
+def _non_negative_int(text):
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="project1_starter.py",
+        description="Bulk character roster operations (JSON lines in and out).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def with_input(command):
+        command.add_argument("-i", "--input", default="-",
+                             help="JSON lines file to read (default: stdin)")
+        return command
+
+    create = with_input(commands.add_parser("create", help="create level 1 characters"))
+    create.add_argument("--name", help="create one character with this name")
+    create.add_argument("--class", dest="class_name", help="class for --name")
+    create.set_defaults(func=cmd_create)
+
+    level = with_input(commands.add_parser("level-up", help="level up characters"))
+    level.add_argument("--levels", type=_non_negative_int, default=1)
+    level.add_argument("--cap", type=int, default=None)
+    level.set_defaults(func=cmd_level_up)
+
+    save = with_input(commands.add_parser("save", help="save characters to disk"))
+    where = save.add_mutually_exclusive_group(required=True)
+    where.add_argument("--roster", help="append to this text roster file")
+    where.add_argument("--dir", help="write one save file per character here")
+    save.set_defaults(func=cmd_save)
+
+    load = commands.add_parser("load", help="load save files, rosters or directories")
+    load.add_argument("paths", nargs="+")
+    load.add_argument("--workers", type=int, default=None,
+                      help="processes used for directories (default: one per CPU)")
+    load.set_defaults(func=cmd_load)
+
+    show = with_input(commands.add_parser("show", help="print character sheets"))
+    show.add_argument("--style", choices=STYLES, default="plain")
+    show.set_defaults(func=cmd_show)
+
+    convert = commands.add_parser("convert", help="convert between .txt, .bin, .jsonl, .csv and .gz/.bz2/.xz")
+    convert.add_argument("source")
+    convert.add_argument("dest")
+    convert.set_defaults(func=cmd_convert)
+
+    stats = with_input(commands.add_parser("stats", help="per-class summary (class \"*\" is everyone)"))
+    stats.set_defaults(func=cmd_stats)
+
+    validate = commands.add_parser("validate", help="check (and repair) a directory of save files")
+    validate.add_argument("path")
+    validate.add_argument("--repair-dir", help="write repaired copies of broken files here")
+    validate.add_argument("--report", help="write the JSON report here instead of stdout")
+    validate.add_argument("--workers", type=int, default=None,
+                          help="processes to use (default: one per CPU)")
+    validate.set_defaults(func=cmd_validate)
+    return parser
+
+
+#main function
+def main(argv=None, out=None):
+    """
+    Runs one command. Returns the exit code: 0 on success, 1 if any input
+    line or file was skipped (details go to stderr).
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "name", None) is not None and args.class_name is None:
+        parser.error("--name needs --class")
+    errors = []
+    args.func(args, out or sys.stdout, errors)
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
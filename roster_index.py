@@ -0,0 +1,188 @@
+"""
+Persistent lookup index over saved characters.
+
+The index maps each hero name to where its record lives (file and byte
+offset) and keeps two secondary indexes on top of that:
+
+    class -> set of names       ("all Clerics")
+    sorted (level, name) list   ("level 40 and above")
+
+Queries are answered from the index alone; only the matching records are
+read from disk. Call attach() to keep the index current as save_character
+runs, and save() to write it to its JSON file. Writing the file costs
+time proportional to the whole index, so an attached index only writes
+itself when detach() is called (if saves changed it), or after every
+save_every saves when attach() is given one.
+"""
+
+import bisect
+import json
+import os
+
+import project1_starter
+from roster import iter_records, read_character_at
+
+INDEX_VERSION = 1
+
+
+#RosterIndex class
+class RosterIndex:
+    """Name, class and level index over save files and roster files."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}      # name -> (filename, offset, class, level)
+        self.by_class = {}     # class -> set of names
+        self.by_level = []     # sorted list of (level, name)
+        self.by_file = {}      # filename -> set of names
+        self.save_every = None
+        self._unsaved = 0      # hook updates not yet written to path
+        if path is not None and os.path.exists(path):
+            self._read(path)
+
+    def _read(self, path):
+        with open(path, "r", encoding="utf-8") as file:
+            saved = json.load(file)
+        if saved.get("version") != INDEX_VERSION:
+            raise ValueError(f"{path} has an unsupported index version")
+        for name, (filename, offset, class_name, level) in saved["entries"].items():
+            self._insert(name, filename, offset, class_name, level)
+
+    def save(self, path=None):
+        """Writes the index to path (default: the path it was opened with)."""
+        path = path or self.path
+        if path is None:
+            raise ValueError("no index path given")
+        saved = {"version": INDEX_VERSION,
+                 "entries": {name: list(entry) for name, entry in self.entries.items()}}
+        temp = path + ".tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(saved, file)
+        os.replace(temp, path)
+        if path == self.path:
+            self._unsaved = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    # ---- updates ----
+
+    def _insert(self, name, filename, offset, class_name, level):
+        self.entries[name] = (filename, offset, class_name, level)
+        self.by_class.setdefault(class_name, set()).add(name)
+        self.by_file.setdefault(filename, set()).add(name)
+        bisect.insort(self.by_level, (level, name))
+
+    def remove(self, name):
+        """Drops name from the index. Returns True if it was indexed."""
+        entry = self.entries.pop(name, None)
+        if entry is None:
+            return False
+        filename, _, class_name, level = entry
+        for group, key in ((self.by_class, class_name), (self.by_file, filename)):
+            names = group[key]
+            names.discard(name)
+            if not names:
+                del group[key]
+        i = bisect.bisect_left(self.by_level, (level, name))
+        del self.by_level[i]
+        return True
+
+    def add(self, character, filename, offset=0):
+        """Indexes character as stored at byte offset of filename."""
+        self.remove(character["name"])
+        self._insert(character["name"], filename, offset,
+                     character["class"], character["level"])
+
+    def add_file(self, filename):
+        """
+        Indexes every record in a save file or roster file.
+        Returns the number of records indexed.
+        """
+        count = 0
+        for offset, character in iter_records(filename):
+            self.add(character, filename, offset)
+            count += 1
+        return count
+
+    # ---- keeping up with save_character ----
+
+    def record_save(self, character, filename):
+        """save_character hook: the file now holds just this character."""
+        for name in list(self.by_file.get(filename, ())):
+            self.remove(name)
+        self.add(character, filename, 0)
+        if self.path is None:
+            return
+        self._unsaved += 1
+        if self.save_every is not None and self._unsaved >= self.save_every:
+            self.save()
+
+    def attach(self, save_every=None):
+        """
+        Updates the index every time save_character succeeds. With
+        save_every, the index is also written to its path after that many
+        saves; keep it large, since every write rewrites the whole file.
+        """
+        if save_every is not None and save_every < 1:
+            raise ValueError("save_every must be at least 1")
+        self.save_every = save_every
+        if self.record_save not in project1_starter.SAVE_HOOKS:
+            project1_starter.SAVE_HOOKS.append(self.record_save)
+
+    def detach(self):
+        """Stops following save_character and writes any pending updates."""
+        if self.record_save in project1_starter.SAVE_HOOKS:
+            project1_starter.SAVE_HOOKS.remove(self.record_save)
+        if self.path is not None and self._unsaved:
+            self.save()
+
+    # ---- lookups ----
+
+    def find(self, name):
+        """Returns (filename, offset) for name, or None if not indexed."""
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        return entry[0], entry[1]
+
+    def load(self, name):
+        """Reads just the record for name. Returns None if not indexed."""
+        location = self.find(name)
+        if location is None:
+            return None
+        return read_character_at(*location)
+
+    def names(self, class_name=None, min_level=None, max_level=None):
+        """
+        Returns the names matching every filter given, ordered by level.
+        Levels are inclusive.
+        """
+        lo = 0
+        hi = len(self.by_level)
+        if min_level is not None:
+            lo = bisect.bisect_left(self.by_level, (min_level,))
+        if max_level is not None:
+            hi = bisect.bisect_left(self.by_level, (max_level + 1,))
+
+        if class_name is None:
+            return [name for _, name in self.by_level[lo:hi]]
+        members = self.by_class.get(class_name, ())
+        if min_level is None and max_level is None:
+            return sorted(members, key=lambda name: (self.entries[name][3], name))
+        if len(members) < hi - lo:
+            # the class is smaller than the level range, so walk the class
+            low = -float("inf") if min_level is None else min_level
+            high = float("inf") if max_level is None else max_level
+            return sorted(
+                (name for name in members if low <= self.entries[name][3] <= high),
+                key=lambda name: (self.entries[name][3], name))
+        return [name for _, name in self.by_level[lo:hi] if name in members]
+
+    def query(self, class_name=None, min_level=None, max_level=None):
+        """Yields the characters matching the filters, reading only those records."""
+        for name in self.names(class_name, min_level, max_level):
+            yield self.load(name)
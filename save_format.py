@@ -0,0 +1,161 @@
+"""
+Single-pass parser for the save file format.
+
+parse_character maps each "Label: value" line straight to its character
+field and builds the character dictionary once. It has two modes:
+
+    strict=True   every non-blank line must be a known label, each label
+                  appears once, all seven are present and numbers are
+                  valid; anything else raises SaveFormatError naming the
+                  line and label
+    strict=False  the same rules load_character has always used: lines are
+                  stripped and split on ": ", lines that do not split into
+                  exactly two parts are ignored, and the last value for a
+                  label wins
+"""
+
+# save file label -> character key, in file order
+LABELS = {
+    "Character Name": "name",
+    "Class": "class",
+    #"Type": "type",
+    "Level": "level",
+    "Strength": "strength",
+    "Magic": "magic",
+    "Health": "health",
+    "Gold": "gold",
+}
+INT_LABELS = ("Level", "Strength", "Magic", "Health", "Gold")
+
+# a file exactly as save_character writes it, matched in one call
+_CANONICAL_PATTERN = (
+    "Character Name: (.*)\n"
+    "Class: (.*)\n"
+    "Level: (-?[0-9]+)\n"
+    "Strength: (-?[0-9]+)\n"
+    "Magic: (-?[0-9]+)\n"
+    "Health: (-?[0-9]+)\n"
+    "Gold: (-?[0-9]+)\n?"
+)
+_canonical = None
+
+
+def _canonical_match(text):
+    """Matches text against the canonical layout, compiling it on first use."""
+    global _canonical
+    if _canonical is None:
+        # importing re costs several ms, so short-lived runs that never
+        # parse a file do not pay for it
+        import re
+        _canonical = re.compile(_CANONICAL_PATTERN)
+    return _canonical.fullmatch(text)
+
+
+#SaveFormatError class
+class SaveFormatError(ValueError):
+    """A save file could not be parsed."""
+
+
+#MissingFieldError class
+class MissingFieldError(SaveFormatError, KeyError):
+    """
+    A required label is missing. Also a KeyError, which is what
+    load_character raised for this before.
+    """
+
+    def __str__(self):
+        return Exception.__str__(self)
+
+
+def _where(source, number=None):
+    where = source or "save data"
+    if number is not None:
+        where += f", line {number}"
+    return where
+
+
+def _lenient_safe(value):
+    return value != "" and ": " not in value and value == value.rstrip()
+
+
+#parse_character function
+def parse_character(text, strict=True, source=None):
+    """
+    Parses the text of one saved character into a character dictionary.
+    source (usually the filename) is only used in error messages.
+    """
+    match = _canonical_match(text)
+    if match is not None:
+        name, class_name, level, strength, magic, health, gold = match.groups()
+        # lenient mode strips lines and drops values containing ': ', so
+        # only take the shortcut when that would not change anything
+        if strict or (_lenient_safe(name) and _lenient_safe(class_name)):
+            return {
+                "name": name,
+                "class": class_name,
+                "level": int(level),
+                "strength": int(strength),
+                "magic": int(magic),
+                "health": int(health),
+                "gold": int(gold)
+            }
+
+    values = {}
+    if strict:
+        for number, line in enumerate(text.split("\n"), 1):
+            if not line.strip():
+                continue
+            label, sep, value = line.partition(": ")
+            if not sep:
+                raise SaveFormatError(f"{_where(source, number)}: expected 'Label: value', got {line!r}")
+            if label not in LABELS:
+                raise SaveFormatError(f"{_where(source, number)}: unknown label {label!r}")
+            if label in values:
+                raise SaveFormatError(f"{_where(source, number)}: duplicate label {label!r}")
+            values[label] = value
+    else:
+        for line in text.split("\n"):
+            parts = line.strip().split(": ")
+            if len(parts) == 2:
+                values[parts[0]] = parts[1]
+
+    return _build(values, source)
+
+
+def _build(values, source):
+    """Builds the character from label -> text, raising clear errors."""
+    try:
+        return {
+            "name": values["Character Name"],
+            "class": values["Class"],
+            #"type": values["Type"],
+            "level": int(values["Level"]),
+            "strength": int(values["Strength"]),
+            "magic": int(values["Magic"]),
+            "health": int(values["Health"]),
+            "gold": int(values["Gold"])
+        }
+    except KeyError:
+        missing = [label for label in LABELS if label not in values]
+        raise MissingFieldError(f"{_where(source)}: missing {', '.join(missing)}") from None
+    except ValueError:
+        for label in INT_LABELS:
+            try:
+                int(values[label])
+            except ValueError:
+                raise SaveFormatError(
+                    f"{_where(source)}: {label} must be a whole number, "
+                    f"got {values[label]!r}") from None
+        raise
+
+
+#read_character function
+def read_character(filename, strict=True):
+    """
+    Reads and parses one save file in a single buffered read.
+    Raises FileNotFoundError if it does not exist and SaveFormatError if
+    it is malformed.
+    """
+    with open(filename, "r") as file:
+        text = file.read()
+    return parse_character(text, strict, filename)
@@ -0,0 +1,190 @@
+"""
+Write-behind saving for characters that change often.
+
+SaveManager.save() only records that a character is dirty. Repeated saves
+of the same file are coalesced in memory and written later, in a batch,
+when any of these happens:
+
+    - flush_interval seconds pass (background thread, after start())
+    - max_dirty files are waiting
+    - flush() or close() is called, or the interpreter exits
+
+A file whose text is the same as what is already on disk is skipped; the
+file is stat'ed first, so one deleted or rewritten by someone else since
+our last write is written again.
+Every write goes to a temporary file in the same directory that is then
+renamed over the target, so load_character never sees a half-written file.
+"""
+
+import atexit
+import os
+import stat
+import tempfile
+import threading
+
+from character import FIELDS
+import project1_starter
+from project1_starter import format_character
+
+
+# the only way to read the umask is to set it, which affects every thread;
+# do it once at import rather than while the flush thread is writing
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def _target_mode(filename):
+    """Permission bits of filename, or what open() would give a new file."""
+    try:
+        return stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+#atomic_write_text function
+def atomic_write_text(filename, text):
+    """
+    Writes text to filename via a temp file + rename. The file keeps its
+    permissions, and a new one gets the usual 0666 & ~umask.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    # not ".txt": a temp file left by a crash must not pass for a save file
+    fd, temp = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(text)
+            file.flush()
+            # mkstemp makes the file 0600; give it the mode a plain open() would
+            os.chmod(temp, _target_mode(filename))
+            os.fsync(file.fileno())
+        os.replace(temp, filename)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
+
+
+#SaveManager class
+class SaveManager:
+    """Coalesces character saves and writes them in batches."""
+
+    def __init__(self, flush_interval=5.0, max_dirty=100):
+        self.flush_interval = flush_interval
+        self.max_dirty = max_dirty
+        self._pending = {}     # filename -> (character snapshot, text)
+        self._written = {}     # filename -> (stat stamp, text) last seen on disk
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.errors = {}       # filename -> last error message
+        self.writes = 0
+        self.skipped = 0
+        self.coalesced = 0
+        atexit.register(self.flush)
+
+    def save(self, character, filename):
+        """
+        Marks character dirty. Returns False for an empty filename (like
+        save_character), True otherwise. The file is written on the next flush.
+        """
+        if filename == "":
+            print("No filename entered. Character not saved.")
+            return False
+        snapshot = {key: character[key] for key in FIELDS}
+        text = format_character(snapshot)
+        with self._lock:
+            if filename in self._pending:
+                self.coalesced += 1
+            self._pending[filename] = (snapshot, text)
+            full = len(self._pending) >= self.max_dirty
+        if full:
+            self.flush()
+        return True
+
+    def dirty_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    def _stamp(self, filename):
+        info = os.stat(filename)
+        return info.st_mtime_ns, info.st_size, info.st_ino
+
+    def _unchanged(self, filename, text):
+        """True if filename on disk already holds exactly text."""
+        try:
+            stamp = self._stamp(filename)
+        except OSError:
+            # deleted (or never written): it has to be written
+            self._written.pop(filename, None)
+            return False
+        known = self._written.get(filename)
+        if known is None or known[0] != stamp:
+            # someone else changed the file since we wrote it; look again
+            try:
+                with open(filename, "r") as file:
+                    known = (stamp, file.read())
+            except (OSError, UnicodeDecodeError):
+                return False
+            self._written[filename] = known
+        return known[1] == text
+
+    def flush(self):
+        """Writes every dirty file now. Returns the number of files written."""
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                self._pending = {}
+            written = 0
+            for filename, (snapshot, text) in batch.items():
+                if self._unchanged(filename, text):
+                    self.skipped += 1
+                    continue
+                try:
+                    atomic_write_text(filename, text)
+                except OSError as error:
+                    self.errors[filename] = str(error)
+                    with self._lock:
+                        # keep it dirty for the next flush unless a newer save came in
+                        self._pending.setdefault(filename, (snapshot, text))
+                    continue
+                self.errors.pop(filename, None)
+                try:
+                    self._written[filename] = (self._stamp(filename), text)
+                except OSError:
+                    self._written.pop(filename, None)
+                written += 1
+                for hook in project1_starter.SAVE_HOOKS:
+                    hook(snapshot, filename)
+            self.writes += written
+            return written
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def start(self):
+        """Starts the background thread that flushes every flush_interval."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="save-manager",
+                                            daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Stops the background thread and flushes what is left."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
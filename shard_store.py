@@ -0,0 +1,273 @@
+"""
+Sharded on-disk roster store that many processes can use at once.
+
+Characters are spread over N segment files by a stable hash (crc32) of
+their name:
+
+    store/
+        store.json          {"shards": 16}
+        store.lock          held while store.json is created
+        segment-00.txt      roster files (see roster.py)
+        segment-00.lock
+        ...
+
+Saving appends the record to its segment in one write; the newest record
+for a name wins, so a save never rewrites other heroes. Every segment has a lock
+file taken with fcntl.flock, exclusive for writers and shared for
+readers, so processes saving and loading concurrently never see a
+half-written record and two saves of one hero cannot interleave.
+
+Each ShardedStore keeps a name -> offset index per segment and on every
+access only reads records appended since its last look. compact() (run
+automatically when a segment is mostly stale records) rewrites a segment
+with one record per name via temp file + rename; other processes notice
+the new inode and rebuild their index.
+
+Names and classes that would not read back from a roster line (empty,
+containing ": " or line breaks, or with surrounding spaces) are rejected
+by save(). A record that still cannot be read, such as one torn by a
+writer that crashed mid-append, is skipped with a warning and listed by
+bad_records() instead of breaking the whole shard.
+
+fcntl is POSIX only, so this module does not work on Windows.
+"""
+
+import json
+import os
+import warnings
+import zlib
+
+from project1_starter import character_from_data, format_character
+from roster import IO_BUFFER, iter_stream_data, read_character_at
+from save_manager import atomic_write_text
+
+DEFAULT_SHARDS = 16
+# compact a segment once it has this many records and at least half are stale
+COMPACT_MIN_RECORDS = 1024
+# a writer checks whether to compact after this many of its own appends
+CHECK_EVERY = 256
+
+
+def _check_text(field, value):
+    """Raises ValueError unless value reads back unchanged from a roster line."""
+    if (not isinstance(value, str) or value == "" or value != value.strip()
+            or ": " in value or "\n" in value or "\r" in value):
+        raise ValueError(f"{field} {value!r} cannot be stored: it must be non-empty "
+                         f"text without ': ', line breaks or surrounding spaces")
+
+
+def shard_of(name, shards):
+    """Returns the shard number for a character name."""
+    return zlib.crc32(name.encode("utf-8")) % shards
+
+
+class _Shard:
+    __slots__ = ("path", "lock_path", "offsets", "inode", "size", "records", "unchecked",
+                 "bad")
+
+    def __init__(self, path, lock_path):
+        self.path = path
+        self.lock_path = lock_path
+        self.offsets = {}
+        self.inode = None
+        self.size = 0
+        self.records = 0
+        self.unchecked = 0     # appends by this process since the last compaction check
+        self.bad = {}          # offset -> message for records that could not be read
+
+
+class _Locked:
+    """Holds flock on a lock file for the duration of a with block."""
+
+    def __init__(self, target, exclusive):
+        # target is a shard or the path of a lock file
+        self.lock_path = getattr(target, "lock_path", target)
+        self.exclusive = exclusive
+        self.fd = None
+
+    def __enter__(self):
+        import fcntl
+        self.fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self.fd, fcntl.LOCK_EX if self.exclusive else fcntl.LOCK_SH)
+        return self
+
+    def __exit__(self, *exc):
+        # closing the descriptor releases the lock
+        os.close(self.fd)
+
+
+def _write_all(fd, data):
+    """os.write until every byte of data is written."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+#ShardedStore class
+class ShardedStore:
+    """A directory of hash-sharded roster segments with per-shard locking."""
+
+    def __init__(self, directory, shards=None):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        meta_path = os.path.join(directory, "store.json")
+        # processes opening a new store at once must agree on one shard count
+        with _Locked(os.path.join(directory, "store.lock"), exclusive=True):
+            try:
+                with open(meta_path, "r", encoding="utf-8") as file:
+                    stored = json.load(file)["shards"]
+            except FileNotFoundError:
+                stored = shards or DEFAULT_SHARDS
+                atomic_write_text(meta_path, json.dumps({"shards": stored}) + "\n")
+        if shards is not None and shards != stored:
+            raise ValueError(f"{directory} has {stored} shards, not {shards}")
+        self.shards = stored
+        self._shards = [
+            _Shard(os.path.join(directory, f"segment-{n:02d}.txt"),
+                   os.path.join(directory, f"segment-{n:02d}.lock"))
+            for n in range(stored)
+        ]
+
+    def _records(self, shard, offset=0):
+        """
+        Yields (offset, character) for the readable records of a shard from
+        offset on. Bad or torn records are skipped and kept in shard.bad.
+        """
+        with open(shard.path, "rb", buffering=IO_BUFFER) as file:
+            file.seek(offset)
+            for start, data in iter_stream_data(file, offset, errors="replace"):
+                try:
+                    yield start, character_from_data(data)
+                except (KeyError, ValueError) as error:
+                    if start not in shard.bad:
+                        message = f"{shard.path}: skipped bad record at byte {start}: {error!r}"
+                        shard.bad[start] = message
+                        warnings.warn(message)
+
+    def _refresh(self, shard):
+        """Brings the shard's index up to date. Call with its lock held."""
+        try:
+            stat = os.stat(shard.path)
+        except FileNotFoundError:
+            shard.offsets, shard.inode, shard.size, shard.records = {}, None, 0, 0
+            shard.bad = {}
+            return
+        if stat.st_ino != shard.inode or stat.st_size < shard.size:
+            # compacted (or replaced) since we last looked
+            shard.offsets, shard.inode, shard.size, shard.records = {}, stat.st_ino, 0, 0
+            shard.bad = {}
+        if stat.st_size == shard.size:
+            return
+        for offset, character in self._records(shard, shard.size):
+            shard.offsets[character["name"]] = offset
+            shard.records += 1
+        shard.size = stat.st_size
+
+    def bad_records(self):
+        """Returns messages for every record that was skipped as unreadable."""
+        for shard in self._shards:
+            with _Locked(shard, exclusive=False):
+                self._refresh(shard)
+        return [message for shard in self._shards for message in shard.bad.values()]
+
+    def _append(self, shard, characters):
+        text = "".join(format_character(c) + "\n" for c in characters)
+        fd = os.open(shard.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            size = os.fstat(fd).st_size
+            if size and os.pread(fd, 2, max(size - 2, 0)) != b"\n\n":
+                # a writer died mid-append; keep its torn record apart from ours
+                text = "\n\n" + text
+            _write_all(fd, text.encode("utf-8"))
+        finally:
+            os.close(fd)
+        # indexing other writers' records on every save would make each save
+        # cost O(writers); readers catch up lazily instead
+        shard.unchecked += len(characters)
+        if shard.unchecked < CHECK_EVERY:
+            return
+        shard.unchecked = 0
+        self._refresh(shard)
+        if shard.records >= COMPACT_MIN_RECORDS and shard.records >= 2 * len(shard.offsets):
+            self._compact_locked(shard)
+
+    def save(self, character):
+        """
+        Saves one character to its shard. Raises ValueError if its name or
+        class could not be read back from a roster file.
+        """
+        _check_text("name", character["name"])
+        _check_text("class", character["class"])
+        shard = self._shards[shard_of(character["name"], self.shards)]
+        with _Locked(shard, exclusive=True):
+            self._append(shard, [character])
+        return True
+
+    def save_many(self, characters):
+        """Saves characters with one lock and one write per shard. Returns the count."""
+        groups = {}
+        for character in characters:
+            _check_text("name", character["name"])
+            _check_text("class", character["class"])
+            groups.setdefault(shard_of(character["name"], self.shards), []).append(character)
+        for number, group in sorted(groups.items()):
+            shard = self._shards[number]
+            with _Locked(shard, exclusive=True):
+                self._append(shard, group)
+        return sum(len(group) for group in groups.values())
+
+    def load(self, name):
+        """Returns the newest saved version of name, or None."""
+        shard = self._shards[shard_of(name, self.shards)]
+        with _Locked(shard, exclusive=False):
+            self._refresh(shard)
+            offset = shard.offsets.get(name)
+            if offset is None:
+                return None
+            return read_character_at(shard.path, offset)
+
+    def __contains__(self, name):
+        shard = self._shards[shard_of(name, self.shards)]
+        with _Locked(shard, exclusive=False):
+            self._refresh(shard)
+            return name in shard.offsets
+
+    def names(self):
+        """Returns every saved name."""
+        result = []
+        for shard in self._shards:
+            with _Locked(shard, exclusive=False):
+                self._refresh(shard)
+                result.extend(shard.offsets)
+        return result
+
+    def __len__(self):
+        return len(self.names())
+
+    def __iter__(self):
+        """Yields the newest version of every character, shard by shard."""
+        for shard in self._shards:
+            with _Locked(shard, exclusive=False):
+                self._refresh(shard)
+                wanted = set(shard.offsets.values())
+                characters = []
+                if wanted:
+                    characters = [c for offset, c in self._records(shard) if offset in wanted]
+            yield from characters
+
+    def _compact_locked(self, shard):
+        latest = {}
+        for offset, character in self._records(shard):
+            latest[character["name"]] = character
+        atomic_write_text(shard.path, "".join(format_character(c) + "\n"
+                                              for c in latest.values()))
+        self._refresh(shard)
+
+    def compact(self):
+        """Rewrites every segment with only the newest record per name."""
+        for shard in self._shards:
+            with _Locked(shard, exclusive=True):
+                self._refresh(shard)
+                if shard.records > len(shard.offsets):
+                    self._compact_locked(shard)
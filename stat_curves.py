@@ -0,0 +1,105 @@
+"""
+Precomputed stat curves in front of calculate_stats.
+
+A curve is the (strength, magic, health) tuple for every level from 0 to
+max_level of one class, built the first time the class is asked for.
+Lookups inside a built curve are a list index and count as hits; a
+lookup that has to build its curve, or a level above max_level (worked
+out directly), counts as a miss. Memory is bounded by
+(number of classes + 1) * (max_level + 1) tuples: names that are not
+classes all share the one fallback curve for (10, 10, 100) instead of
+getting their own.
+
+The curves belong to one version of the class table. Every lookup checks
+that the registry still returns the same table object; after register()
+or a config file reload it does not, and all curves are dropped.
+"""
+
+from class_registry import DEFAULT_ROW, REGISTRY
+
+DEFAULT_MAX_LEVEL = 100
+
+
+def _curve(row, max_level):
+    strength, magic, health, s_growth, m_growth, h_growth = row
+    return [(strength + bonus * s_growth, magic + bonus * m_growth, health + bonus * h_growth)
+            for bonus in range(-1, max_level)]
+
+
+#StatCurves class
+class StatCurves:
+    """Per-class stat curves up to max_level, rebuilt when the classes change."""
+
+    def __init__(self, max_level=DEFAULT_MAX_LEVEL, registry=REGISTRY):
+        self.max_level = max_level
+        self.registry = registry
+        self._table = None
+        self._curves = {}          # class name -> curve
+        self._fallback = None      # shared curve for unknown classes
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.invalidations = 0
+
+    def _build(self, class_name, table):
+        row = table.get(class_name)
+        if row is None:
+            if self._fallback is None:
+                self._fallback = _curve(DEFAULT_ROW, self.max_level)
+                self.builds += 1
+            return self._fallback
+        curve = self._curves[class_name] = _curve(row, self.max_level)
+        self.builds += 1
+        return curve
+
+    def get(self, class_name, level):
+        """Same result as calculate_stats(class_name, level)."""
+        table = self.registry.table()
+        if table is not self._table:
+            if self._table is not None:
+                self.invalidations += 1
+            self._table = table
+            self._curves = {}
+            self._fallback = None
+        if 0 <= level <= self.max_level:
+            curve = self._curves.get(class_name)
+            if curve is None and class_name not in table:
+                curve = self._fallback
+            if curve is not None:
+                self.hits += 1
+                return curve[level]
+            # building the curve is the expensive path, so it counts as a miss
+            self.misses += 1
+            return self._build(class_name, table)[level]
+        self.misses += 1
+        strength, magic, health, s_growth, m_growth, h_growth = table.get(class_name, DEFAULT_ROW)
+        bonus = level - 1
+        return strength + bonus * s_growth, magic + bonus * m_growth, health + bonus * h_growth
+
+    def invalidate(self):
+        """Drops every curve; they are rebuilt on the next lookups."""
+        self._table = None
+        self._curves = {}
+        self._fallback = None
+
+    def stats(self):
+        """Returns hit/miss counters and how many curves were built."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "builds": self.builds,
+            "invalidations": self.invalidations,
+            "curves": len(self._curves) + (self._fallback is not None),
+        }
+
+
+# shared curves used by cached_calculate_stats
+DEFAULT_CURVES = StatCurves()
+
+
+#cached_calculate_stats function
+def cached_calculate_stats(class_name, level):
+    """calculate_stats through the shared DEFAULT_CURVES."""
+    return DEFAULT_CURVES.get(class_name, level)
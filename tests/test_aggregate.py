@@ -0,0 +1,59 @@
+import generator
+from aggregate import ALL, RosterStats, aggregate, aggregate_files, percentile_from_histogram
+from character import CharacterTable
+from generator import generate_to_roster, iter_generated
+
+
+def naive_summary(chars, class_name, field):
+    values = sorted(c[field] for c in chars if class_name == ALL or c["class"] == class_name)
+    return {"count": len(values), "sum": sum(values), "min": values[0], "max": values[-1],
+            "p50": values[(len(values) + 1) // 2 - 1]}
+
+
+class TestAggregate:
+    """Test the roster aggregate statistics"""
+
+    def test_matches_naive_computation(self):
+        """Every class summary should match sorting the values directly"""
+        chars = list(iter_generated(500, seed=2))
+        summary = aggregate(chars).summary()
+        for class_name in {c["class"] for c in chars} | {ALL}:
+            for field in ("level", "strength", "gold"):
+                expected = naive_summary(chars, class_name, field)
+                got = summary[class_name][field]
+                assert summary[class_name]["count"] == expected["count"]
+                assert {k: got[k] for k in ("sum", "min", "max", "p50")} == \
+                    {k: expected[k] for k in ("sum", "min", "max", "p50")}
+        assert sum(summary[ALL]["level_histogram"].values()) == 500
+
+    def test_table_path_matches_streaming(self):
+        """Aggregating a CharacterTable should equal aggregating the dicts"""
+        chars = list(iter_generated(300, seed=5))
+        table = CharacterTable()
+        table.extend(chars)
+        assert RosterStats().add_table(table).summary() == aggregate(chars).summary()
+
+    def test_merge_equals_single_pass(self):
+        """Merged partial aggregates should equal one pass over everything"""
+        chars = list(iter_generated(400, seed=7))
+        merged = aggregate(chars[:150]) + aggregate(chars[150:])
+        assert merged.summary() == aggregate(chars).summary()
+
+    def test_aggregate_files(self, tmp_path, monkeypatch):
+        """Shard files should reduce to the same totals"""
+        monkeypatch.setattr(generator, "BLOCK_SIZE", 7)
+        chars = list(iter_generated(60, seed=1))
+        paths = []
+        for i in range(3):
+            path = str(tmp_path / f"shard{i}.txt")
+            generate_to_roster(path, 60, seed=1, worker=i, workers=3)
+            paths.append(path)
+        result = aggregate_files(paths, workers=1)
+        assert result.summary() == aggregate(chars).summary()
+
+    def test_percentile_edges(self):
+        """Percentiles should use the nearest rank and handle empty input"""
+        assert percentile_from_histogram({}, 0.5) is None
+        assert percentile_from_histogram({1: 1, 2: 1, 3: 1, 4: 1}, 0.5) == 2
+        assert percentile_from_histogram({1: 99, 50: 1}, 0.99) == 1
+        assert percentile_from_histogram({1: 99, 50: 1}, 1.0) == 50
@@ -0,0 +1,70 @@
+import gzip
+import pytest
+from archive import compress_file, decompress_file, iter_archive, write_archive
+from generator import iter_generated
+from project1_starter import create_character, format_character
+from roster import append_characters, iter_characters
+from roster_cli import main
+
+
+class TestArchive:
+    """Test compressed roster archives"""
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_round_trip(self, tmp_path, suffix):
+        """Every codec should give back the characters that were written"""
+        chars = list(iter_generated(300, seed=4))
+        path = str(tmp_path / f"roster.txt{suffix}")
+        assert write_archive(path, chars, batch_size=64) == 300
+        assert list(iter_archive(path)) == chars
+
+    def test_small_chunks(self, tmp_path):
+        """Records cut by chunk boundaries should still parse"""
+        chars = list(iter_generated(50, seed=2))
+        chars[3]["name"] = "Zoë Ünicode"
+        path = str(tmp_path / "roster.gz")
+        write_archive(path, chars)
+        assert list(iter_archive(path, chunk_size=7)) == chars
+
+    def test_same_record_boundaries_as_rosters(self, tmp_path):
+        """Saves joined without blank lines, or with whitespace lines, should all load"""
+        a = create_character("A", "Mage")
+        b = create_character("B", "Rogue")
+        c = create_character("C", "Cleric")
+        text = format_character(a) + format_character(b) + "   \n" + format_character(c)
+        plain = tmp_path / "joined.txt"
+        plain.write_text(text)
+        path = str(tmp_path / "joined.gz")
+        with gzip.open(path, "wb") as file:
+            file.write(text.encode("utf-8"))
+        assert list(iter_archive(path, chunk_size=16)) == [a, b, c]
+        assert list(iter_archive(path)) == list(iter_characters(str(plain)))
+
+    def test_archives_are_smaller(self, tmp_path):
+        """The repetitive labels should compress well"""
+        chars = list(iter_generated(1000, seed=1))
+        plain = tmp_path / "roster.txt"
+        append_characters(str(plain), chars)
+        packed = tmp_path / "roster.txt.gz"
+        compress_file(str(plain), str(packed))
+        assert packed.stat().st_size * 4 < plain.stat().st_size
+        assert list(iter_archive(str(packed))) == chars
+        decompress_file(str(packed), str(tmp_path / "back.txt"))
+        assert list(iter_characters(str(tmp_path / "back.txt"))) == chars
+
+    def test_unknown_suffix(self, tmp_path):
+        """Paths without a codec suffix need an explicit codec"""
+        with pytest.raises(ValueError):
+            write_archive(str(tmp_path / "roster.zip"), [])
+        path = str(tmp_path / "roster.backup")
+        write_archive(path, iter_generated(3), codec="gzip")
+        assert len(list(iter_archive(path, codec="gzip"))) == 3
+
+    def test_cli_convert(self, tmp_path):
+        """convert should read and write archives by suffix"""
+        chars = list(iter_generated(20, seed=8))
+        plain = str(tmp_path / "roster.txt")
+        append_characters(plain, chars)
+        packed = str(tmp_path / "roster.xz")
+        assert main(["convert", plain, packed]) == 0
+        assert list(iter_archive(packed)) == chars
@@ -0,0 +1,68 @@
+import asyncio
+import os
+from async_io import (
+    async_load_character,
+    async_load_many,
+    async_save_character,
+    async_save_many,
+    set_max_open_files,
+)
+from project1_starter import create_character, load_character
+
+
+class TestAsyncIO:
+    """Test the async save/load wrappers"""
+
+    def test_save_and_load(self, tmp_path):
+        """Async save/load should behave like the blocking versions"""
+        char = create_character("Async", "Mage")
+        filename = str(tmp_path / "async.txt")
+
+        async def run():
+            saved = await async_save_character(char, filename)
+            loaded = await async_load_character(filename)
+            missing = await async_load_character(str(tmp_path / "missing.txt"))
+            return saved, loaded, missing
+
+        saved, loaded, missing = asyncio.run(run())
+        assert saved == True
+        assert loaded == char
+        assert missing is None
+        assert load_character(filename) == char
+
+    def test_save_failures_return_false(self, tmp_path):
+        """Empty and invalid filenames should give False, not raise"""
+        char = create_character("Async", "Rogue")
+
+        async def run():
+            return [await async_save_character(char, ""),
+                    await async_save_character(char, "/invalid/directory/x.txt")]
+
+        assert asyncio.run(run()) == [False, False]
+
+    def test_many_keeps_order(self, tmp_path):
+        """Bulk saves and loads should return results in input order"""
+        chars = [create_character(f"Hero{i}", "Cleric") for i in range(40)]
+        files = [str(tmp_path / f"hero{i}.txt") for i in range(40)]
+        files_with_gap = files[:5] + [str(tmp_path / "gone.txt")] + files[5:]
+
+        async def run():
+            saved = await async_save_many(zip(chars, files), concurrency=4)
+            loaded = await async_load_many(files_with_gap, concurrency=3)
+            return saved, loaded
+
+        saved, loaded = asyncio.run(run())
+        assert saved == [True] * 40
+        assert loaded == chars[:5] + [None] + chars[5:]
+
+    def test_open_file_cap(self, tmp_path):
+        """The executor should be rebuilt with the new cap"""
+        set_max_open_files(2)
+        try:
+            char = create_character("Capped", "Warrior")
+            files = [str(tmp_path / f"c{i}.txt") for i in range(6)]
+            saved = asyncio.run(async_save_many((char, f) for f in files))
+            assert saved == [True] * 6
+            assert all(os.path.exists(f) for f in files)
+        finally:
+            set_max_open_files(32)
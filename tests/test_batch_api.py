@@ -0,0 +1,49 @@
+import pytest
+from project1_starter import (
+    calculate_stats,
+    calculate_stats_batch,
+    create_character,
+    create_characters,
+)
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric", "Unknown"]
+
+
+class TestBatchApi:
+    """Test the batch versions of calculate_stats and create_character"""
+
+    def test_calculate_stats_batch_matches_scalar(self):
+        """Batch stats should match calculate_stats for every entry"""
+        classes = [CLASSES[i % len(CLASSES)] for i in range(50)]
+        levels = [1 + i for i in range(50)]
+        strengths, magics, healths = calculate_stats_batch(classes, levels, use_numpy=False)
+        expected = [calculate_stats(c, lv) for c, lv in zip(classes, levels)]
+        assert list(zip(strengths, magics, healths)) == expected
+
+    def test_calculate_stats_batch_numpy_matches_scalar(self):
+        """The numpy path should give the same plain ints as the scalar path"""
+        pytest.importorskip("numpy")
+        classes = [CLASSES[i % len(CLASSES)] for i in range(50)]
+        levels = [1 + i for i in range(50)]
+        columns = calculate_stats_batch(classes, levels, use_numpy=True)
+        expected = [calculate_stats(c, lv) for c, lv in zip(classes, levels)]
+        assert list(zip(*columns)) == expected
+        assert all(type(v) is int for v in columns[0])
+
+    def test_calculate_stats_batch_length_mismatch(self):
+        """Mismatched inputs should raise ValueError"""
+        with pytest.raises(ValueError):
+            calculate_stats_batch(["Warrior"], [1, 2])
+
+    def test_create_characters_matches_scalar(self):
+        """create_characters should match create_character, including None"""
+        names = [f"Hero{i}" for i in range(len(CLASSES))]
+        assert create_characters(names, CLASSES) == [
+            create_character(n, c) for n, c in zip(names, CLASSES)
+        ]
+
+    def test_create_characters_returns_new_dicts(self):
+        """Each created character should be its own dictionary"""
+        chars = create_characters(["A", "B"], ["Mage", "Mage"])
+        chars[0]["gold"] = 0
+        assert chars[1]["gold"] == 100
@@ -0,0 +1,52 @@
+from benchmarks.suite import BENCHMARKS, compare, main, median_of_runs, percentile, run_suite
+
+
+class TestBenchmarkSuite:
+    """Test the benchmark suite's measurement and baseline comparison"""
+
+    def test_percentile(self):
+        """Nearest-rank percentiles of a sorted list"""
+        values = list(range(1, 101))
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile([], 0.5) == 0.0
+
+    def test_small_run_covers_every_benchmark(self):
+        """A tiny run should report every benchmark with sane numbers"""
+        results = run_suite([3], repeat=1)
+        assert [r["benchmark"] for r in results] == list(BENCHMARKS)
+        for r in results:
+            assert r["size"] == 3
+            assert r["ops_per_sec"] > 0
+            assert r["p50_us"] <= r["p99_us"] <= r["max_us"]
+
+    def test_compare_flags_regressions(self):
+        """Slower or bigger results beyond the tolerance should be reported"""
+        base = [{"benchmark": "load_character", "size": 10000,
+                 "ops_per_sec": 1000.0, "peak_bytes": 100000}]
+        ok = [{"benchmark": "load_character", "size": 10000,
+               "ops_per_sec": 900.0, "peak_bytes": 110000}]
+        slow = [{"benchmark": "load_character", "size": 10000,
+                 "ops_per_sec": 500.0, "peak_bytes": 300000}]
+        tiny = [{"benchmark": "load_character", "size": 1,
+                 "ops_per_sec": 1.0, "peak_bytes": 10**9}]
+        assert compare(ok, base, 0.25) == []
+        assert len(compare(slow, base, 0.25)) == 2
+        assert compare(tiny, base, 0.25) == []
+
+    def test_median_of_runs(self):
+        """Each entry should come from the median run, with the largest peak"""
+        runs = [[{"benchmark": "level_up", "size": 10000, "ops_per_sec": ops,
+                  "peak_bytes": peak}] for ops, peak in ((300.0, 10), (100.0, 30), (200.0, 20))]
+        assert median_of_runs(runs) == [{"benchmark": "level_up", "size": 10000,
+                                         "ops_per_sec": 200.0, "peak_bytes": 30}]
+
+    def test_missing_baseline_fails(self, tmp_path, capsys):
+        """Without a baseline the run should fail unless it is writing one"""
+        baseline = str(tmp_path / "baseline.json")
+        argv = ["--sizes", "1", "--only", "calculate_stats", "--repeat", "1",
+                "--baseline", baseline]
+        assert main(argv) == 2
+        assert "no baseline" in capsys.readouterr().err
+        assert main(argv + ["--update-baseline"]) == 0
+        assert main(argv + ["--tolerance", "1000"]) == 0
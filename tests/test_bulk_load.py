@@ -0,0 +1,66 @@
+import os
+import pytest
+from bulk_load import load_directory, load_files
+from project1_starter import create_character, save_character
+
+
+def fill_directory(directory, count):
+    chars = {}
+    for i in range(count):
+        char = create_character(f"Hero{i}", ["Warrior", "Mage", "Rogue", "Cleric"][i % 4])
+        filename = os.path.join(directory, f"hero{i}.txt")
+        save_character(char, filename)
+        chars[filename] = char
+    return chars
+
+
+class TestBulkLoad:
+    """Test parallel bulk loading"""
+
+    def test_load_directory_in_process(self, tmp_path):
+        """workers=1 should load every file without a pool"""
+        chars = fill_directory(str(tmp_path), 10)
+        load = load_directory(str(tmp_path), workers=1, chunk_size=3)
+        assert dict(load) == chars
+        assert load.loaded == 10
+        assert load.errors == {} and load.missing == []
+
+    def test_load_directory_with_pool(self, tmp_path):
+        """A process pool should give the same results"""
+        chars = fill_directory(str(tmp_path), 25)
+        load = load_directory(str(tmp_path), workers=2, chunk_size=4)
+        assert dict(load) == chars
+
+    def test_errors_are_collected(self, tmp_path):
+        """Bad and missing files should be recorded, not raised"""
+        chars = fill_directory(str(tmp_path), 3)
+        bad_field = str(tmp_path / "bad_field.txt")
+        with open(bad_field, "w") as f:
+            f.write("Character Name: Broken\nClass: Mage\n")
+        bad_int = str(tmp_path / "bad_int.txt")
+        with open(bad_int, "w") as f:
+            f.write("Character Name: X\nClass: Mage\nLevel: one\nStrength: 1\n"
+                    "Magic: 1\nHealth: 1\nGold: 1\n")
+        missing = str(tmp_path / "missing.txt")
+
+        load = load_files(list(chars) + [bad_field, bad_int, missing], workers=1)
+        assert dict(load) == chars
+        assert set(load.errors) == {bad_field, bad_int}
+        assert "Level" in load.errors[bad_field]
+        assert load.missing == [missing]
+
+    def test_to_table(self, tmp_path):
+        """Results can be collected into a CharacterTable"""
+        fill_directory(str(tmp_path), 5)
+        table = load_directory(str(tmp_path), workers=1).to_table()
+        assert len(table) == 5
+        assert sorted(row["name"] for row in table) == [f"Hero{i}" for i in range(5)]
+
+    def test_iterates_only_once(self, tmp_path):
+        """A second pass would see an exhausted listing, so it is refused"""
+        fill_directory(str(tmp_path), 3)
+        load = load_directory(str(tmp_path), workers=1)
+        assert len(list(load)) == 3
+        with pytest.raises(RuntimeError):
+            iter(load)
+        assert load.loaded == 3
@@ -0,0 +1,76 @@
+import pytest
+from character import Character, CharacterTable
+from project1_starter import (
+    create_character,
+    display_character,
+    level_up,
+    load_character,
+    save_character,
+)
+
+
+class TestCharacter:
+    """Test the slotted Character type"""
+
+    def test_character_has_no_dict(self):
+        """Character should use slots instead of a per-instance dict"""
+        char = Character.from_dict(create_character("Slot", "Mage"))
+        assert not hasattr(char, "__dict__")
+
+    def test_character_matches_dict(self):
+        """Character should expose the same keys and values as the dict"""
+        original = create_character("Slot", "Mage")
+        char = Character.from_dict(original)
+        assert char == original
+        assert char.to_dict() == original
+        assert char["class"] == "Mage"
+        with pytest.raises(KeyError):
+            char["type"]
+
+    def test_level_up_character(self):
+        """level_up should work on a Character like on a dict"""
+        original = create_character("Slot", "Rogue")
+        char = Character.from_dict(original)
+        level_up(original)
+        level_up(char)
+        assert char == original
+
+    def test_save_and_load_character(self, tmp_path):
+        """A saved Character should load back identical"""
+        char = Character.from_dict(create_character("Slot", "Cleric"))
+        filename = str(tmp_path / "slot.txt")
+        assert save_character(char, filename) == True
+        loaded = load_character(filename, factory=Character.from_dict)
+        assert isinstance(loaded, Character)
+        assert loaded == char
+
+
+class TestCharacterTable:
+    """Test the columnar CharacterTable"""
+
+    def test_table_round_trip(self):
+        """Rows should read back the characters that were appended"""
+        chars = [create_character(f"Hero{i}", c)
+                 for i, c in enumerate(["Warrior", "Mage", "Warrior"])]
+        table = CharacterTable(chars)
+        assert len(table) == 3
+        assert table.to_dicts() == chars
+        assert table.classes == ["Warrior", "Mage"]
+
+    def test_row_writes_go_to_table(self):
+        """level_up on a row should update the table columns"""
+        table = CharacterTable([create_character("Row", "Warrior")])
+        level_up(table[0])
+        expected = create_character("Row", "Warrior")
+        level_up(expected)
+        assert table[0] == expected
+        assert table.columns["level"][0] == 2
+
+    def test_row_save_and_display(self, tmp_path, capsys):
+        """Rows should work with save_character and display_character"""
+        table = CharacterTable([create_character("Row", "Mage")])
+        filename = str(tmp_path / "row.txt")
+        assert save_character(table[-1], filename) == True
+        assert load_character(filename) == table[0].to_dict()
+        display_character(table[0])
+        assert "Class: Mage" in capsys.readouterr().out
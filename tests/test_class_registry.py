@@ -0,0 +1,76 @@
+import json
+import os
+import pytest
+from class_registry import REGISTRY, ClassRegistry
+from project1_starter import calculate_stats, calculate_stats_batch, create_character
+
+
+@pytest.fixture
+def registry_config(tmp_path):
+    """Points the shared registry at a config file, restoring it afterwards"""
+    path = str(tmp_path / "classes.json")
+    yield path
+    REGISTRY.use_config(None)
+
+
+def write_config(path, classes):
+    with open(path, "w") as f:
+        json.dump({"classes": classes}, f)
+
+
+class TestClassRegistry:
+    """Test the class registry and config-driven classes"""
+
+    def test_defaults_match_original_stats(self):
+        """Built-in classes should keep their original stats"""
+        assert calculate_stats("Warrior", 1) == (15, 8, 70)
+        assert calculate_stats("Cleric", 3) == (20, 31, 110)
+        assert calculate_stats("Unknown", 2) == (15, 15, 105)
+        assert REGISTRY.class_names() == ("Warrior", "Mage", "Rogue", "Cleric")
+
+    def test_config_adds_class(self, registry_config):
+        """Classes from a config file should be creatable with their growth"""
+        write_config(registry_config, {
+            "Paladin": {"strength": 14, "magic": 12, "health": 120,
+                        "growth": {"strength": 6, "magic": 4, "health": 8}}})
+        REGISTRY.use_config(registry_config)
+        assert calculate_stats("Paladin", 3) == (26, 20, 136)
+        char = create_character("Knight", "Paladin")
+        assert char is not None and char["health"] == 120
+        columns = calculate_stats_batch(["Paladin", "Mage"], [3, 2], use_numpy=False)
+        assert list(zip(*columns)) == [(26, 20, 136), calculate_stats("Mage", 2)]
+
+    def test_config_reloads_on_change(self, registry_config):
+        """Changing the config file should be picked up on the next lookup"""
+        write_config(registry_config, {"Bard": {"strength": 9, "magic": 9, "health": 90}})
+        REGISTRY.use_config(registry_config)
+        assert calculate_stats("Bard", 1) == (9, 9, 90)
+
+        write_config(registry_config, {"Bard": {"strength": 11, "magic": 9, "health": 90}})
+        stat = os.stat(registry_config)
+        os.utime(registry_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        REGISTRY._next_check = 0.0
+        assert calculate_stats("Bard", 1) == (11, 9, 90)
+
+    def test_bad_config(self, tmp_path):
+        """A malformed class definition should raise ValueError"""
+        path = str(tmp_path / "bad.json")
+        write_config(path, {"Broken": {"strength": 1}})
+        with pytest.raises(ValueError):
+            ClassRegistry(path)
+
+    def test_toml_config(self, tmp_path):
+        """TOML configs should load the same way as JSON"""
+        pytest.importorskip("tomllib")
+        path = str(tmp_path / "classes.toml")
+        with open(path, "w") as f:
+            f.write('[classes.Monk]\nstrength = 12\nmagic = 12\nhealth = 95\ngrowth = 4\n')
+        registry = ClassRegistry(path)
+        assert registry.table()["Monk"] == (12, 12, 95, 4, 4, 4)
+
+    def test_register(self):
+        """Classes registered in code should join the table"""
+        registry = ClassRegistry()
+        registry.register("Ranger", (13, 9, 95), growth=(6, 3, 5))
+        assert registry.is_valid("Ranger")
+        assert registry.table()["Ranger"] == (13, 9, 95, 6, 3, 5)
@@ -0,0 +1,64 @@
+import pytest
+from character import CharacterTable
+from export import export_roster, import_roster
+from generator import iter_generated
+from project1_starter import create_character
+from roster import iter_characters
+from roster_cli import main
+
+
+def awkward_roster():
+    chars = list(iter_generated(40, seed=6))
+    chars[0]["name"] = 'Quote "Q", Comma'
+    chars[1]["name"] = "Multi\nLine"
+    chars[2]["name"] = "  Zoë  "
+    chars[3]["gold"] = -5
+    chars.append(create_character("", "Mage"))
+    return chars
+
+
+class TestExport:
+    """Test CSV and JSON Lines export/import"""
+
+    @pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+    def test_round_trip(self, tmp_path, suffix):
+        """Exported rosters should import back unchanged"""
+        chars = awkward_roster()
+        path = str(tmp_path / f"roster{suffix}")
+        assert export_roster(path, chars, batch_size=7) == len(chars)
+        assert import_roster(path, batch_size=5) == chars
+        assert all(type(c["level"]) is int for c in import_roster(path))
+
+    def test_table_fast_path(self, tmp_path):
+        """A CharacterTable should export the same rows as the dictionaries"""
+        chars = list(iter_generated(30, seed=3))
+        table = CharacterTable(chars)
+        export_roster(str(tmp_path / "a.csv"), table, batch_size=4)
+        export_roster(str(tmp_path / "b.csv"), chars)
+        assert (tmp_path / "a.csv").read_text() == (tmp_path / "b.csv").read_text()
+        assert import_roster(str(tmp_path / "a.csv"), table=True).to_dicts() == chars
+
+    def test_bad_rows_are_reported(self, tmp_path):
+        """Bad integers and short rows should name the row"""
+        path = tmp_path / "bad.csv"
+        path.write_text("name,class,level,strength,magic,health,gold\n"
+                        "A,Mage,1,7,20,90,100\n"
+                        "B,Mage,one,7,20,90,100\n")
+        with pytest.raises(ValueError, match="row 3: level"):
+            import_roster(str(path))
+        path.write_text("name,class,level,strength,magic,health,gold\nA,Mage,1\n")
+        with pytest.raises(ValueError, match="row 2"):
+            import_roster(str(path))
+        path.write_text("who,what\n")
+        with pytest.raises(ValueError, match="header"):
+            import_roster(str(path))
+
+    def test_cli_convert(self, tmp_path):
+        """convert should read and write .csv"""
+        chars = list(iter_generated(10, seed=5))
+        path = str(tmp_path / "roster.csv")
+        export_roster(path, chars)
+        assert main(["convert", path, str(tmp_path / "roster.txt")]) == 0
+        assert list(iter_characters(str(tmp_path / "roster.txt"))) == chars
+        assert main(["convert", str(tmp_path / "roster.txt"), str(tmp_path / "again.csv")]) == 0
+        assert import_roster(str(tmp_path / "again.csv")) == chars
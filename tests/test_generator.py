@@ -0,0 +1,57 @@
+import pytest
+import generator
+from generator import generate_parallel, generate_to_roster, iter_generated
+from project1_starter import calculate_stats
+from roster import iter_characters
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Use tiny blocks so multi-block behavior is cheap to test"""
+    monkeypatch.setattr(generator, "BLOCK_SIZE", 7)
+
+
+class TestGenerator:
+    """Test the seeded character generator"""
+
+    def test_same_seed_same_roster(self):
+        """The same seed should always give the same characters"""
+        assert list(iter_generated(50, seed=3)) == list(iter_generated(50, seed=3))
+        assert list(iter_generated(50, seed=3)) != list(iter_generated(50, seed=4))
+
+    def test_characters_are_consistent(self):
+        """Stats should follow calculate_stats and names should be unique"""
+        chars = list(iter_generated(200, seed=1, levels="geometric", max_level=30))
+        assert len({c["name"] for c in chars}) == 200
+        for c in chars:
+            assert 1 <= c["level"] <= 30
+            assert (c["strength"], c["magic"], c["health"]) == calculate_stats(c["class"], c["level"])
+
+    def test_worker_split_matches_single_stream(self, small_blocks):
+        """Splitting by worker should cover exactly the same characters"""
+        whole = list(iter_generated(30, seed=9, levels="normal"))
+        parts = []
+        for worker in range(3):
+            parts += list(iter_generated(30, seed=9, levels="normal", worker=worker, workers=3))
+        assert len(whole) == 30
+        assert sorted(parts, key=lambda c: c["name"]) == sorted(whole, key=lambda c: c["name"])
+
+    def test_parallel_shards(self, tmp_path):
+        """Shards from a pool should hold the single-process roster"""
+        # block_size is passed to the workers, so this holds under spawn too
+        paths = generate_parallel(str(tmp_path), 30, seed=2, workers=2, block_size=7)
+        assert len(paths) == 2
+        sharded = [c for path in paths for c in iter_characters(path)]
+        whole = list(iter_generated(30, seed=2, block_size=7))
+        assert sorted(sharded, key=lambda c: c["name"]) == sorted(whole, key=lambda c: c["name"])
+
+    def test_stream_to_roster(self, tmp_path):
+        """generate_to_roster should write every generated character"""
+        path = str(tmp_path / "roster.txt")
+        assert generate_to_roster(path, 25, seed=5, classes=["Mage"]) == 25
+        assert list(iter_characters(path)) == list(iter_generated(25, seed=5, classes=["Mage"]))
+
+    def test_bad_distribution(self):
+        """Unknown level distributions should raise ValueError"""
+        with pytest.raises(ValueError):
+            list(iter_generated(5, levels="bimodal"))
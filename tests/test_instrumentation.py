@@ -0,0 +1,76 @@
+import io
+import instrumentation
+import load_cache
+import project1_starter
+from project1_starter import create_character
+
+
+class TestInstrumentation:
+    """Test the opt-in hot path instrumentation"""
+
+    def test_disabled_by_default(self):
+        """Nothing should be wrapped until enable() is called"""
+        assert not instrumentation.is_enabled()
+        assert not hasattr(project1_starter.load_character, "__wrapped_original__")
+
+    def test_counts_calls_and_bytes(self, tmp_path):
+        """Calls, latencies and file bytes should be recorded"""
+        filename = str(tmp_path / "hero.txt")
+        instrumentation.reset()
+        with instrumentation.instrumented():
+            char = project1_starter.create_character("Metered", "Mage")
+            project1_starter.level_up(char, levels=3)
+            project1_starter.save_character(char, filename)
+            # modules that imported load_character by name are covered too
+            load_cache.LoadCache().load(filename)
+            project1_starter.load_character(str(tmp_path / "missing.txt"))
+        data = instrumentation.snapshot()
+        size = len(project1_starter.format_character(char).encode())
+        assert data["save_character"]["calls"] == 1
+        assert data["save_character"]["bytes"] == size
+        assert data["load_character"]["calls"] == 2
+        assert data["load_character"]["bytes"] == size
+        assert data["level_up"]["calls"] == 1
+        assert data["calculate_stats"]["calls"] == 2
+        assert data["calculate_stats"]["histogram"]["+Inf"] == 2
+
+    def test_disable_restores_originals(self):
+        """disable() should put the original functions back everywhere"""
+        original = project1_starter.load_character
+        instrumentation.enable()
+        assert project1_starter.load_character is not original
+        assert load_cache.load_character is project1_starter.load_character
+        instrumentation.disable()
+        assert project1_starter.load_character is original
+        assert load_cache.load_character is original
+
+    def test_errors_are_counted(self, tmp_path):
+        """A call that raises should be counted as an error"""
+        bad = str(tmp_path / "bad.txt")
+        with open(bad, "w") as f:
+            f.write("Character Name: X\n")
+        instrumentation.reset()
+        with instrumentation.instrumented():
+            try:
+                project1_starter.load_character(bad)
+            except KeyError:
+                pass
+        assert instrumentation.snapshot()["load_character"]["errors"] == 1
+
+    def test_prometheus_text(self):
+        """The export should contain counters and a histogram per function"""
+        instrumentation.reset()
+        with instrumentation.instrumented():
+            project1_starter.calculate_stats("Rogue", 2)
+        text = instrumentation.prometheus_text()
+        assert 'character_calls_total{function="calculate_stats"} 1' in text
+        assert 'character_seconds_bucket{function="calculate_stats",le="+Inf"} 1' in text
+        assert "# TYPE character_seconds histogram" in text
+
+    def test_profile(self):
+        """profile() should print cProfile stats for the block"""
+        out = io.StringIO()
+        with instrumentation.profile(stream=out, limit=5):
+            for _ in range(10):
+                create_character("Profiled", "Cleric")
+        assert "create_character" in out.getvalue()
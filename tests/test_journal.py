@@ -0,0 +1,104 @@
+import os
+from journal import Journal, journal_path, load_journaled
+from project1_starter import create_character, load_character, save_character
+
+
+class TestJournal:
+    """Test journaled character saves"""
+
+    def test_level_ups_only_append(self, tmp_path, capsys):
+        """Level-ups and gold changes should go to the journal, not the snapshot"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Often", "Rogue")
+        journal = Journal(filename, compact_every=100)
+        journal.save(char)
+        snapshot = open(filename).read()
+        for _ in range(5):
+            journal.level_up(char)
+        journal.add_gold(char, -30)
+        assert open(filename).read() == snapshot
+        with open(journal_path(filename)) as file:
+            lines = file.read().splitlines()
+        assert len(lines) == 6 and lines[-1] == "gold=70"
+        assert load_journaled(filename) == char
+
+    def test_compaction(self, tmp_path, capsys):
+        """Reaching compact_every should fold the journal into the snapshot"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Busy", "Mage")
+        journal = Journal(filename, compact_every=3)
+        journal.save(char)
+        for _ in range(3):
+            journal.level_up(char)
+        assert not os.path.exists(journal_path(filename))
+        assert load_character(filename) == char
+        journal.add_gold(char, 5)
+        journal.compact()
+        assert load_character(filename) == char
+        assert journal.compactions == 3
+
+    def test_replay_is_idempotent_and_skips_torn_lines(self, tmp_path, capsys):
+        """A stale journal or a half-written line should not corrupt the load"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Crash", "Cleric")
+        journal = Journal(filename)
+        journal.save(char)
+        journal.level_up(char, 2)
+        journal.add_gold(char, 10)
+        # simulate a crash after the snapshot was rewritten but before the journal was removed
+        save_character(char, filename)
+        with open(journal_path(filename), "a") as file:
+            file.write("gold=9")
+            file.write("99 lev")
+        assert load_journaled(filename) == char
+
+    def test_name_change_rewrites_snapshot(self, tmp_path, capsys):
+        """Fields that are not journaled should trigger a full snapshot"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Old", "Warrior")
+        journal = Journal(filename)
+        journal.save(char)
+        journal.add_gold(char, 1)
+        char["name"] = "New"
+        journal.save(char)
+        assert not os.path.exists(journal_path(filename))
+        assert load_character(filename)["name"] == "New"
+
+    def test_crash_before_journal_removal_on_class_change(self, tmp_path, monkeypatch):
+        """A journal left behind by a class change must not undo the new stats"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Hero", "Warrior")
+        journal = Journal(filename)
+        journal.save(char)
+        journal.add_gold(char, 240)
+        monkeypatch.setattr("journal.os.remove", lambda path: None)
+        char["class"] = "Mage"
+        char["gold"] = 500
+        journal.save(char)
+        assert os.path.exists(journal_path(filename))
+        assert load_journaled(filename) == char
+
+    def test_reopen_continues_journal(self, tmp_path, capsys):
+        """A new Journal on an existing file should pick up where it left off"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Again", "Mage")
+        Journal(filename).save(char)
+        Journal(filename).level_up(char)
+        again = Journal(filename)
+        assert again.load() == char
+        again.add_gold(char, 1)
+        assert load_journaled(filename) == char
+
+    def test_torn_line_that_parses_is_ignored(self, tmp_path, capsys):
+        """A cut-off line like "gold=1" (from "gold=1000") must not be applied"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Torn", "Rogue")
+        journal = Journal(filename)
+        journal.save(char)
+        journal.add_gold(char, 240)
+        with open(journal_path(filename), "a") as file:
+            file.write("gold=1")
+        assert load_journaled(filename)["gold"] == 340
+        again = Journal(filename)
+        again.add_gold(char, 5)
+        assert load_journaled(filename)["gold"] == 345
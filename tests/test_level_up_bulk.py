@@ -0,0 +1,60 @@
+import pytest
+from project1_starter import calculate_stats, create_character, level_up, level_up_many
+
+
+def one_at_a_time(char, count):
+    for _ in range(count):
+        level_up(char)
+
+
+class TestMultiLevelUp:
+    """Test level_up with several levels and level_up_many"""
+
+    def test_multi_level_matches_repeated(self, capsys):
+        """level_up(levels=n) should match n single level ups"""
+        fast = create_character("Fast", "Cleric")
+        slow = create_character("Slow", "Cleric")
+        assert level_up(fast, levels=1000) == 1000
+        one_at_a_time(slow, 1000)
+        slow["name"] = "Fast"
+        assert fast == slow
+        capsys.readouterr()
+
+    def test_multi_level_prints_once(self, capsys):
+        """A multi-level gain should print a single notification"""
+        char = create_character("Loud", "Mage")
+        level_up(char, levels=50)
+        out = capsys.readouterr().out
+        assert out.count("has leveled up") == 1
+        assert "Level 51" in out
+
+    def test_level_cap(self, capsys):
+        """Levels should clamp to the cap and stop there"""
+        char = create_character("Capped", "Rogue")
+        assert level_up(char, levels=100, cap=10) == 9
+        assert char["level"] == 10
+        assert (char["strength"], char["magic"], char["health"]) == calculate_stats("Rogue", 10)
+        assert level_up(char, cap=10) == 0
+        assert char["level"] == 10
+        assert capsys.readouterr().out.count("has leveled up") == 1
+
+    def test_negative_levels(self):
+        """Negative level gains should be rejected"""
+        with pytest.raises(ValueError):
+            level_up(create_character("Bad", "Mage"), levels=-1)
+
+    def test_level_up_many(self, capsys):
+        """level_up_many should handle per-character amounts and the cap"""
+        chars = [create_character(f"H{i}", "Warrior") for i in range(3)]
+        assert level_up_many(chars, [0, 5, 50], cap=20) == 2
+        assert [c["level"] for c in chars] == [1, 6, 20]
+        assert capsys.readouterr().out == ""
+
+        assert level_up_many(chars, 1, announce=True) == 3
+        out = capsys.readouterr().out
+        assert out.count("has leveled up") == 3
+
+    def test_level_up_many_length_mismatch(self):
+        """A levels sequence of the wrong length should raise ValueError"""
+        with pytest.raises(ValueError):
+            level_up_many([create_character("H", "Mage")], [1, 2])
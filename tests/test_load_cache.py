@@ -0,0 +1,81 @@
+import os
+import pytest
+from load_cache import LoadCache
+from project1_starter import create_character, level_up, save_character
+
+
+def saved_hero(tmp_path, name="Cached", class_name="Mage"):
+    char = create_character(name, class_name)
+    filename = str(tmp_path / f"{name}.txt")
+    save_character(char, filename)
+    return char, filename
+
+
+class TestLoadCache:
+    """Test the LRU cache in front of load_character"""
+
+    def test_hit_after_miss(self, tmp_path):
+        """The second load of an unchanged file should be a hit"""
+        char, filename = saved_hero(tmp_path)
+        cache = LoadCache()
+        assert cache.load(filename) == char
+        assert cache.load(filename) == char
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_rewrite_invalidates(self, tmp_path):
+        """Saving the file again should invalidate the cached copy"""
+        char, filename = saved_hero(tmp_path)
+        cache = LoadCache()
+        cache.load(filename)
+        level_up(char)
+        level_up(char)
+        save_character(char, filename)
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.load(filename)["level"] == 3
+        assert cache.stats()["invalidations"] == 1
+
+    def test_copies_are_defensive(self, tmp_path):
+        """Changing a returned character should not change the cache"""
+        _, filename = saved_hero(tmp_path)
+        cache = LoadCache()
+        cache.load(filename)["gold"] = 0
+        assert cache.load(filename)["gold"] == 100
+
+    def test_read_only_views(self, tmp_path):
+        """copies=False should hand out read-only views"""
+        _, filename = saved_hero(tmp_path)
+        view = LoadCache(copies=False).load(filename)
+        with pytest.raises(TypeError):
+            view["gold"] = 0
+
+    def test_lru_eviction(self, tmp_path):
+        """The least recently used entry should be evicted first"""
+        files = [saved_hero(tmp_path, f"H{i}")[1] for i in range(3)]
+        cache = LoadCache(max_entries=2)
+        cache.load(files[0])
+        cache.load(files[1])
+        cache.load(files[0])
+        cache.load(files[2])
+        assert cache.stats()["evictions"] == 1
+        cache.load(files[0])
+        assert cache.stats()["hits"] == 2
+
+    def test_memory_limit(self, tmp_path):
+        """max_bytes should bound how much the cache holds"""
+        files = [saved_hero(tmp_path, f"H{i}")[1] for i in range(5)]
+        cache = LoadCache(max_bytes=1)
+        for filename in files:
+            cache.load(filename)
+        assert len(cache) == 0
+        assert cache.stats()["evictions"] == 5
+
+    def test_missing_file(self, tmp_path):
+        """Missing files should return None like load_character"""
+        char, filename = saved_hero(tmp_path)
+        cache = LoadCache()
+        cache.load(filename)
+        os.remove(filename)
+        assert cache.load(filename) is None
+        assert len(cache) == 0
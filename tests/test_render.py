@@ -0,0 +1,65 @@
+import io
+import json
+import pytest
+from project1_starter import create_character, display_character
+from render import render_characters, render_to_string
+
+
+def roster():
+    return [create_character("Ann", "Mage"), create_character("Bartholomew", "Warrior"),
+            create_character("李小龙", "Cleric")]
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def write(self, text):
+        self.calls += 1
+        return super().write(text)
+
+
+class TestRender:
+    """Test batched character sheet rendering"""
+
+    def test_plain_matches_display_character(self, capsys):
+        """Plain output should be byte-for-byte what display_character prints"""
+        chars = roster()
+        for char in chars:
+            display_character(char)
+        expected = capsys.readouterr().out
+        assert render_to_string(chars) == expected
+
+    def test_display_character_output_unchanged(self, capsys):
+        """display_character should still print the original sheet"""
+        display_character(create_character("Ann", "Mage"))
+        assert capsys.readouterr().out == (
+            "\n=== CHARACTER SHEET ===\nName: Ann\nClass: Mage\nLevel: 1\n"
+            "Strength: 7\nMagic: 20\nHealth: 90\nGold: 100\n\n\n")
+
+    def test_one_write_per_batch(self):
+        """Each batch should be written with a single call"""
+        stream = CountingStream()
+        chars = roster() * 4
+        assert render_characters(chars, stream, batch_size=5) == 12
+        assert stream.calls == 3
+
+    def test_table_alignment(self):
+        """Table rows should line up under a single header"""
+        lines = render_to_string(roster() * 2, style="table", batch_size=10).splitlines()
+        assert lines[0].split() == ["Name", "Class", "Level", "Strength", "Magic", "Health", "Gold"]
+        assert len(lines) == 7
+        column = lines[0].index("Class")
+        assert [line[column:].split()[0] for line in lines[1:4]] == ["Mage", "Warrior", "Cleric"]
+
+    def test_jsonl(self):
+        """JSON lines should round-trip to the character dictionaries"""
+        chars = roster()
+        text = render_to_string(chars, style="jsonl")
+        assert [json.loads(line) for line in text.splitlines()] == chars
+
+    def test_bad_style(self):
+        """Unknown styles should raise ValueError"""
+        with pytest.raises(ValueError):
+            render_characters(roster(), io.StringIO(), style="html")
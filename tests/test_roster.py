@@ -0,0 +1,55 @@
+import pytest
+from project1_starter import create_character, level_up, save_character
+from roster import append_characters, iter_characters
+
+
+def make_roster(count):
+    classes = ["Warrior", "Mage", "Rogue", "Cleric"]
+    chars = [create_character(f"Hero{i}", classes[i % 4]) for i in range(count)]
+    for i, char in enumerate(chars):
+        for _ in range(i % 3):
+            level_up(char)
+    return chars
+
+
+class TestRosterFiles:
+    """Test multi-character roster files"""
+
+    def test_append_and_iterate(self, tmp_path):
+        """Characters appended to a roster should iterate back in order"""
+        path = str(tmp_path / "roster.txt")
+        chars = make_roster(10)
+        assert append_characters(path, iter(chars), batch_size=3) == 10
+        assert list(iter_characters(path)) == chars
+
+    def test_append_twice(self, tmp_path):
+        """A second append should add records after the first ones"""
+        path = str(tmp_path / "roster.txt")
+        chars = make_roster(4)
+        append_characters(path, chars[:2])
+        append_characters(path, chars[2:])
+        assert list(iter_characters(path)) == chars
+
+    def test_single_save_file_is_a_roster(self, tmp_path):
+        """A save_character file should read as a one-record roster"""
+        path = str(tmp_path / "single.txt")
+        char = create_character("Solo", "Cleric")
+        save_character(char, path)
+        assert list(iter_characters(path)) == [char]
+
+        # appending after a single save keeps both records
+        other = create_character("Duo", "Rogue")
+        append_characters(path, [other])
+        assert list(iter_characters(path)) == [char, other]
+
+    def test_iter_is_lazy(self, tmp_path):
+        """iter_characters should return a generator"""
+        path = str(tmp_path / "roster.txt")
+        append_characters(path, make_roster(3))
+        records = iter_characters(path)
+        assert next(records)["name"] == "Hero0"
+
+    def test_missing_roster(self, tmp_path):
+        """Iterating a missing roster should raise FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            list(iter_characters(str(tmp_path / "missing.txt")))
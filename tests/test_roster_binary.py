@@ -0,0 +1,112 @@
+import pytest
+from project1_starter import create_character, level_up, save_character
+from roster import append_characters, iter_characters
+from roster_binary import (
+    HEADER,
+    RECORD,
+    BinaryRoster,
+    BinaryRosterError,
+    binary_to_text,
+    text_to_binary,
+    write_binary_roster,
+)
+
+
+def make_roster():
+    chars = [
+        create_character("Hero", "Warrior"),
+        create_character("李小龙", "Mage"),
+        create_character("O'Connor", "Rogue"),
+        create_character("Cleric Hero", "Cleric"),
+    ]
+    level_up(chars[1])
+    return chars
+
+
+class TestBinaryRoster:
+    """Test the memory-mapped binary roster format"""
+
+    def test_write_and_read(self, tmp_path):
+        """Every record should read back identical to what was written"""
+        path = str(tmp_path / "roster.bin")
+        chars = make_roster()
+        assert write_binary_roster(path, chars) == 4
+        with BinaryRoster(path) as roster:
+            assert len(roster) == 4
+            assert list(roster) == chars
+            assert roster[-1] == chars[-1]
+            assert roster.name(1) == "李小龙"
+            assert roster.classes == ["Warrior", "Mage", "Rogue", "Cleric"]
+
+    def test_index_out_of_range(self, tmp_path):
+        """Reading past the end should raise IndexError"""
+        path = str(tmp_path / "roster.bin")
+        write_binary_roster(path, make_roster())
+        with BinaryRoster(path) as roster:
+            with pytest.raises(IndexError):
+                roster[4]
+
+    def test_rejects_text_file(self, tmp_path):
+        """Opening a text save file as binary should raise ValueError"""
+        path = str(tmp_path / "hero.txt")
+        save_character(create_character("Hero", "Mage"), path)
+        with pytest.raises(ValueError):
+            BinaryRoster(path)
+
+    def test_corrupt_class_table(self, tmp_path):
+        """A truncated or garbled class table should raise BinaryRosterError"""
+        path = str(tmp_path / "roster.bin")
+        write_binary_roster(path, make_roster())
+        with open(path, "rb") as f:
+            data = f.read()
+        classes_offset = HEADER.unpack_from(data)[4]
+        with open(path, "wb") as f:
+            f.write(data[:classes_offset + 3])
+        with pytest.raises(BinaryRosterError, match="roster.bin"):
+            BinaryRoster(path)
+        garbled = bytearray(data)
+        garbled[classes_offset:classes_offset + 4] = b"\x02\x00\xff\xfe"
+        with open(path, "wb") as f:
+            f.write(garbled)
+        with pytest.raises(BinaryRosterError, match="class table"):
+            BinaryRoster(path)
+
+    def test_corrupt_header_and_records(self, tmp_path):
+        """A wrong record count or out-of-range record should raise BinaryRosterError"""
+        path = str(tmp_path / "roster.bin")
+        write_binary_roster(path, make_roster())
+        with open(path, "rb") as f:
+            data = f.read()
+        fields = list(HEADER.unpack_from(data))
+        fields[3] = 100
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(*fields) + data[HEADER.size:])
+        with pytest.raises(BinaryRosterError, match="corrupt header"):
+            BinaryRoster(path)
+
+        garbled = bytearray(data)
+        first = list(RECORD.unpack_from(data, HEADER.size))
+        second = list(RECORD.unpack_from(data, HEADER.size + RECORD.size))
+        first[2] = 9        # class code past the class table
+        second[0] = 10**6   # name offset past the heap
+        RECORD.pack_into(garbled, HEADER.size, *first)
+        RECORD.pack_into(garbled, HEADER.size + RECORD.size, *second)
+        with open(path, "wb") as f:
+            f.write(garbled)
+        with BinaryRoster(path) as roster:
+            with pytest.raises(BinaryRosterError, match="record 0"):
+                roster[0]
+            with pytest.raises(BinaryRosterError, match="record 1"):
+                roster.name(1)
+            assert roster[2] == make_roster()[2]
+
+    def test_convert_round_trip(self, tmp_path):
+        """text -> binary -> text should keep every character"""
+        chars = make_roster()
+        text_path = str(tmp_path / "roster.txt")
+        binary_path = str(tmp_path / "roster.bin")
+        back_path = str(tmp_path / "back.txt")
+        append_characters(text_path, chars)
+        assert text_to_binary(text_path, binary_path) == 4
+        assert binary_to_text(binary_path, back_path) == 4
+        assert list(iter_characters(back_path)) == chars
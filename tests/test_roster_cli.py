@@ -0,0 +1,130 @@
+import io
+import json
+import pytest
+from project1_starter import create_character, level_up, load_character
+from roster import iter_characters
+from roster_cli import main
+
+
+def run(argv, stdin="", monkeypatch=None):
+    if monkeypatch is not None:
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    out = io.StringIO()
+    code = main(argv, out)
+    return code, out.getvalue()
+
+
+def as_lines(chars):
+    return "".join(json.dumps(c) + "\n" for c in chars)
+
+
+class TestRosterCli:
+    """Test the scripted roster commands"""
+
+    def test_create_from_stdin(self, monkeypatch):
+        """create should turn name/class lines into characters"""
+        code, out = run(["create"], '{"name": "A", "class": "Mage"}\n', monkeypatch)
+        assert code == 0
+        assert [json.loads(l) for l in out.splitlines()] == [create_character("A", "Mage")]
+
+    def test_create_reports_bad_lines(self, monkeypatch, capsys):
+        """Invalid classes and bad JSON should be skipped with exit code 1"""
+        stdin = '{"name": "A", "class": "Bard"}\nnot json\n{"name": "B", "class": "Rogue"}\n'
+        code, out = run(["create"], stdin, monkeypatch)
+        assert code == 1
+        assert len(out.splitlines()) == 1
+        err = capsys.readouterr().err
+        assert "-:1: invalid class" in err and "-:2:" in err
+
+    def test_create_rejects_non_string_fields(self, monkeypatch, capsys):
+        """A missing name or a non-string class should be reported, not created"""
+        stdin = '{"class": ["x"]}\n{"class": "Mage"}\n{"name": "C", "class": "Mage"}\n'
+        code, out = run(["create"], stdin, monkeypatch)
+        assert code == 1
+        assert [json.loads(l)["name"] for l in out.splitlines()] == ["C"]
+        err = capsys.readouterr().err
+        assert "-:1: name and class must be strings" in err and "-:2:" in err
+
+    def test_level_up(self, monkeypatch):
+        """level-up should apply levels and the cap"""
+        char = create_character("A", "Warrior")
+        code, out = run(["level-up", "--levels", "9", "--cap", "5"], as_lines([char]), monkeypatch)
+        for _ in range(4):
+            level_up(char)
+        assert json.loads(out) == char
+
+    def test_level_up_rejects_negative_levels(self, monkeypatch, capsys):
+        """--levels below zero should be a usage error"""
+        with pytest.raises(SystemExit) as exit:
+            run(["level-up", "--levels", "-2"], "", monkeypatch)
+        assert exit.value.code == 2
+        assert "must not be negative" in capsys.readouterr().err
+
+    def test_level_up_rejects_bad_fields(self, monkeypatch, capsys):
+        """Non-string names/classes and boolean stats should be reported"""
+        good = create_character("A", "Mage")
+        bad_class = dict(good, **{"class": ["x"]})
+        bad_level = dict(good, level=True)
+        code, out = run(["level-up"], as_lines([bad_class, bad_level, good]), monkeypatch)
+        assert code == 1
+        assert [json.loads(l)["name"] for l in out.splitlines()] == ["A"]
+        err = capsys.readouterr().err
+        assert "-:1: name and class must be strings" in err
+        assert "-:2: stats must be whole numbers" in err
+
+    def test_save_and_load(self, tmp_path, monkeypatch):
+        """save then load should round-trip through roster and directory"""
+        chars = [create_character("A", "Mage"), create_character("B b", "Cleric")]
+        roster = str(tmp_path / "roster.txt")
+        assert run(["save", "--roster", roster], as_lines(chars), monkeypatch)[0] == 0
+        assert list(iter_characters(roster)) == chars
+
+        directory = str(tmp_path / "heroes")
+        assert run(["save", "--dir", directory], as_lines(chars), monkeypatch)[0] == 0
+        assert load_character(str(tmp_path / "heroes" / "B_b.txt")) == chars[1]
+
+        code, out = run(["load", roster, "--workers", "1"])
+        assert [json.loads(l) for l in out.splitlines()] == chars
+        code, out = run(["load", directory, "--workers", "1"])
+        assert sorted(json.loads(l)["name"] for l in out.splitlines()) == ["A", "B b"]
+
+    def test_save_dir_keeps_colliding_names_apart(self, tmp_path, monkeypatch):
+        """Names that clean up to the same file name should not overwrite each other"""
+        chars = [create_character("A B", "Mage"), create_character("A_B", "Rogue"),
+                 create_character("A B", "Cleric")]
+        directory = str(tmp_path / "heroes")
+        assert run(["save", "--dir", directory], as_lines(chars), monkeypatch)[0] == 0
+        assert load_character(str(tmp_path / "heroes" / "A_B.txt")) == chars[2]
+        assert load_character(str(tmp_path / "heroes" / "A_B-2.txt")) == chars[1]
+
+    def test_convert_and_show(self, tmp_path, monkeypatch):
+        """convert should go through binary and back; show should render"""
+        chars = [create_character("A", "Rogue")]
+        source = str(tmp_path / "in.jsonl")
+        with open(source, "w") as f:
+            f.write(as_lines(chars))
+        binary = str(tmp_path / "out.bin")
+        assert run(["convert", source, binary])[0] == 0
+        code, out = run(["convert", binary, "-"])
+        assert json.loads(out) == chars[0]
+        code, out = run(["show", "--style", "table"], as_lines(chars), monkeypatch)
+        assert out.splitlines()[1].split()[:2] == ["A", "Rogue"]
+
+    def test_stats(self, monkeypatch):
+        """stats should summarise each class"""
+        chars = [create_character("A", "Mage"), create_character("B", "Mage")]
+        code, out = run(["stats"], as_lines(chars), monkeypatch)
+        mage, everyone = [json.loads(l) for l in out.splitlines()]
+        assert mage["class"] == "Mage" and mage["count"] == 2
+        assert mage["level"]["mean"] == 1 and mage["gold"]["sum"] == 200
+        assert everyone["class"] == "*" and everyone["count"] == 2
+
+    def test_convert_reports_unreadable_source(self, tmp_path, capsys):
+        """A missing or broken source should be an error, not a traceback"""
+        missing = str(tmp_path / "missing.txt")
+        assert run(["convert", missing, str(tmp_path / "out.jsonl")])[0] == 1
+        assert "missing.txt" in capsys.readouterr().err
+        bogus = tmp_path / "bogus.bin"
+        bogus.write_bytes(b"not a binary roster")
+        assert run(["convert", str(bogus), "-"])[0] == 1
+        assert "bogus.bin" in capsys.readouterr().err
@@ -0,0 +1,109 @@
+from project1_starter import create_character, level_up, save_character
+from roster import append_characters
+from roster_index import RosterIndex
+
+
+def make_hero(name, class_name, level):
+    char = create_character(name, class_name)
+    for _ in range(level - 1):
+        level_up(char)
+    return char
+
+
+class TestRosterIndex:
+    """Test the name/class/level roster index"""
+
+    def test_index_follows_save_character(self, tmp_path):
+        """Attached indexes should pick up every save_character call"""
+        index = RosterIndex()
+        index.attach()
+        try:
+            hero = make_hero("Hero", "Cleric", 3)
+            filename = str(tmp_path / "hero.txt")
+            save_character(hero, filename)
+            assert index.find("Hero") == (filename, 0)
+            level_up(hero)
+            save_character(hero, filename)
+        finally:
+            index.detach()
+        assert len(index) == 1
+        assert index.load("Hero") == hero
+        assert index.names(min_level=4) == ["Hero"]
+        assert index.names(max_level=3) == []
+
+    def test_roster_offsets(self, tmp_path):
+        """Records inside a roster file should load by offset"""
+        path = str(tmp_path / "roster.txt")
+        heroes = [make_hero(f"Hero{i}", "Mage", i + 1) for i in range(5)]
+        append_characters(path, heroes)
+        index = RosterIndex()
+        assert index.add_file(path) == 5
+        assert index.find("Hero0") == (path, 0)
+        assert index.load("Hero3") == heroes[3]
+        assert index.load("Nobody") is None
+
+    def test_class_and_level_queries(self, tmp_path):
+        """Class and level filters should combine"""
+        path = str(tmp_path / "roster.txt")
+        heroes = [make_hero(f"C{i}", "Cleric", 38 + i) for i in range(5)]
+        heroes += [make_hero(f"W{i}", "Warrior", 40 + i) for i in range(3)]
+        append_characters(path, heroes)
+        index = RosterIndex()
+        index.add_file(path)
+        assert index.names("Cleric", min_level=41) == ["C3", "C4"]
+        assert index.names("Warrior") == ["W0", "W1", "W2"]
+        assert index.names(min_level=41, max_level=41) == ["C3", "W1"]
+        assert [c["name"] for c in index.query("Cleric", 40, 40)] == ["C2"]
+        assert index.names("Rogue", min_level=1) == []
+
+    def test_persistence(self, tmp_path):
+        """A saved index should reopen with the same entries"""
+        index_path = str(tmp_path / "roster.idx")
+        path = str(tmp_path / "hero.txt")
+        save_character(make_hero("Hero", "Rogue", 2), path)
+        index = RosterIndex(index_path)
+        index.add_file(path)
+        index.save()
+        reopened = RosterIndex(index_path)
+        assert reopened.find("Hero") == (path, 0)
+        assert reopened.names("Rogue", min_level=2) == ["Hero"]
+        assert reopened.remove("Hero")
+        assert reopened.names() == []
+
+    def test_overwritten_file_drops_old_hero(self, tmp_path):
+        """Saving a different hero over a file should unindex the old one"""
+        filename = str(tmp_path / "slot.txt")
+        index = RosterIndex()
+        index.attach()
+        try:
+            save_character(make_hero("Old", "Mage", 1), filename)
+            save_character(make_hero("New", "Mage", 1), filename)
+        finally:
+            index.detach()
+        assert "Old" not in index
+        assert index.names("Mage") == ["New"]
+
+    def test_attached_index_saves_on_detach(self, tmp_path):
+        """By default an attached index is written once, when it detaches"""
+        index_path = str(tmp_path / "roster.idx")
+        index = RosterIndex(index_path)
+        index.attach()
+        try:
+            save_character(make_hero("Hero", "Rogue", 2), str(tmp_path / "hero.txt"))
+            assert len(RosterIndex(index_path)) == 0
+        finally:
+            index.detach()
+        assert RosterIndex(index_path).names("Rogue") == ["Hero"]
+
+    def test_batched_saves_flush_on_detach(self, tmp_path):
+        """With save_every, the file is written in batches and on detach"""
+        index_path = str(tmp_path / "roster.idx")
+        index = RosterIndex(index_path)
+        index.attach(save_every=3)
+        try:
+            for i in range(4):
+                save_character(make_hero(f"Hero{i}", "Mage", 1), str(tmp_path / f"{i}.txt"))
+            assert len(RosterIndex(index_path)) == 3
+        finally:
+            index.detach()
+        assert len(RosterIndex(index_path)) == 4
@@ -0,0 +1,74 @@
+import pytest
+from project1_starter import create_character, format_character, load_character
+from save_format import MissingFieldError, SaveFormatError, parse_character, read_character
+
+GOOD = format_character(create_character("Parser", "Rogue"))
+
+
+class TestParseCharacter:
+    """Test the strict and lenient save file parser"""
+
+    def test_both_modes_parse_saved_text(self):
+        """A file written by save_character should parse in both modes"""
+        expected = create_character("Parser", "Rogue")
+        assert parse_character(GOOD) == expected
+        assert parse_character(GOOD, strict=False) == expected
+
+    def test_strict_keeps_colons_in_values(self):
+        """Strict mode should keep a name containing ': '"""
+        text = GOOD.replace("Parser", "Sir: Parser")
+        assert parse_character(text)["name"] == "Sir: Parser"
+        # lenient mode drops that line, as load_character always has
+        with pytest.raises(KeyError):
+            parse_character(text, strict=False)
+
+    def test_missing_field_error(self):
+        """Missing labels should be named in the error"""
+        text = GOOD.replace("Gold: 100\n", "")
+        with pytest.raises(MissingFieldError, match="Gold"):
+            parse_character(text, source="hero.txt")
+
+    def test_bad_integer(self):
+        """A non-number stat should raise SaveFormatError naming the label"""
+        text = GOOD.replace("Level: 1", "Level: one")
+        with pytest.raises(SaveFormatError, match="Level"):
+            parse_character(text)
+        with pytest.raises(ValueError):
+            parse_character(text, strict=False)
+
+    def test_strict_rejects_stray_lines(self):
+        """Unknown, duplicate and unlabeled lines are errors in strict mode"""
+        for extra in ["Type: Striker\n", "Gold: 5\n", "just some text\n"]:
+            with pytest.raises(SaveFormatError, match="line 8"):
+                parse_character(GOOD + extra)
+            parse_character(GOOD + extra, strict=False)
+
+    def test_read_character(self, tmp_path):
+        """read_character should match load_character for a good file"""
+        filename = str(tmp_path / "hero.txt")
+        with open(filename, "w") as f:
+            f.write(GOOD)
+        assert read_character(filename) == load_character(filename)
+        with pytest.raises(FileNotFoundError):
+            read_character(str(tmp_path / "missing.txt"))
+
+    def test_lenient_matches_original_rules(self):
+        """Lenient mode should agree with the original line-by-line parser"""
+        def original(text):
+            data = {}
+            for line in text.splitlines(True):
+                parts = line.strip().split(": ")
+                if len(parts) == 2:
+                    data[parts[0]] = parts[1]
+            return data["Character Name"], data["Class"]
+
+        for name in ["Bob ", " Bob", "A: B", "x:", "José"]:
+            text = GOOD.replace("Parser", name)
+            try:
+                expected = original(text)
+            except KeyError:
+                with pytest.raises(KeyError):
+                    parse_character(text, strict=False)
+                continue
+            char = parse_character(text, strict=False)
+            assert (char["name"], char["class"]) == expected
@@ -0,0 +1,117 @@
+import os
+import time
+import pytest
+from project1_starter import create_character, level_up, load_character, save_character
+from bulk_load import scan_files
+from save_manager import SaveManager, atomic_write_text
+
+
+class TestSaveManager:
+    """Test write-behind saving"""
+
+    def test_saves_are_coalesced(self, tmp_path, capsys):
+        """Many saves of one file should produce a single write"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Busy", "Warrior")
+        manager = SaveManager(flush_interval=60, max_dirty=100)
+        for _ in range(20):
+            level_up(char)
+            assert manager.save(char, filename) == True
+        assert not os.path.exists(filename)
+        assert manager.flush() == 1
+        assert manager.coalesced == 19
+        assert load_character(filename) == char
+        manager.close()
+
+    def test_unchanged_content_is_skipped(self, tmp_path):
+        """Flushing the same content twice should only write once"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Same", "Mage")
+        manager = SaveManager(flush_interval=60)
+        manager.save(char, filename)
+        manager.flush()
+        mtime = os.stat(filename).st_mtime_ns
+        manager.save(char, filename)
+        assert manager.flush() == 0
+        assert manager.skipped == 1
+        assert os.stat(filename).st_mtime_ns == mtime
+        manager.close()
+
+    def test_size_threshold_flushes(self, tmp_path):
+        """Reaching max_dirty files should flush automatically"""
+        manager = SaveManager(flush_interval=60, max_dirty=3)
+        for i in range(3):
+            manager.save(create_character(f"H{i}", "Rogue"), str(tmp_path / f"h{i}.txt"))
+        assert manager.dirty_count() == 0
+        assert all(os.path.exists(tmp_path / f"h{i}.txt") for i in range(3))
+        manager.close()
+
+    def test_interval_flush(self, tmp_path):
+        """The background thread should flush on its interval"""
+        filename = str(tmp_path / "hero.txt")
+        with SaveManager(flush_interval=0.05) as manager:
+            manager.save(create_character("Timed", "Cleric"), filename)
+            deadline = time.time() + 2
+            while not os.path.exists(filename) and time.time() < deadline:
+                time.sleep(0.01)
+            assert os.path.exists(filename)
+
+    def test_failed_write_stays_dirty(self, tmp_path):
+        """A write that fails should be reported and retried later"""
+        manager = SaveManager(flush_interval=60)
+        assert manager.save(create_character("X", "Mage"), "") == False
+        bad = "/invalid/directory/path/hero.txt"
+        manager.save(create_character("X", "Mage"), bad)
+        assert manager.flush() == 0
+        assert bad in manager.errors
+        assert manager.dirty_count() == 1
+
+    def test_atomic_write_leaves_no_temp_files(self, tmp_path):
+        """atomic_write_text should only leave the target behind"""
+        filename = str(tmp_path / "out.txt")
+        atomic_write_text(filename, "hello\n")
+        assert os.listdir(tmp_path) == ["out.txt"]
+        with open(filename) as f:
+            assert f.read() == "hello\n"
+
+    def test_external_changes_are_rewritten(self, tmp_path):
+        """A deleted or externally rewritten file should not be skipped"""
+        filename = str(tmp_path / "hero.txt")
+        char = create_character("Watched", "Rogue")
+        manager = SaveManager(flush_interval=60)
+        manager.save(char, filename)
+        assert manager.flush() == 1
+        os.remove(filename)
+        manager.save(char, filename)
+        assert manager.flush() == 1
+        assert load_character(filename) == char
+        with open(filename, "w") as file:
+            file.write("tampered\n")
+        manager.save(char, filename)
+        assert manager.flush() == 1
+        assert load_character(filename) == char
+        manager.close()
+
+    def test_atomic_write_keeps_permissions(self, tmp_path, capsys):
+        """Atomic writes should not turn a 0644 save into an owner-only file"""
+        filename = str(tmp_path / "hero.txt")
+        save_character(create_character("Shared", "Mage"), filename)
+        os.chmod(filename, 0o644)
+        atomic_write_text(filename, "hello\n")
+        assert os.stat(filename).st_mode & 0o777 == 0o644
+        fresh = str(tmp_path / "new.txt")
+        atomic_write_text(fresh, "hello\n")
+        umask = os.umask(0)
+        os.umask(umask)
+        assert os.stat(fresh).st_mode & 0o777 == 0o666 & ~umask
+
+    def test_leftover_temp_file_is_not_a_save(self, tmp_path, monkeypatch):
+        """A temp file left behind by a crash should not look like a save file"""
+        def crash(src, dst):
+            raise OSError("crashed before rename")
+        monkeypatch.setattr("save_manager.os.replace", crash)
+        monkeypatch.setattr("save_manager.os.remove", lambda path: None)
+        with pytest.raises(OSError):
+            atomic_write_text(str(tmp_path / "hero.txt"), "hello\n")
+        assert len(os.listdir(tmp_path)) == 1
+        assert list(scan_files(str(tmp_path))) == []
@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+import shard_store
+from project1_starter import create_character, create_characters, level_up
+from shard_store import ShardedStore, shard_of
+
+
+def save_heroes(args):
+    directory, writer, count = args
+    store = ShardedStore(directory)
+    for i in range(count):
+        store.save(create_character(f"W{writer}-{i}", "Rogue"))
+    return count
+
+
+def open_store(args):
+    directory, shards = args
+    try:
+        return ShardedStore(directory, shards).shards
+    except ValueError:
+        return None
+
+
+class TestShardedStore:
+    """Test the hash-sharded roster store"""
+
+    def test_save_and_load(self, tmp_path, capsys):
+        """The newest save of a hero should be the one loaded"""
+        store = ShardedStore(str(tmp_path), shards=4)
+        char = create_character("Hero", "Mage")
+        store.save(char)
+        level_up(char, 3)
+        store.save(char)
+        assert store.load("Hero") == char
+        assert store.load("Nobody") is None
+        assert "Hero" in store and len(store) == 1
+
+    def test_names_hash_to_fixed_shards(self, tmp_path):
+        """Records should land in the segment their name hashes to"""
+        store = ShardedStore(str(tmp_path), shards=4)
+        chars = create_characters([f"H{i}" for i in range(40)], ["Warrior"] * 40)
+        assert store.save_many(chars) == 40
+        for char in chars:
+            segment = tmp_path / f"segment-{shard_of(char['name'], 4):02d}.txt"
+            assert f"Character Name: {char['name']}\n" in segment.read_text()
+        assert sorted(store, key=lambda c: c["name"]) == sorted(chars, key=lambda c: c["name"])
+
+    def test_shard_count_is_fixed(self, tmp_path):
+        """Reopening with a different shard count should fail"""
+        ShardedStore(str(tmp_path), shards=4)
+        assert ShardedStore(str(tmp_path)).shards == 4
+        with pytest.raises(ValueError):
+            ShardedStore(str(tmp_path), shards=8)
+
+    def test_compaction_and_other_instances(self, tmp_path, monkeypatch, capsys):
+        """Compaction should drop stale records and other stores should follow"""
+        monkeypatch.setattr(shard_store, "COMPACT_MIN_RECORDS", 10)
+        monkeypatch.setattr(shard_store, "CHECK_EVERY", 1)
+        writer = ShardedStore(str(tmp_path), shards=1)
+        reader = ShardedStore(str(tmp_path))
+        char = create_character("Busy", "Cleric")
+        writer.save(char)
+        assert reader.load("Busy") == char
+        for _ in range(25):
+            level_up(char)
+            writer.save(char)
+        segment = (tmp_path / "segment-00.txt").read_text()
+        assert segment.count("Character Name:") < 12
+        assert reader.load("Busy") == char
+
+    def test_concurrent_writers(self, tmp_path):
+        """Many processes saving at once should not lose or corrupt records"""
+        directory = str(tmp_path)
+        ShardedStore(directory, shards=2)
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            total = sum(pool.map(save_heroes, [(directory, w, 50) for w in range(4)]))
+        store = ShardedStore(directory)
+        assert len(store) == total == 200
+        assert store.load("W3-49") == create_character("W3-49", "Rogue")
+
+    def test_rejects_names_that_cannot_round_trip(self, tmp_path):
+        """Names that break the roster format should be refused up front"""
+        store = ShardedStore(str(tmp_path), shards=1)
+        store.save(create_character("Good", "Mage"))
+        for name in ("Sir: Bad", "Two\nLines", " padded", ""):
+            with pytest.raises(ValueError):
+                store.save(create_character(name, "Mage"))
+        with pytest.raises(ValueError):
+            store.save_many([create_character("Fine", "Mage"), create_character("a: b", "Mage")])
+        assert store.load("Good") == create_character("Good", "Mage")
+        assert store.names() == ["Good"]
+
+    def test_bad_records_are_skipped(self, tmp_path, capsys):
+        """A torn or malformed record should not break loads from its shard"""
+        store = ShardedStore(str(tmp_path), shards=1)
+        good = create_character("Good", "Mage")
+        store.save(good)
+        with open(tmp_path / "segment-00.txt", "a") as file:
+            file.write("Character Name: Broken\nClass: Rogue\nLevel: x\n\n"
+                       "Character Name: Torn\nClass: Ma")
+        later = create_character("Later", "Cleric")
+        with pytest.warns(UserWarning):
+            store.save(later)
+            assert store.load("Good") == good
+        assert store.load("Later") == later
+        assert sorted(store.names()) == ["Good", "Later"]
+        assert len(store.bad_records()) == 2
+
+    def test_concurrent_first_opens_agree(self, tmp_path):
+        """Processes creating the store at once should all get one shard count"""
+        directory = str(tmp_path / "store")
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            counts = list(pool.map(open_store, [(directory, n) for n in (2, 4, 8, 16) * 2]))
+        stored = ShardedStore(directory).shards
+        assert set(counts) <= {stored, None}
+        assert counts.count(stored) == 2
+
+    def test_short_writes_are_completed(self, tmp_path, monkeypatch):
+        """An append should keep writing until every byte is on disk"""
+        real_write = os.write
+        monkeypatch.setattr(shard_store.os, "write", lambda fd, data: real_write(fd, data[:10]))
+        store = ShardedStore(str(tmp_path), shards=1)
+        chars = create_characters(["A", "B", "C"], ["Mage", "Rogue", "Cleric"])
+        store.save_many(chars)
+        assert sorted(store, key=lambda c: c["name"]) == chars
@@ -0,0 +1,16 @@
+from benchmarks.bench_startup import LAZY_MODULES, eager_modules
+
+
+class TestStartup:
+    """Test that optional features load lazily"""
+
+    def test_no_optional_modules_at_import(self):
+        """Importing project1_starter should not pull in optional backends"""
+        assert eager_modules() == [], f"should be lazy: {LAZY_MODULES}"
+
+    def test_parser_still_works_after_lazy_import(self):
+        """The lazily compiled save format pattern should still match"""
+        from project1_starter import create_character, format_character
+        from save_format import parse_character
+        char = create_character("Lazy", "Rogue")
+        assert parse_character(format_character(char)) == char
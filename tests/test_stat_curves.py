@@ -0,0 +1,47 @@
+from class_registry import ClassRegistry
+from project1_starter import calculate_stats
+from stat_curves import StatCurves, cached_calculate_stats
+
+
+class TestStatCurves:
+    """Test the precomputed stat curves"""
+
+    def test_matches_calculate_stats(self):
+        """Curves should agree with calculate_stats inside and beyond max_level"""
+        curves = StatCurves(max_level=20)
+        for class_name in ("Warrior", "Mage", "Rogue", "Cleric", "Nobody", ""):
+            for level in range(0, 30):
+                assert curves.get(class_name, level) == calculate_stats(class_name, level)
+        assert cached_calculate_stats("Mage", 7) == calculate_stats("Mage", 7)
+
+    def test_unknown_classes_share_the_fallback(self):
+        """Unknown class names should use (10, 10, 100) without growing the cache"""
+        curves = StatCurves(max_level=10)
+        for i in range(100):
+            assert curves.get(f"Stranger{i}", 1) == (10, 10, 100)
+        assert curves.stats()["curves"] == 1
+
+    def test_counters(self):
+        """Lookups that build a curve or go past max_level should count as misses"""
+        curves = StatCurves(max_level=10)
+        for level in (1, 5, 10, 11, 50):
+            curves.get("Rogue", level)
+        stats = curves.stats()
+        assert (stats["hits"], stats["misses"], stats["builds"]) == (2, 3, 1)
+        assert stats["hit_rate"] == 0.4
+
+        cold = StatCurves()
+        for class_name in ("Warrior", "Mage", "Nobody", "Stranger"):
+            cold.get(class_name, 1)
+        assert (cold.hits, cold.misses, cold.builds) == (1, 3, 3)
+
+    def test_rebuilt_when_classes_change(self):
+        """Registering or changing a class should drop the old curves"""
+        registry = ClassRegistry()
+        curves = StatCurves(registry=registry)
+        assert curves.get("Paladin", 2) == (15, 15, 105)
+        registry.register("Paladin", (14, 12, 120), growth=6)
+        assert curves.get("Paladin", 2) == (20, 18, 126)
+        registry.register("Warrior", (1, 1, 1))
+        assert curves.get("Warrior", 1) == (1, 1, 1)
+        assert curves.stats()["invalidations"] == 2
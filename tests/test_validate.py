@@ -0,0 +1,92 @@
+import json
+import pytest
+from project1_starter import calculate_stats, create_character, level_up, load_character, save_character
+from roster_cli import main
+from validate import check_file, validate_directory
+
+
+def write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.fixture
+def saves(tmp_path, capsys):
+    """A directory with one file of every kind"""
+    directory = tmp_path / "saves"
+    directory.mkdir()
+    hero = create_character("Good", "Mage")
+    level_up(hero, 4)
+    save_character(hero, str(directory / "good.txt"))
+    write(directory / "missing.txt", "Character Name: NoGold\nClass: Rogue\nLevel: 3\n"
+                                     "Strength: 22\nMagic: 20\nHealth: 120\n")
+    write(directory / "badint.txt", "Character Name: Bad\nClass: Warrior\nLevel: ten\n"
+                                    "Strength: 30\nMagic: 23\nHealth: 85\nGold: 100\n")
+    write(directory / "drift.txt", "Character Name: Drift\nClass: Cleric\nLevel: 2\n"
+                                   "Strength: 99\nMagic: 26\nHealth: 105\nGold: 7\n")
+    write(directory / "noclass.txt", "Character Name: Who\nLevel: 2\n")
+    (directory / "binary.txt").write_bytes(b"\xff\xfe\x00")
+    capsys.readouterr()
+    return directory
+
+
+class TestValidate:
+    """Test batch validation and repair of save files"""
+
+    def test_classifies_every_file(self, saves):
+        """Each kind of problem should get its own status"""
+        report = validate_directory(str(saves), workers=1, chunk_size=2)
+        statuses = {p["file"].rsplit("/", 1)[-1]: p["status"] for p in report.problems}
+        assert statuses == {
+            "missing.txt": "missing-fields",
+            "noclass.txt": "missing-fields",
+            "badint.txt": "bad-integer",
+            "drift.txt": "stats-inconsistent",
+            "binary.txt": "unreadable",
+        }
+        assert report.counts["valid"] == 1 and report.total == 6
+
+    def test_repairs(self, saves, tmp_path):
+        """Repaired copies should load and be consistent, originals untouched"""
+        original = (saves / "drift.txt").read_text()
+        fixed = tmp_path / "fixed"
+        report = validate_directory(str(saves), repair_dir=str(fixed), workers=1)
+        assert report.repaired == 3
+        assert (saves / "drift.txt").read_text() == original
+        drift = load_character(str(fixed / "drift.txt"))
+        assert (drift["strength"], drift["magic"], drift["health"]) == calculate_stats("Cleric", 2)
+        assert drift["gold"] == 7
+        assert load_character(str(fixed / "missing.txt"))["gold"] == 100
+        # level worked out from the stats that fit a Warrior
+        assert load_character(str(fixed / "badint.txt"))["level"] == 4
+        assert not (fixed / "noclass.txt").exists()
+        for name in ("drift.txt", "missing.txt", "badint.txt"):
+            assert check_file(str(fixed / name))["status"] == "valid"
+
+    def test_failed_repair_write_is_reported(self, saves, tmp_path):
+        """A repair that cannot be written should be noted, not stop the run"""
+        fixed = tmp_path / "fixed"
+        (fixed / "drift.txt").mkdir(parents=True)
+        report = validate_directory(str(saves), repair_dir=str(fixed), workers=2)
+        assert report.repaired == 2 and report.total == 6
+        drift = [p for p in report.problems if p["file"].endswith("drift.txt")][0]
+        assert drift["repaired"] is None
+        assert "could not write repair" in drift["message"]
+
+    def test_repair_dir_must_differ(self, saves):
+        """Repairing in place would overwrite the originals"""
+        with pytest.raises(ValueError):
+            validate_directory(str(saves), repair_dir=str(saves))
+
+    def test_process_pool_matches(self, saves):
+        """The pooled run should report the same as the in-process one"""
+        assert validate_directory(str(saves), workers=2).to_dict()["counts"] == \
+            validate_directory(str(saves), workers=1).to_dict()["counts"]
+
+    def test_cli_report(self, saves, tmp_path, capsys):
+        """validate should write a JSON report and exit 1 when files are broken"""
+        report_path = tmp_path / "report.json"
+        assert main(["validate", str(saves), "--workers", "1", "--report", str(report_path)]) == 1
+        report = json.loads(report_path.read_text())
+        assert report["counts"]["stats-inconsistent"] == 1
+        assert "5 of 6 files have problems" in capsys.readouterr().err
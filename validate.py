@@ -0,0 +1,206 @@
+"""
+Parallel validation and repair of a directory of save files.
+
+Every file gets one status:
+
+    valid               loads, and its stats match calculate_stats
+    missing-fields      a label is missing (load_character raises KeyError)
+    bad-integer         a number does not parse (load_character raises ValueError)
+    stats-inconsistent  loads, but strength/magic/health are not what
+                        calculate_stats gives for its class and level
+    unreadable          the file could not be read or is not UTF-8
+
+Files are checked in chunks across a process pool (bulk_load.map_chunks),
+so one bad file never stops the run. Valid files take the same fast path
+load_character does; only broken ones pay for a closer look.
+
+With repair_dir, a repaired copy of every fixable file is written there
+under the same name; the originals are never touched. Repairs:
+
+    - strength, magic and health are recomputed from class and level
+    - a missing or bad level is worked out from any stat that fits the
+      class, otherwise 1
+    - a missing or bad gold becomes 100, a missing name the file's name
+    - a file with no class cannot be repaired
+
+The report is a ValidationReport; to_dict()/write_json() give the
+machine-readable form.
+"""
+
+import functools
+import json
+import os
+
+from bulk_load import CHUNK_SIZE, map_chunks, scan_files
+from class_registry import DEFAULT_ROW, REGISTRY
+from project1_starter import calculate_stats, format_character
+from save_format import MissingFieldError, SaveFormatError, parse_character
+
+STATUSES = ("valid", "missing-fields", "bad-integer", "stats-inconsistent", "unreadable")
+
+
+def _lenient_values(text):
+    """label -> value the way load_character reads them."""
+    values = {}
+    for line in text.split("\n"):
+        parts = line.strip().split(": ")
+        if len(parts) == 2:
+            values[parts[0]] = parts[1]
+    return values
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _infer_level(class_name, values):
+    """Returns the level the stats in values point to, or None."""
+    row = REGISTRY.table().get(class_name, DEFAULT_ROW)
+    for index, label in enumerate(("Strength", "Magic", "Health")):
+        stat = _int_or_none(values.get(label))
+        base, growth = row[index], row[index + 3]
+        if stat is None or growth <= 0:
+            continue
+        bonus, remainder = divmod(stat - base, growth)
+        if remainder == 0 and bonus >= 0:
+            return bonus + 1
+    return None
+
+
+def repair(values, filename):
+    """
+    Returns a repaired character from label -> value text, or None if the
+    file has no class to repair from.
+    """
+    class_name = values.get("Class")
+    if class_name is None:
+        return None
+    level = _int_or_none(values.get("Level"))
+    if level is None:
+        level = _infer_level(class_name, values) or 1
+    gold = _int_or_none(values.get("Gold"))
+    strength, magic, health = calculate_stats(class_name, level)
+    name = values.get("Character Name")
+    if name is None:
+        name = os.path.splitext(os.path.basename(filename))[0]
+    return {
+        "name": name,
+        "class": class_name,
+        "level": level,
+        "strength": strength,
+        "magic": magic,
+        "health": health,
+        "gold": 100 if gold is None else gold
+    }
+
+
+def check_file(filename, repair_dir=None):
+    """
+    Validates one file. Returns {"file", "status", "message", "repaired"}
+    where repaired is the path of the repaired copy or None.
+    """
+    result = {"file": filename, "status": "valid", "message": None, "repaired": None}
+    try:
+        with open(filename, "rb") as file:
+            text = file.read().decode("utf-8")
+    except (OSError, UnicodeDecodeError) as error:
+        result["status"] = "unreadable"
+        result["message"] = f"{type(error).__name__}: {error}"
+        return result
+
+    try:
+        character = parse_character(text, strict=False, source=filename)
+    except MissingFieldError as error:
+        result["status"] = "missing-fields"
+        result["message"] = str(error)
+    except SaveFormatError as error:
+        result["status"] = "bad-integer"
+        result["message"] = str(error)
+    else:
+        expected = calculate_stats(character["class"], character["level"])
+        if (character["strength"], character["magic"], character["health"]) == expected:
+            return result
+        result["status"] = "stats-inconsistent"
+        result["message"] = (f"{filename}: stats {character['strength']}/{character['magic']}/"
+                             f"{character['health']} but level {character['level']} "
+                             f"{character['class']} has {expected[0]}/{expected[1]}/{expected[2]}")
+
+    if repair_dir is not None:
+        fixed = repair(_lenient_values(text), filename)
+        if fixed is not None:
+            path = os.path.join(repair_dir, os.path.basename(filename))
+            try:
+                with open(path, "w") as file:
+                    file.write(format_character(fixed))
+            except OSError as error:
+                # like a bad file, a failed repair must not stop the run
+                result["message"] += f"; could not write repair: {type(error).__name__}: {error}"
+            else:
+                result["repaired"] = path
+    return result
+
+
+def _check_chunk(filenames, repair_dir=None):
+    return [check_file(filename, repair_dir) for filename in filenames]
+
+
+#ValidationReport class
+class ValidationReport:
+    """Counts per status plus the result of every file that was not valid."""
+
+    def __init__(self):
+        self.counts = dict.fromkeys(STATUSES, 0)
+        self.problems = []
+        self.repaired = 0
+
+    def add(self, result):
+        self.counts[result["status"]] += 1
+        if result["status"] != "valid":
+            self.problems.append(result)
+        if result["repaired"] is not None:
+            self.repaired += 1
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def to_dict(self):
+        return {
+            "total": self.total,
+            "counts": dict(self.counts),
+            "repaired": self.repaired,
+            "problems": self.problems,
+        }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+            file.write("\n")
+
+
+#validate_files function
+def validate_files(filenames, repair_dir=None, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Checks every file and returns a ValidationReport.
+    workers=None uses one process per CPU, workers=1 runs in this process.
+    """
+    if repair_dir is not None:
+        os.makedirs(repair_dir, exist_ok=True)
+    report = ValidationReport()
+    task = functools.partial(_check_chunk, repair_dir=repair_dir)
+    for results in map_chunks(task, filenames, workers, chunk_size):
+        for result in results:
+            report.add(result)
+    return report
+
+
+#validate_directory function
+def validate_directory(path, repair_dir=None, workers=None, chunk_size=CHUNK_SIZE,
+                       suffix=".txt"):
+    """Validates every file in path ending with suffix. Returns a ValidationReport."""
+    if repair_dir is not None and os.path.abspath(repair_dir) == os.path.abspath(path):
+        raise ValueError("repair_dir must not be the directory being validated")
+    return validate_files(scan_files(path, suffix), repair_dir, workers, chunk_size)